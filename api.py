@@ -0,0 +1,196 @@
+import argparse
+import hashlib
+import os
+import threading
+
+import tornado.ioloop
+import tornado.web
+
+import dados
+import exportacao
+
+
+# ------------------ Estado compartilhado ------------------
+
+class Repositorio:
+    # Mantém o DataFrame e as respostas já serializadas para a versão atual do CSV
+
+    def __init__(self, file_path=None):
+        self.file_path = file_path or dados.caminho_csv()
+        self._lock = threading.Lock()
+        self._assinatura = None
+        self._versao = None
+        self._data = None
+        self._respostas = {}
+
+    def _atualizar(self):
+        # Só recalcula o hash quando o CSV ou o arquivo de vistorias mudam (tamanho ou data de modificação)
+        assinatura = tuple((stat.st_size, stat.st_mtime_ns) for stat in map(os.stat, self._arquivos()))
+        if assinatura == self._assinatura:
+            return
+
+        versao = dados.versao_plantio(self.file_path)
+        if versao != self._versao:
+            self._data = dados.read_plantio(self.file_path)
+            self._versao = versao
+            self._respostas = {}
+        self._assinatura = assinatura
+
+    def _arquivos(self):
+        vistorias = dados.caminho_vistorias()
+        return [self.file_path, vistorias] if os.path.exists(vistorias) else [self.file_path]
+
+    def versao(self):
+        with self._lock:
+            self._atualizar()
+            return self._versao
+
+    def dados(self):
+        with self._lock:
+            self._atualizar()
+            return self._versao, self._data
+
+    def resposta(self, recurso, formato, gerar):
+        # Serializa cada recurso uma única vez por versão dos dados
+        with self._lock:
+            self._atualizar()
+            chave = (recurso, formato)
+            if chave not in self._respostas:
+                tabela = gerar(self._data)
+                corpo = serializar(tabela, formato)
+                etag = '"%s"' % hashlib.sha1(self._versao.encode() + b'/' + corpo).hexdigest()[:20]
+                self._respostas[chave] = (etag, corpo)
+            return self._versao, self._respostas[chave]
+
+
+def serializar(tabela, formato):
+    if formato == 'csv':
+        return tabela.to_csv().encode('utf-8')
+    return tabela.to_json(orient='table', force_ascii=False).encode('utf-8')
+
+
+TIPOS = {
+    'json': 'application/json; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+# ------------------ Recursos ------------------
+
+RECURSOS = {
+    'divisoes': dados.division_summary,
+    'uso-do-solo': dados.land_use,
+    'aproveitamento': lambda data: dados.aproveitamento_counts(data).rename('PRFs').to_frame(),
+}
+
+
+class BaseHandler(tornado.web.RequestHandler):
+
+    def initialize(self, repositorio):
+        self.repositorio = repositorio
+
+    def enviar(self, recurso, formato, gerar):
+        if formato not in TIPOS:
+            raise tornado.web.HTTPError(404)
+
+        versao, (etag, corpo) = self.repositorio.resposta(recurso, formato, gerar)
+        self._etag = etag
+        self.set_header('Content-Type', TIPOS[formato])
+        self.set_header('Cache-Control', 'no-cache')
+        self.set_header('X-Versao-Dados', versao)
+        self.write(corpo)
+
+    def compute_etag(self):
+        # ETag pré-calculada na serialização; o Tornado responde 304 quando If-None-Match confere
+        return getattr(self, '_etag', None)
+
+
+class VersaoHandler(BaseHandler):
+
+    def get(self):
+        self.write({'versao': self.repositorio.versao()})
+
+
+class RecursoHandler(BaseHandler):
+
+    def get(self, recurso, formato):
+        if recurso not in RECURSOS:
+            raise tornado.web.HTTPError(404)
+        self.enviar(recurso, formato or 'json', RECURSOS[recurso])
+
+
+class ProjetosHandler(BaseHandler):
+
+    def get(self, formato):
+        self.enviar('projetos', formato or 'json', dados.project_summary)
+
+
+class ProjetoHandler(BaseHandler):
+
+    def get(self, projeto, formato):
+        # O Tornado já entrega o argumento do caminho decodificado (um '+' no nome continua '+')
+        def gerar(data):
+            if projeto not in dados.projetos(data):
+                raise tornado.web.HTTPError(404)
+            return dados.tabela_prf(data, projeto).set_index('DESCRIÇÃO DO PRF')
+
+        self.enviar('projeto/' + projeto, formato or 'json', gerar)
+
+
+class ExportacaoHandler(BaseHandler):
+    # Exportação em blocos: cada bloco é enviado ao cliente assim que é serializado
+
+    FORMATOS = {extensao: (nome, mime) for nome, (extensao, mime) in exportacao.FORMATOS.items()}
+
+    async def get(self, tabela, extensao):
+        if extensao not in self.FORMATOS:
+            raise tornado.web.HTTPError(404)
+        formato, mime = self.FORMATOS[extensao]
+
+        versao, data = self.repositorio.dados()
+
+        # Filtros opcionais por divisão e projeto
+        for coluna, argumento in (('DIVISÃO', 'divisao'), ('PROJETO', 'projeto')):
+            valor = self.get_argument(argumento, None)
+            if valor is not None:
+                data = data[data[coluna] == valor]
+
+        if tabela == 'linhas':
+            frame = data
+        elif tabela == 'projetos':
+            frame = dados.project_summary(data)
+        elif tabela in RECURSOS:
+            frame = RECURSOS[tabela](data)
+        else:
+            raise tornado.web.HTTPError(404)
+
+        self.set_header('Content-Type', mime)
+        self.set_header('Content-Disposition', f'attachment; filename="plantio_{tabela}_{versao}.{extensao}"')
+        self.set_header('X-Versao-Dados', versao)
+        for bloco in exportacao.iter_exportacao(exportacao.tabela_exportacao(frame), formato):
+            self.write(bloco)
+            await self.flush()
+
+
+def make_app(file_path=None):
+    repositorio = Repositorio(file_path)
+    args = dict(repositorio=repositorio)
+    return tornado.web.Application([
+        (r'/api/versao', VersaoHandler, args),
+        (r'/api/exportar/([\w-]+)\.(\w+)', ExportacaoHandler, args),
+        (r'/api/projetos(?:\.(\w+))?', ProjetosHandler, args),
+        (r'/api/projetos/([^/]+?)(?:\.(\w+))?', ProjetoHandler, args),
+        (r'/api/([\w-]+?)(?:\.(\w+))?', RecursoHandler, args),
+    ])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='API somente leitura com os agregados do Dashboard de Plantio')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--csv', default=None, help='Arquivo CSV (padrão: PLANTIO_CSV ou o CSV do repositório)')
+    args = parser.parse_args()
+
+    app = make_app(args.csv)
+    app.listen(args.port)
+    print(f'API do Dashboard de Plantio em http://localhost:{args.port}/api/')
+    tornado.ioloop.IOLoop.current().start()
@@ -0,0 +1,57 @@
+import re
+import unicodedata
+from bisect import bisect_left
+
+
+# Número máximo de PRFs sugeridos por busca
+LIMITE_SUGESTOES = 20
+
+# Início de cada palavra do nome e início da parte numérica dos códigos (VA84142 -> 84142)
+_INICIO_PALAVRA = re.compile(r'(?<![A-Z0-9])[A-Z0-9]|(?<=[A-Z])[0-9]')
+
+
+def normalizar(texto):
+    # Maiúsculas, sem acentos e com espaços simples: "eólico" encontra "EÓLICO"
+    texto = unicodedata.normalize('NFKD', str(texto))
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return ' '.join(texto.upper().split())
+
+
+class IndicePRF:
+    # Índice ordenado de prefixos sobre DESCRIÇÃO DO PRF. Cada nome entra uma vez para cada início
+    # de palavra, então "BLOCO SUL" e "84142" também encontram "UMARI - CE - BLOCO SUL" e "VA84142".
+    # Uma busca é uma busca binária na lista ordenada, sem percorrer o DataFrame.
+
+    def __init__(self, nomes):
+        self.nomes = list(nomes)
+        self.posicoes = {nome: i for i, nome in enumerate(self.nomes)}
+        self._normalizados = [normalizar(nome) for nome in self.nomes]
+
+        entradas = []
+        for i, normalizado in enumerate(self._normalizados):
+            for inicio in _INICIO_PALAVRA.finditer(normalizado):
+                entradas.append((normalizado[inicio.start():], i))
+        entradas.sort()
+
+        self.chaves = [chave for chave, _ in entradas]
+        self._linhas = [i for _, i in entradas]
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def buscar(self, texto, limite=LIMITE_SUGESTOES):
+        # Posições (no DataFrame indexado) dos PRFs com alguma palavra começando pelo texto;
+        # nomes que começam pelo texto vêm primeiro
+        prefixo = normalizar(texto)
+        if not prefixo:
+            return []
+
+        inicio = bisect_left(self.chaves, prefixo)
+        fim = bisect_left(self.chaves, prefixo + '\U0010ffff', lo=inicio)
+        encontrados = dict.fromkeys(self._linhas[inicio:fim])
+
+        ordem = sorted(encontrados, key=lambda i: (not self._normalizados[i].startswith(prefixo), self.nomes[i]))
+        return ordem[:limite]
+
+    def sugestoes(self, texto, limite=LIMITE_SUGESTOES):
+        return [self.nomes[i] for i in self.buscar(texto, limite)]
@@ -0,0 +1,242 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava entre processos, cada réplica pode gerar o mesmo artefato
+    fcntl = None
+
+
+# Diretório compartilhado entre as réplicas do app no mesmo host
+DIRETORIO_PADRAO = os.path.join(tempfile.gettempdir(), 'plantio_cache')
+
+# Tamanho máximo do cache em disco; ao passar do limite os artefatos menos usados são removidos
+TAMANHO_MAXIMO_MB = 512
+
+# A remoção varre o diretório inteiro: roda no máximo a cada INTERVALO_LIMPEZA segundos por processo, ou antes
+# disso se o que foi gravado desde a última passar de FRACAO_LIMPEZA do tamanho máximo
+INTERVALO_LIMPEZA = 30
+FRACAO_LIMPEZA = 0.1
+
+# Artefatos lidos ou gravados há menos de CARENCIA segundos não são removidos: quem acabou de receber o
+# caminho de um artefato (obter_arquivo) ainda vai abri-lo
+CARENCIA = 120
+
+
+def assinatura_codigo(*caminhos):
+    # Hash do código-fonte dos módulos que geram os artefatos: mudar o código invalida o cache
+    sha = hashlib.sha1()
+    for caminho in caminhos:
+        with open(caminho, 'rb') as f:
+            sha.update(f.read())
+    return sha.hexdigest()[:12]
+
+
+class CacheArtefatos:
+    # Cache endereçado por conteúdo: a chave é o hash de (versão dos dados, tipo, especificação)
+
+    def __init__(self, diretorio=None, tamanho_maximo_mb=None):
+        self.diretorio = diretorio or os.environ.get('PLANTIO_CACHE_DIR', DIRETORIO_PADRAO)
+        self.tamanho_maximo = int(tamanho_maximo_mb or os.environ.get('PLANTIO_CACHE_MAX_MB', TAMANHO_MAXIMO_MB)) * 1024 * 1024
+        os.makedirs(self.diretorio, exist_ok=True)
+        self._ultima_limpeza = 0.0
+        self._gravado = 0
+        self._trava_limpeza = threading.Lock()
+
+    def chave(self, versao, tipo, spec):
+        conteudo = json.dumps({'versao': versao, 'tipo': tipo, 'spec': spec}, sort_keys=True, default=str)
+        return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+
+    def caminho(self, chave):
+        return os.path.join(self.diretorio, chave[:2], chave)
+
+    def ler(self, chave):
+        caminho = self.caminho(chave)
+        try:
+            with open(caminho, 'rb') as f:
+                conteudo = f.read()
+        except FileNotFoundError:
+            return None
+
+        # Atualiza a data de modificação para a remoção por menos uso recente
+        try:
+            os.utime(caminho)
+        except OSError:
+            pass
+        return conteudo
+
+    def gravar(self, chave, conteudo):
+        def escrever(temporario):
+            with open(temporario, 'wb') as f:
+                f.write(conteudo)
+
+        self._substituir(chave, escrever)
+
+    def _substituir(self, chave, escrever):
+        # Grava em um arquivo temporário no mesmo diretório e renomeia: leitores nunca veem um arquivo parcial
+        caminho = self.caminho(chave)
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        fd, temporario = tempfile.mkstemp(dir=os.path.dirname(caminho), prefix='.tmp-')
+        os.close(fd)
+        try:
+            escrever(temporario)
+            tamanho = os.path.getsize(temporario)
+            os.replace(temporario, caminho)
+        except BaseException:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            raise
+        self._limpar_se_preciso(tamanho)
+
+    def _limpar_se_preciso(self, tamanho):
+        with self._trava_limpeza:
+            self._gravado += tamanho
+            agora = time.monotonic()
+            if agora - self._ultima_limpeza < INTERVALO_LIMPEZA and self._gravado < self.tamanho_maximo * FRACAO_LIMPEZA:
+                return
+            self._ultima_limpeza = agora
+            self._gravado = 0
+        self.remover_excesso()
+
+    @contextmanager
+    def _trava(self, chave):
+        # Trava por chave entre processos, para que só uma réplica gere cada artefato. Quem solta a trava remove
+        # o arquivo dela, então só há arquivos de trava dos artefatos sendo gerados; quem conseguiu a trava de um
+        # arquivo já removido (o inode não é mais o do caminho) tenta de novo com o arquivo atual.
+        if fcntl is None:
+            yield
+            return
+        caminho = self.caminho(chave) + '.lock'
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        while True:
+            f = open(caminho, 'w')
+            fcntl.flock(f, fcntl.LOCK_EX)
+            if _mesmo_arquivo(f, caminho):
+                break
+            f.close()
+        try:
+            yield
+        finally:
+            _remover(caminho)
+            # Fechar o arquivo solta a trava
+            f.close()
+
+    def obter(self, versao, tipo, spec, gerar):
+        # Lê o artefato do disco ou gera (uma única vez entre as réplicas) e grava
+        chave = self.chave(versao, tipo, spec)
+        conteudo = self.ler(chave)
+        if conteudo is not None:
+            return conteudo
+
+        with self._trava(chave):
+            conteudo = self.ler(chave)
+            if conteudo is None:
+                conteudo = gerar()
+                self.gravar(chave, conteudo)
+        return conteudo
+
+    def travar(self, chave):
+        # Trava da chave para quem gera o artefato fora do obter (por exemplo, em um pool de processos)
+        return self._trava(chave)
+
+    def obter_arquivo(self, versao, tipo, spec, escrever):
+        # Para artefatos grandes: escrever(caminho) grava o arquivo direto no disco, sem montá-lo em memória.
+        # Devolve o caminho do artefato no cache.
+        chave = self.chave(versao, tipo, spec)
+        caminho = self.caminho(chave)
+        if self._tocar(caminho):
+            return caminho
+
+        with self._trava(chave):
+            if not self._tocar(caminho):
+                self._substituir(chave, escrever)
+        return caminho
+
+    def _tocar(self, caminho):
+        # Atualiza a data de modificação (remoção por menos uso recente); False se o artefato não existe
+        try:
+            os.utime(caminho)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def obter_frame(self, versao, tipo, spec, gerar):
+        # DataFrames são guardados em Parquet
+        import pandas as pd
+
+        def gerar_parquet():
+            buffer = io.BytesIO()
+            gerar().to_parquet(buffer)
+            return buffer.getvalue()
+
+        return pd.read_parquet(io.BytesIO(self.obter(versao, tipo, spec, gerar_parquet)))
+
+    def remover_excesso(self):
+        # Remove os artefatos menos usados recentemente até o cache ficar abaixo de 90% do limite; os usados
+        # há menos de CARENCIA segundos ficam, mesmo que o cache continue acima do limite
+        arquivos = []
+        total = 0
+        limite_uso = time.time() - CARENCIA
+        for raiz, _, nomes in os.walk(self.diretorio):
+            for nome in nomes:
+                if nome.endswith('.lock'):
+                    self._remover_trava_livre(os.path.join(raiz, nome))
+                    continue
+                if nome.startswith('.tmp-'):
+                    continue
+                caminho = os.path.join(raiz, nome)
+                try:
+                    stat = os.stat(caminho)
+                except FileNotFoundError:
+                    continue
+                arquivos.append((stat.st_mtime, stat.st_size, caminho))
+                total += stat.st_size
+
+        if total <= self.tamanho_maximo:
+            return
+
+        for uso, tamanho, caminho in sorted(arquivos):
+            if total <= self.tamanho_maximo * 0.9 or uso >= limite_uso:
+                break
+            try:
+                os.remove(caminho)
+                total -= tamanho
+            except FileNotFoundError:
+                pass
+
+    def _remover_trava_livre(self, caminho):
+        # Arquivo de trava que ninguém segura (de um processo interrompido ou de versões anteriores, que não
+        # removiam a trava): é removido com a trava tomada, e quem esperava por ele tenta de novo no _trava
+        if fcntl is None:
+            return
+        try:
+            with open(caminho, 'a') as f:
+                try:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return
+                if _mesmo_arquivo(f, caminho):
+                    _remover(caminho)
+        except FileNotFoundError:
+            pass
+
+
+def _mesmo_arquivo(f, caminho):
+    # O arquivo aberto ainda é o que está no caminho (não foi removido nem substituído)
+    try:
+        return os.fstat(f.fileno()).st_ino == os.stat(caminho).st_ino
+    except FileNotFoundError:
+        return False
+
+
+def _remover(caminho):
+    try:
+        os.remove(caminho)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+
+# Curvas de crescimento (Chapman-Richards) da biomassa seca acima do solo: uma árvore chega a
+# biomassa_arvore (kg) ao longo de (1 - e^(-k·t))^c, e o povoamento não passa de teto_ha (t/ha).
+# raiz é a razão raiz/parte aérea (IPCC 2006, valores padrão por tipo de floresta).
+CURVAS = {
+    'Caatinga': {'k': 0.12, 'c': 2.0, 'biomassa_arvore': 60.0, 'teto_ha': 45.0, 'raiz': 0.40},
+    'Cerrado': {'k': 0.10, 'c': 2.2, 'biomassa_arvore': 80.0, 'teto_ha': 60.0, 'raiz': 0.50},
+    'Mata Atlântica': {'k': 0.15, 'c': 1.8, 'biomassa_arvore': 150.0, 'teto_ha': 150.0, 'raiz': 0.24},
+}
+CURVA_PADRAO = 'Caatinga'
+
+# Fração de carbono da biomassa seca (IPCC 2006) e conversão de carbono em CO₂ (44/12)
+FRACAO_CARBONO = 0.47
+CO2_POR_CARBONO = 44 / 12
+
+# Horizonte máximo da projeção (anos)
+HORIZONTE = 30
+
+
+def parametros(data, curvas=CURVA_PADRAO):
+    # Parâmetros da curva de cada PRF: um nome de curva para todos ou um dicionário PROJETO -> curva
+    # (projetos fora do dicionário usam a curva padrão). Devolve um vetor por parâmetro, um elemento por PRF.
+    if isinstance(curvas, str):
+        nomes = np.full(len(data), curvas, dtype=object)
+    else:
+        nomes = data['PROJETO'].map(curvas).fillna(CURVA_PADRAO).to_numpy(dtype=object)
+    codigos, unicos = pd.factorize(nomes)
+    return {parametro: np.array([CURVAS[nome][parametro] for nome in unicos])[codigos] for parametro in CURVAS[CURVA_PADRAO]}
+
+
+def projetar(data, curvas=CURVA_PADRAO, horizonte=HORIZONTE):
+    # Biomassa total (acima e abaixo do solo) e CO₂ capturado por PRF em cada ano, como matrizes PRFs x anos
+    # calculadas de uma vez. As árvores são as mudas vivas (QDE de Mudas x sobrevivência observada) e a
+    # biomassa final de cada PRF é limitada pelo teto por hectare da área plantada.
+    p = parametros(data, curvas)
+    anos = np.arange(1, horizonte + 1)
+    vivas = data['QDE de Mudas (UND)'].to_numpy(dtype=float) * (1 - data['Taxa de Mortalidade'].to_numpy(dtype=float))
+    final = np.minimum(vivas * p['biomassa_arvore'] / 1000, data['Plantio (ha)'].to_numpy(dtype=float) * p['teto_ha'])
+
+    crescimento = (1 - np.exp(-p['k'][:, None] * anos[None, :])) ** p['c'][:, None]
+    biomassa = np.nan_to_num(final * (1 + p['raiz']))[:, None] * crescimento
+    return {'anos': anos, 'biomassa': biomassa, 'co2': biomassa * FRACAO_CARBONO * CO2_POR_CARBONO}
+
+
+def por_grupo(data, matriz, anos, coluna):
+    # Soma das linhas da matriz (PRFs x anos) por DIVISÃO, PROJETO ou PRF, na ordem do arquivo
+    return pd.DataFrame(matriz, columns=pd.Index(anos, name='Ano')).groupby(data[coluna].to_numpy(), sort=False).sum().rename_axis(coluna)
+
+
+def resumo(data, projecao, coluna, anos=(5, 10, 20, 30)):
+    # Biomassa e CO₂ acumulados por grupo nos anos pedidos (os que couberem no horizonte)
+    anos = [ano for ano in anos if ano <= projecao['anos'][-1]] or [int(projecao['anos'][-1])]
+    indices = [ano - 1 for ano in anos]
+    partes = []
+    for medida, nome in (('biomassa', 'Biomassa (t)'), ('co2', 'CO₂ (t)')):
+        tabela = por_grupo(data, projecao[medida][:, indices], anos, coluna)
+        partes.append(tabela.set_axis([f'{nome} - {ano} anos' for ano in anos], axis=1))
+    return pd.concat(partes, axis=1)
@@ -0,0 +1,231 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib import parse
+
+import numpy as np
+import pandas as pd
+
+import dados
+
+
+# Endereço (url_path) de cada página do st.navigation do app.py, o nome do arquivo em paginas/
+URLS_PAGINAS = {
+    'Home': 'home',
+    'ASSETco': 'assetco',
+    'DEVco': 'devco',
+    'Projetos': 'projetos',
+    'Mapa': 'mapa',
+    'PRF': 'prf',
+    'Simulação': 'simulacao',
+    'Replantio': 'replantio',
+    'Sobrevivência': 'sobrevivencia',
+    'Explorador': 'explorador',
+    'Hierarquia': 'hierarquia',
+    'Histórico': 'historico',
+}
+
+# Páginas visitadas pelas sessões simuladas (padrão de --paginas)
+PAGINAS = ['Home', 'ASSETco', 'DEVco', 'Projetos']
+
+# Tempo máximo de uma execução do script antes de ser contada como falha
+TIMEOUT_EXECUCAO = 300
+
+# Densidade de plantio usada para gerar a quantidade de mudas dos PRFs sintéticos (mudas por ha)
+MUDAS_POR_HA = 2500
+
+
+def gerar_dataset(prfs, file_path, semente=0, base=dados.CAMINHO_CSV):
+    # CSV sintético com o mesmo formato do original: PRFs sorteados da base, com áreas reescaladas
+    # e nomes únicos. DIVISÃO, PROJETO, CIDADE e ANO vêm da base, então todas as páginas têm dados.
+    original = pd.read_csv(base)
+    linhas = original.iloc[:-1]
+    rng = np.random.default_rng(semente)
+
+    sinteticos = linhas.iloc[rng.integers(0, len(linhas), prfs)].reset_index(drop=True)
+    sinteticos['DESCRIÇÃO DO PRF'] = [f'{nome.strip()} #{i + 1}' for i, nome in enumerate(sinteticos['DESCRIÇÃO DO PRF'])]
+
+    fator = rng.lognormal(0, 0.5, prfs)
+    estrada = sinteticos['Estrada(ha)'].to_numpy(float) * fator
+    vegetacao = sinteticos['Vegetação Nativa(ha)'].to_numpy(float) * fator
+    plantio = sinteticos['Plantio (ha)'].to_numpy(float) * fator
+    total = estrada + vegetacao + plantio
+    total_seguro = np.where(total > 0, total, 1.0)
+
+    sinteticos[' Total (ha)'] = total
+    sinteticos['Estrada(ha)'] = estrada
+    sinteticos['Estrada(%)'] = estrada / total_seguro * 100
+    sinteticos['Vegetação Nativa(ha)'] = vegetacao
+    sinteticos['Vegetação Nativa (%)'] = vegetacao / total_seguro * 100
+    sinteticos['Plantio (ha)'] = plantio
+    sinteticos['Plantio (%)'] = plantio / total_seguro * 100
+    sinteticos['QDE de Mudas (UND)'] = np.round(plantio * MUDAS_POR_HA * rng.uniform(0.8, 1.2, prfs))
+
+    # Última linha de totais, descartada pelo read_plantio como no arquivo original
+    rodape = original.iloc[[-1]]
+    pd.concat([sinteticos, rodape], ignore_index=True).to_csv(file_path, index=False)
+    return file_path
+
+
+def _runtime_compartilhado():
+    # O AppTest cria e descarta um Runtime global a cada execução, o que quebra execuções simultâneas.
+    # Aqui todas as sessões usam um único Runtime, como as sessões de um mesmo servidor Streamlit.
+    from unittest.mock import MagicMock
+
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage('/mock/media'))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+    return runtime
+
+
+def _classe_sessao():
+    from streamlit.runtime.pages_manager import PagesManager
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import AppTest
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+    from streamlit.util import calc_md5
+
+    class SessaoCarga(AppTest):
+        # Mesmo fluxo do AppTest._run (streamlit 1.38), sem criar nem descartar o Runtime a cada execução.
+        # O PagesManager recebe um ScriptCache: sem ele, as páginas do st.navigation executam um script vazio.
+
+        def _run(self, widget_state=None, timeout=None):
+            pages_manager = PagesManager(self._script_path, script_cache=ScriptCache(), setup_watcher=False)
+            script_runner = LocalScriptRunner(self._script_path, self.session_state, pages_manager, args=self.args, kwargs=self.kwargs)
+            self._tree = script_runner.run(widget_state, self.query_params, timeout or self.default_timeout, self._page_hash)
+            self._tree._runner = self
+            self.query_params = parse.parse_qs(script_runner.event_data[-1]['client_state'].query_string)
+            return self
+
+        def abrir(self, url_pagina):
+            # O st.navigation identifica a página pelo md5 do url_path; o AppTest.switch_page (1.38) usa o
+            # caminho do arquivo, que só vale para o diretório pages/
+            self._page_hash = calc_md5(url_pagina)
+            return self
+
+    return SessaoCarga
+
+
+def _sessao(SessaoCarga, script, indice, trocas, paginas, latencias, falhas):
+    # Uma sessão abre o app na primeira página pedida e troca de página `trocas` vezes, sempre para uma
+    # página diferente da atual; cada execução importa e executa apenas a página aberta
+    rng = np.random.default_rng(indice)
+    at = SessaoCarga(os.path.abspath(script), default_timeout=TIMEOUT_EXECUCAO)
+
+    # A primeira execução é contada como as trocas: erro da página ou tempo esgotado é uma falha
+    pagina = paginas[0]
+    for troca in range(1 + (trocas if len(paginas) > 1 else 0)):
+        if troca:
+            pagina = str(rng.choice([p for p in paginas if p != pagina]))
+        inicio = time.perf_counter()
+        try:
+            at.abrir(URLS_PAGINAS[pagina]).run()
+        except RuntimeError as erro:
+            falhas.append((pagina, str(erro)))
+            return
+        latencias.append((pagina, time.perf_counter() - inicio))
+        if at.exception:
+            falhas.append((pagina, at.exception[0].value))
+
+
+def executar(script, sessoes, trocas, paginas=PAGINAS):
+    # Executado em um processo novo por cenário, para que o pico de memória e os caches sejam do cenário
+    from streamlit.testing.v1.util import patch_config_options
+
+    SessaoCarga = _classe_sessao()
+    _runtime_compartilhado()
+    latencias, falhas = [], []
+
+    with patch_config_options({'global.appTest': True}):
+        threads = [threading.Thread(target=_sessao, args=(SessaoCarga, script, i, trocas, paginas, latencias, falhas)) for i in range(sessoes)]
+        inicio = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duracao = time.perf_counter() - inicio
+
+    tempos = np.array([t for _, t in latencias])
+    por_pagina = {p: float(np.percentile([t for q, t in latencias if q == p], 95)) for p in paginas if any(q == p for q, _ in latencias)}
+    return {
+        'execucoes': len(tempos),
+        'falhas': len(falhas),
+        'primeira_falha': falhas[0][1][:200] if falhas else None,
+        'p50': float(np.percentile(tempos, 50)) if len(tempos) else None,
+        'p95': float(np.percentile(tempos, 95)) if len(tempos) else None,
+        'p99': float(np.percentile(tempos, 99)) if len(tempos) else None,
+        'p95_por_pagina': por_pagina,
+        'vazao': len(tempos) / duracao if duracao > 0 else 0.0,
+        # ru_maxrss é informado em KB no Linux
+        'pico_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def cenario(prfs, sessoes, trocas, script='app.py', cache_disco=None, paginas=PAGINAS):
+    # Gera o dataset sintético e roda o cenário em um processo separado, com cache em disco próprio
+    with tempfile.TemporaryDirectory(prefix='plantio_carga_') as diretorio:
+        ambiente = dict(os.environ)
+        ambiente['PLANTIO_CSV'] = gerar_dataset(prfs, os.path.join(diretorio, f'plantio_{prfs}.csv'), semente=prfs)
+        ambiente['PLANTIO_CACHE_DIR'] = cache_disco or os.path.join(diretorio, 'cache')
+        comando = [sys.executable, os.path.abspath(__file__), '--executar', script, '--sessoes', str(sessoes), '--trocas', str(trocas), '--paginas', *paginas]
+        saida = subprocess.run(comando, capture_output=True, text=True, env=ambiente, cwd=os.path.dirname(os.path.abspath(script)))
+        if saida.returncode != 0:
+            raise RuntimeError(saida.stderr.strip().splitlines()[-1] if saida.stderr.strip() else 'cenário terminou com erro')
+        return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Teste de carga do dashboard: sessões simultâneas trocando de página')
+    parser.add_argument('--prfs', type=int, nargs='+', default=[37, 500], help='Tamanhos dos datasets sintéticos (número de PRFs)')
+    parser.add_argument('--sessoes', type=int, nargs='+', default=[1, 4, 8], help='Números de sessões simultâneas')
+    parser.add_argument('--trocas', type=int, default=8, help='Trocas de página por sessão')
+    parser.add_argument('--paginas', nargs='+', default=PAGINAS, choices=list(URLS_PAGINAS), help='Páginas visitadas pelas sessões')
+    parser.add_argument('--script', default='app.py', help='Script Streamlit testado')
+    parser.add_argument('--cache-disco', help='Diretório de cache em disco (padrão: um cache vazio por cenário)')
+    parser.add_argument('--limite-p95', type=float, help='Termina com erro se o p95 de algum cenário passar deste valor (s)')
+    parser.add_argument('--json', action='store_true', help='Imprime os resultados em JSON')
+    parser.add_argument('--executar', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.executar:
+        sys.path.insert(0, os.getcwd())
+        print(json.dumps(executar(args.executar, args.sessoes[0], args.trocas, args.paginas)))
+        sys.exit(0)
+
+    cabecalho = f"{'PRFs':>6}{'Sessões':>9}{'Execuções':>11}{'Falhas':>8}{'p50 (s)':>9}{'p95 (s)':>9}{'p99 (s)':>9}{'Vazão (/s)':>12}{'Pico RSS (MB)':>15}"
+    if not args.json:
+        print(cabecalho, flush=True)
+
+    resultados = []
+    for prfs in args.prfs:
+        for sessoes in args.sessoes:
+            r = {'prfs': prfs, 'sessoes': sessoes, **cenario(prfs, sessoes, args.trocas, args.script, args.cache_disco, args.paginas)}
+            resultados.append(r)
+            if not args.json:
+                # Cada cenário é impresso assim que termina
+                print(f"{r['prfs']:>6}{r['sessoes']:>9}{r['execucoes']:>11}{r['falhas']:>8}{r['p50']:>9.2f}{r['p95']:>9.2f}{r['p99']:>9.2f}"
+                      f"{r['vazao']:>12.2f}{r['pico_rss_mb']:>15.0f}", flush=True)
+
+    if args.json:
+        print(json.dumps(resultados, indent=2))
+    else:
+        for r in resultados:
+            if r['primeira_falha']:
+                print(f"{r['prfs']} PRFs / {r['sessoes']} sessões: {r['primeira_falha']}")
+
+    falhou = any(r['falhas'] for r in resultados)
+    if args.limite_p95 is not None:
+        falhou |= any(r['p95'] is not None and r['p95'] > args.limite_p95 for r in resultados)
+    sys.exit(1 if falhou else 0)
@@ -0,0 +1,186 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# Caminho padrão do arquivo CSV com o controle de plantio
+CAMINHO_CSV = 'Controle_Plantio_set_2024.csv'
+
+# Arquivo opcional com as vistorias de campo (vistorias.py): contagens de mudas vivas por PRF e data
+CAMINHO_VISTORIAS = 'vistorias_plantio.csv'
+
+# Taxa de mortalidade assumida para as mudas (8,26%), usada nos PRFs e projetos sem vistoria de campo
+TAXA_MORTALIDADE = 0.0826
+
+# Faixas das classes de aproveitamento abaixo de 100% (mínimo inclusivo, máximo exclusivo); o restante é <60%
+FAIXAS_APROVEITAMENTO = [(90, 100, '90%-99%'), (80, 90, '80%-89%'), (70, 80, '70%-79%'), (60, 70, '60%-69%')]
+
+# Colunas de uso do solo agregadas por divisão
+COLUNAS_USO_DO_SOLO = ['Estrada(ha)', 'Vegetação Nativa(ha)', 'Plantio (ha)', 'Total (ha)']
+
+# Colunas da tabela de PRFs exibida por projeto
+COLUNAS_PRF = ['DESCRIÇÃO DO PRF', 'Total (ha)', 'Estrada(ha)', 'Vegetação Nativa(ha)', 'Plantio (ha)',
+               'Plantio (%)', 'Área Sem Plantio (%)', 'QDE de Mudas (UND)', 'Mortalidade (Qtd.)']
+
+
+def caminho_csv():
+    # Permite apontar o app e a API para outro arquivo sem editar o código
+    return os.environ.get('PLANTIO_CSV', CAMINHO_CSV)
+
+
+def caminho_vistorias():
+    return os.environ.get('PLANTIO_VISTORIAS', CAMINHO_VISTORIAS)
+
+
+# Versões já calculadas, indexadas por (caminho, tamanho, data de modificação)
+_versoes = {}
+
+
+def versao_dados(file_path=None):
+    file_path = file_path or caminho_csv()
+
+    # Só lê o arquivo de novo quando o tamanho ou a data de modificação mudam
+    stat = os.stat(file_path)
+    assinatura = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    if assinatura in _versoes:
+        return _versoes[assinatura]
+
+    # Hash do conteúdo do arquivo: muda sempre que o CSV é atualizado
+    sha = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            sha.update(bloco)
+    _versoes[assinatura] = sha.hexdigest()[:16]
+    return _versoes[assinatura]
+
+
+def versao_plantio(file_path=None):
+    # Versão dos dados exibidos: a do CSV e, quando existe, a do arquivo de vistorias, que define a mortalidade
+    versao = versao_dados(file_path)
+    caminho = caminho_vistorias()
+    if os.path.exists(caminho):
+        versao = hashlib.sha1(f'{versao}:{versao_dados(caminho)}'.encode()).hexdigest()[:16]
+    return versao
+
+
+def read_plantio(file_path=None):
+    data = pd.read_csv(file_path or caminho_csv())
+
+    # Remove a última linha
+    data = data.iloc[:-1]
+
+    return limpar(data)
+
+
+def limpar(data, observadas=None):
+    # Limpeza e colunas derivadas; aplicada ao arquivo inteiro ou a cada bloco na ingestão em blocos.
+    # observadas: taxas de mortalidade das vistorias já calculadas sobre o arquivo inteiro (ingestao.taxas_observadas),
+    # para que a taxa de um bloco não dependa só dos PRFs vistoriados do bloco
+    data = data.copy()
+
+    # Remover colunas desnecessárias
+    data = data.drop(columns=['Unnamed: 13', 'Unnamed: 14', 'Unnamed: 15'], errors='ignore')
+
+    # Converter a coluna ANO para tipo numérico (se necessário)
+    if 'ANO' in data.columns:
+        data['ANO'] = pd.to_numeric(data['ANO'], errors='coerce')
+
+    # Remover espaços em branco extras nos nomes das colunas
+    data.columns = data.columns.str.strip()
+
+    # Remover espaços extras da coluna 'DESCRIÇÃO DO PRF'
+    if 'DESCRIÇÃO DO PRF' in data.columns:
+        data['DESCRIÇÃO DO PRF'] = data['DESCRIÇÃO DO PRF'].str.strip()
+
+    if observadas is not None:
+        import vistorias
+
+        data['Taxa de Mortalidade'] = vistorias.taxas(data, observadas=observadas)
+
+    return derivar(data)
+
+
+def derivar(data, colunas=None):
+    # Acrescenta as colunas derivadas pedidas (por padrão, todas) que o frame ainda não tem
+    faltantes = [coluna for coluna in (colunas or DERIVADAS) if coluna not in data.columns]
+    if not faltantes:
+        return data
+    return data.assign(**{coluna: DERIVADAS[coluna] for coluna in faltantes})
+
+
+def taxa_mortalidade(data):
+    # Taxa observada nas vistorias de campo de cada PRF (vistorias.py) ou, sem vistorias, a taxa assumida
+    import vistorias
+
+    return vistorias.taxas(data, vistorias.ler_vistorias())
+
+
+def taxa_mortalidade_media(data):
+    # Taxa de mortalidade do conjunto de PRFs, ponderada pelas mudas plantadas
+    mudas = data['QDE de Mudas (UND)'].sum()
+    return float(data['Mortalidade (Qtd.)'].sum() / mudas) if mudas > 0 else TAXA_MORTALIDADE
+
+
+def classe_aproveitamento(data):
+    # Classe de aproveitamento de cada PRF pelas FAIXAS_APROVEITAMENTO, para a coluna inteira de uma vez
+    plantio_pct = data['Plantio (%)'].to_numpy(dtype=float)
+    condicoes = [plantio_pct == 100] + [(plantio_pct >= minimo) & (plantio_pct < maximo) for minimo, maximo, _ in FAIXAS_APROVEITAMENTO]
+    classes = ['100%'] + [classe for _, _, classe in FAIXAS_APROVEITAMENTO]
+    return pd.Series(np.select(condicoes, classes, '<60%'), index=data.index, dtype=object)
+
+
+# Colunas derivadas: cada uma é definida uma única vez, como expressão vetorizada sobre as colunas do arquivo.
+# São calculadas no read_plantio, uma vez por versão dos dados (o resultado fica no cache em disco e no
+# snapshot), e os recortes por divisão ou projeto as herdam do frame em vez de recalculá-las.
+DERIVADAS = {
+    'Área Sem Plantio (%)': lambda data: 100 - data['Plantio (%)'],
+    'Taxa de Mortalidade': taxa_mortalidade,
+    # Mortalidade usando a taxa de cada PRF (a coluna da taxa vem antes porque o assign calcula as colunas em ordem)
+    'Mortalidade (Qtd.)': lambda data: data['QDE de Mudas (UND)'] * (data['Taxa de Mortalidade'] if 'Taxa de Mortalidade' in data.columns else taxa_mortalidade(data)),
+    'Classe de Aproveitamento': classe_aproveitamento,
+}
+
+
+# ------------------ Agregados ------------------
+
+def division_summary(data):
+    # Agrupando os dados por 'DIVISÃO' e somando os valores de 'Total (ha)', 'QDE de Mudas (UND)', 'Mortalidade (Qtd.)'
+    return data.groupby('DIVISÃO').agg({
+        'Total (ha)': 'sum',
+        'QDE de Mudas (UND)': 'sum',
+        'Mortalidade (Qtd.)': 'sum'
+    })
+
+
+def land_use(data):
+    # Agrupando os dados por 'DIVISÃO' e somando os valores de uso do solo
+    return data.groupby('DIVISÃO').agg({coluna: 'sum' for coluna in COLUNAS_USO_DO_SOLO})
+
+
+def aproveitamento_counts(data):
+    # Contagem de PRFs em cada classe
+    return data['Classe de Aproveitamento'].value_counts()
+
+
+def tabela_prf(data, projeto):
+    # Tabela de PRFs de um projeto, ordenada pelo percentual de plantio
+    tabela = data.loc[data['PROJETO'] == projeto, COLUNAS_PRF]
+    return tabela.sort_values('Plantio (%)').reset_index(drop=True)
+
+
+def project_summary(data):
+    # Totais por projeto, na ordem em que aparecem no arquivo
+    return data.groupby(['DIVISÃO', 'PROJETO'], sort=False).agg(**{
+        'PRFs': ('DESCRIÇÃO DO PRF', 'count'),
+        'Total (ha)': ('Total (ha)', 'sum'),
+        'Plantio (ha)': ('Plantio (ha)', 'sum'),
+        'QDE de Mudas (UND)': ('QDE de Mudas (UND)', 'sum'),
+        'Mortalidade (Qtd.)': ('Mortalidade (Qtd.)', 'sum'),
+    })
+
+
+def projetos(data):
+    # Projetos na ordem em que aparecem no arquivo
+    return list(pd.unique(data['PROJETO']))
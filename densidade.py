@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+
+# Densidade de plantio de referência (mudas por hectare)
+DENSIDADE_REFERENCIA = 2500
+
+# PRFs com |z robusto| acima deste limite são marcados como atípicos (Iglewicz e Hoaglin)
+LIMITE_Z = 3.5
+
+# Constantes que tornam o MAD e o desvio médio absoluto comparáveis ao desvio padrão da normal
+ESCALA_MAD = 1.4826
+ESCALA_DESVIO_MEDIO = 1.2533
+
+# Dispersão mínima, em fração da mediana do grupo: evita que ruído de ponto flutuante em
+# projetos com densidade praticamente constante vire um z enorme
+DISPERSAO_MINIMA = 0.01
+
+# Diferença máxima para considerar uma quantidade de mudas inteira
+TOLERANCIA_INTEIRO = 1e-6
+
+
+def z_robusto(valores, grupos):
+    # z robusto de cada valor dentro do seu grupo: (x - mediana) / (1,4826 * MAD).
+    # Em grupos com MAD zero usa o desvio médio absoluto, e a escala nunca fica abaixo de 1% da mediana.
+    valores = pd.Series(np.asarray(valores, dtype=float))
+    grupos = pd.Series(np.asarray(grupos))
+    mediana = valores.groupby(grupos).transform('median')
+    desvio = (valores - mediana).abs()
+    mad = desvio.groupby(grupos).transform('median') * ESCALA_MAD
+    desvio_medio = desvio.groupby(grupos).transform('mean') * ESCALA_DESVIO_MEDIO
+
+    escala = np.maximum(np.where(mad > 0, mad, desvio_medio), mediana.abs() * DISPERSAO_MINIMA).astype(float)
+    diferenca = (valores - mediana).to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where(escala > 0, diferenca / np.where(escala > 0, escala, 1.0), np.where(diferenca == 0, 0.0, np.sign(diferenca) * np.inf))
+    return np.where(np.isnan(valores.to_numpy()), np.nan, z)
+
+
+def analisar(data, limite_z=LIMITE_Z):
+    # Densidade de cada PRF, z robusto dentro do projeto e marcações de consistência, uma linha por PRF
+    plantio = data['Plantio (ha)'].to_numpy(dtype=float)
+    mudas = data['QDE de Mudas (UND)'].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        densidade = np.where(plantio > 0, mudas / plantio, np.nan)
+
+    z = z_robusto(densidade, data['PROJETO'])
+    atipico = np.abs(z) > limite_z
+    fracionario = np.abs(mudas - np.round(mudas)) > TOLERANCIA_INTEIRO
+    sem_area = (plantio <= 0) & (mudas > 0)
+
+    analise = pd.DataFrame({
+        'DIVISÃO': data['DIVISÃO'].to_numpy(),
+        'PROJETO': data['PROJETO'].to_numpy(),
+        'DESCRIÇÃO DO PRF': data['DESCRIÇÃO DO PRF'].to_numpy(),
+        'Plantio (ha)': plantio,
+        'QDE de Mudas (UND)': mudas,
+        'Densidade (mudas/ha)': densidade,
+        'Desvio da Referência (%)': (densidade / DENSIDADE_REFERENCIA - 1) * 100,
+        'Z Robusto': z,
+        'Densidade Atípica': atipico,
+        'Mudas Fracionárias': fracionario,
+        'Mudas sem Área Plantada': sem_area,
+    })
+
+    # Motivos legíveis, montados com operações vetorizadas sobre as marcações
+    motivos = np.full(len(analise), '', dtype=object)
+    for coluna, texto in (('Densidade Atípica', 'densidade atípica no projeto'),
+                          ('Mudas Fracionárias', 'quantidade de mudas fracionária'),
+                          ('Mudas sem Área Plantada', 'mudas sem área plantada')):
+        marcados = analise[coluna].to_numpy()
+        motivos[marcados] = np.where(motivos[marcados] == '', texto, motivos[marcados] + '; ' + texto)
+    analise['Motivo'] = motivos
+    return analise
+
+
+def marcados(analise):
+    # PRFs com alguma inconsistência, dos mais atípicos para os menos
+    filtro = analise['Motivo'] != ''
+    ordem = analise.loc[filtro, 'Z Robusto'].abs().fillna(np.inf).sort_values(ascending=False).index
+    return analise.loc[ordem]
+
+
+def resumo(analise):
+    # Indicadores da análise para os cartões das páginas
+    return {
+        'Densidade Mediana (mudas/ha)': float(np.nanmedian(analise['Densidade (mudas/ha)'])) if analise['Densidade (mudas/ha)'].notna().any() else float('nan'),
+        'PRFs com Densidade Atípica': int(analise['Densidade Atípica'].sum()),
+        'PRFs com Mudas Fracionárias': int(analise['Mudas Fracionárias'].sum()),
+    }
@@ -0,0 +1,124 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+
+# Dimensões que podem ser usadas nas linhas e nas colunas da tabela dinâmica
+DIMENSOES = ['DIVISÃO', 'PROJETO', 'CIDADE', 'ANO', 'Classe de Aproveitamento']
+
+# Medidas: coluna e função de agregação; percentuais são razões entre somas (ponderados pela área)
+MEDIDAS = {
+    'PRFs': ('DESCRIÇÃO DO PRF', 'count'),
+    'Total (ha)': ('Total (ha)', 'sum'),
+    'Plantio (ha)': ('Plantio (ha)', 'sum'),
+    'QDE de Mudas (UND)': ('QDE de Mudas (UND)', 'sum'),
+    'Mortalidade (Qtd.)': ('Mortalidade (Qtd.)', 'sum'),
+}
+RAZOES = {
+    'Plantio (%)': ('Plantio (ha)', 'Total (ha)'),
+    'Densidade (mudas/ha)': ('QDE de Mudas (UND)', 'Plantio (ha)'),
+}
+
+# Nome da linha e da coluna de totais
+TOTAL = 'Total'
+
+
+def medidas():
+    return [*MEDIDAS, *RAZOES]
+
+
+def categorizar(data):
+    # Dimensões como categorias: o pivot agrupa pelos códigos inteiros em vez de comparar textos
+    colunas = [*DIMENSOES, 'DESCRIÇÃO DO PRF', *{coluna for coluna, _ in MEDIDAS.values()}, *{c for par in RAZOES.values() for c in par}]
+    categorias = data[list(dict.fromkeys(colunas))].copy()
+    for dimensao in DIMENSOES:
+        categorias[dimensao] = categorias[dimensao].astype('category')
+    return categorias
+
+
+def filtrar(categorias, filtros):
+    # filtros: {dimensão: valores}; dimensões sem valores não filtram
+    mascara = np.ones(len(categorias), dtype=bool)
+    for dimensao, valores in filtros.items():
+        if valores:
+            mascara &= categorias[dimensao].isin(valores).to_numpy()
+    return categorias[mascara]
+
+
+def _pivot(categorias, linhas, colunas, coluna, funcao):
+    return pd.pivot_table(
+        categorias, values=coluna, index=list(linhas), columns=list(colunas) or None, aggfunc=funcao,
+        observed=True, margins=True, margins_name=TOTAL, fill_value=0 if funcao == 'count' else None,
+    )
+
+
+def pivotar(categorias, linhas, colunas=(), medida='Plantio (ha)', filtros=None):
+    # Tabela dinâmica da medida por linhas x colunas, com totais; só aparecem as combinações presentes nos dados
+    if not linhas:
+        raise ValueError('Escolha ao menos uma dimensão para as linhas')
+    if set(linhas) & set(colunas):
+        raise ValueError('A mesma dimensão não pode estar nas linhas e nas colunas')
+    categorias = filtrar(categorias, filtros or {})
+
+    if medida in RAZOES:
+        numerador, denominador = RAZOES[medida]
+        somas = [_pivot(categorias, linhas, colunas, coluna, 'sum') for coluna in (numerador, denominador)]
+        if not colunas:
+            # Sem dimensão nas colunas cada pivot tem uma única coluna, com o nome da sua medida: a razão é entre
+            # os valores, não entre colunas de nomes diferentes
+            somas = [soma.squeeze('columns') for soma in somas]
+        tabela = somas[0] / somas[1]
+        if medida == 'Plantio (%)':
+            tabela = tabela * 100
+        tabela = tabela.replace([np.inf, -np.inf], np.nan)
+    else:
+        coluna, funcao = MEDIDAS[medida]
+        tabela = _pivot(categorias, linhas, colunas, coluna, funcao)
+
+    if isinstance(tabela, pd.Series):
+        tabela = tabela.to_frame(medida)
+    elif not colunas:
+        tabela.columns = [medida]
+    return tabela
+
+
+def achatar(tabela):
+    # Colunas em um único nível de texto ("São Miguel do Gostoso/RN / 2024"), como pedem CSV e Parquet
+    tabela = tabela.copy()
+    niveis = tabela.columns.to_flat_index()
+    tabela.columns = [' / '.join(map(str, nome)) if isinstance(nome, tuple) else str(nome) for nome in niveis]
+    return tabela
+
+
+def verificar(data):
+    # Verificação de regressão: todas as medidas, com e sem dimensão nas colunas; devolve as combinações que falham
+    categorias = categorizar(data)
+    falhas = []
+    for medida in medidas():
+        for colunas in ((), ('ANO',)):
+            try:
+                tabela = pivotar(categorias, ['DIVISÃO'], colunas, medida)
+                if not colunas and list(tabela.columns) != [medida]:
+                    raise ValueError(f'colunas {list(tabela.columns)}')
+                if tabela.isna().all().all():
+                    raise ValueError('tabela vazia')
+            except Exception as erro:  # noqa: BLE001
+                falhas.append((medida, colunas, repr(erro)))
+    return falhas
+
+
+if __name__ == '__main__':
+    import dados
+
+    parser = argparse.ArgumentParser(description='Tabela dinâmica do controle de plantio')
+    parser.add_argument('--verificar', action='store_true', help='Calcula todas as medidas com e sem dimensão nas colunas')
+    args = parser.parse_args()
+
+    if args.verificar:
+        falhas = verificar(dados.read_plantio())
+        for medida, colunas, erro in falhas:
+            print(f"{medida} (colunas: {', '.join(colunas) or 'nenhuma'}): {erro}")
+        if falhas:
+            parser.exit(1)
+        print(f'{len(medidas())} medidas verificadas com e sem dimensão nas colunas')
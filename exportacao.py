@@ -0,0 +1,77 @@
+import io
+
+
+# Número de linhas serializadas por bloco (um row group por bloco no Parquet)
+LINHAS_POR_BLOCO = 50_000
+
+# Formatos de exportação: extensão e tipo MIME
+FORMATOS = {
+    'CSV': ('csv', 'text/csv'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+}
+
+
+def _blocos(frame, linhas_por_bloco):
+    for inicio in range(0, len(frame), linhas_por_bloco):
+        yield frame.iloc[inicio:inicio + linhas_por_bloco]
+
+
+def iter_csv(frame, linhas_por_bloco=LINHAS_POR_BLOCO):
+    # CSV em blocos: o cabeçalho vai só no primeiro bloco
+    if frame.empty:
+        yield frame.to_csv(index=False).encode('utf-8')
+        return
+    for i, bloco in enumerate(_blocos(frame, linhas_por_bloco)):
+        yield bloco.to_csv(index=False, header=(i == 0)).encode('utf-8')
+
+
+class _Coletor(io.RawIOBase):
+    # Destino de escrita que acumula apenas os bytes ainda não entregues ao consumidor
+
+    def __init__(self):
+        self._partes = []
+        self._posicao = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._partes.append(bytes(b))
+        self._posicao += len(b)
+        return len(b)
+
+    def tell(self):
+        return self._posicao
+
+    def drenar(self):
+        partes, self._partes = self._partes, []
+        return b''.join(partes)
+
+
+def iter_parquet(frame, linhas_por_bloco=LINHAS_POR_BLOCO):
+    # Parquet em blocos: cada bloco vira um row group, entregue assim que é escrito
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(frame, preserve_index=False)
+    coletor = _Coletor()
+    with pq.ParquetWriter(coletor, schema) as writer:
+        for bloco in _blocos(frame, linhas_por_bloco):
+            writer.write_table(pa.Table.from_pandas(bloco, schema=schema, preserve_index=False))
+            yield coletor.drenar()
+    yield coletor.drenar()
+
+
+def iter_exportacao(frame, formato, linhas_por_bloco=LINHAS_POR_BLOCO):
+    if formato == 'CSV':
+        return iter_csv(frame, linhas_por_bloco)
+    if formato == 'Parquet':
+        return iter_parquet(frame, linhas_por_bloco)
+    raise ValueError(f'Formato de exportação desconhecido: {formato}')
+
+
+def tabela_exportacao(frame):
+    # Agregados carregam a chave no índice; as linhas filtradas não precisam do índice original
+    if frame.index.name is not None or frame.index.nlevels > 1:
+        return frame.reset_index()
+    return frame.reset_index(drop=True)
@@ -0,0 +1,267 @@
+import argparse
+import io
+import os
+import time
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+
+import dados
+from tema import CORES, FONTES, PALETA, estilizar, fonte
+
+
+# Os gráficos usam matplotlib.figure.Figure diretamente (sem o estado global do pyplot),
+# com cores e fontes vindas do tema. Este módulo é importado apenas pelas páginas com gráficos.
+
+
+def png(fig):
+    # Mesmas opções usadas pelo st.pyplot
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=200, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def _rotulo_taxa(taxa):
+    return f'{taxa * 100:.2f}%'.replace('.', ',')
+
+
+def barras_aproveitamento(plot_data, titulo, rotulos, figsize=(18, 10), bar_width=0.9, rotacao=0,
+                          fonte_rotulos=10, fonte_valores=10, legenda_y=-0.10, ajustar_layout=True,
+                          taxa_mortalidade=dados.TAXA_MORTALIDADE):
+    # Gráfico de barras empilhadas: Área Plantada (%) + Área Sem Plantio (%) por PRF
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+
+    ind = np.arange(len(plot_data))
+    plantio_pct = plot_data['Plantio (%)'].to_numpy()
+    sem_plantio_pct = plot_data['Área Sem Plantio (%)'].to_numpy()
+
+    ax.bar(ind, plantio_pct, bar_width, color=PALETA['area_plantada'], label='Área Plantada (%)')
+    ax.bar(ind, sem_plantio_pct, bar_width, bottom=plantio_pct, color=PALETA['area_sem_plantio'], label='Área Sem Plantio (%)')
+
+    # Linha de mortalidade
+    taxa_pct = taxa_mortalidade * 100
+    ax.axhline(y=taxa_pct, color=PALETA['mortalidade'], linestyle='--', linewidth=1, label='Taxa de Mortalidade')
+    ax.text(len(ind) - 0.5, taxa_pct + 1, _rotulo_taxa(taxa_mortalidade), color=PALETA['mortalidade'], ha='right', va='bottom',
+            fontproperties=FONTES['destaque'])
+
+    # Customizações do gráfico
+    ax.set_ylabel('Percentual (%)', fontproperties=FONTES['rotulo'])
+    ax.set_title(titulo, fontproperties=FONTES['titulo'])
+    ax.set_xticks(ind)
+    ax.set_xticklabels(rotulos, rotation=rotacao, fontproperties=fonte(fonte_rotulos))
+
+    # Limites e ajustes do gráfico
+    ax.set_ylim(0, 110)
+    ax.margins(x=0)
+    ax.legend(loc='upper center', bbox_to_anchor=(0.5, legenda_y), ncol=3, prop=FONTES['rotulo'])
+
+    # Adicionar valores percentuais nas barras
+    fonte_valor = fonte(fonte_valores, 'bold')
+    for idx in ind:
+        if plantio_pct[idx] > 0:
+            ax.text(idx, plantio_pct[idx] / 2, f"{plantio_pct[idx]:.1f}%", ha='center', va='center', color='white', fontproperties=fonte_valor)
+        if sem_plantio_pct[idx] > 0:
+            ax.text(idx, plantio_pct[idx] + sem_plantio_pct[idx] / 2, f"{sem_plantio_pct[idx]:.1f}%", ha='center', va='center', color='black',
+                    fontproperties=fonte_valor)
+
+    estilizar(fig)
+    if ajustar_layout:
+        fig.tight_layout()
+    return fig
+
+
+def resumo_prf(resumo, titulo, rotulos, normalizar=True, figsize=(16, 12), largura=0.8, fonte_titulo=12,
+               rotulo_mudas='Quantidade de Mudas (UND)', formatos=('.2f', '.0f', '.2f'), fonte_valores=10,
+               fonte_rotulos=9, rotacao=0):
+    # Três painéis com Plantio (ha), QDE de Mudas (UND) e Mortalidade (Qtd.) por PRF
+    colunas = ['Plantio (ha)', 'QDE de Mudas (UND)', 'Mortalidade (Qtd.)']
+    rotulos_y = ['Área Plantada (ha)', rotulo_mudas, 'Mortalidade (Qtd.)']
+    cores = [PALETA['plantio_ha'], PALETA['mudas'], PALETA['mortalidade_qtd']]
+
+    valores = resumo[colunas].to_numpy(dtype=float)
+    alturas = valores
+    if normalizar:
+        # Normalização dos valores para o gráfico (colunas constantes ficam com altura 1)
+        minimo, maximo = valores.min(axis=0), valores.max(axis=0)
+        amplitude = np.where(maximo > minimo, maximo - minimo, 1.0)
+        alturas = np.where(maximo > minimo, (valores - minimo) / amplitude, 1.0)
+
+    fig = Figure(figsize=figsize)
+    axs = fig.subplots(3, 1, sharex=True)
+    ind = np.arange(len(resumo))
+    fonte_valor = fonte(fonte_valores)
+
+    for j, ax in enumerate(axs):
+        ax.bar(ind, alturas[:, j], width=largura, color=cores[j])
+        ax.set_ylabel(rotulos_y[j], fontproperties=FONTES['legenda'])
+        for i in ind:
+            ax.text(i, alturas[i, j] + 0.01, format(valores[i, j], formatos[j]), ha='center', fontproperties=fonte_valor)
+
+    axs[0].set_title(titulo, fontproperties=fonte(fonte_titulo))
+
+    # Rótulos do eixo X (compartilhado entre os três painéis)
+    axs[2].set_xticks(ind)
+    axs[2].set_xticklabels(rotulos, rotation=rotacao, ha='center', fontproperties=fonte(fonte_rotulos))
+
+    estilizar(fig)
+    fig.tight_layout()
+    return fig
+
+
+def donut(valores, cores, titulo, titulo_legenda, pad=None, raio_rotulos=1.1, fonte_percentual=8, fonte_valor=9):
+    # Gráfico de donut com o total no centro, percentual e valor de cada fatia do lado de fora.
+    # As cores podem ser uma lista ou o nome de uma sequência do tema (CORES).
+    if isinstance(cores, str):
+        cores = CORES[cores]
+    fig = Figure(figsize=(8, 8))
+    ax = fig.subplots()
+    wedges, _ = ax.pie(valores, colors=cores, startangle=90, wedgeprops=dict(width=0.3, edgecolor='w'))
+
+    # Centralizar o texto no gráfico
+    ax.add_artist(Circle((0, 0), 0.70, fc='white'))
+    ax.set_title(titulo, pad=pad)
+
+    # Adicionar o número total no centro
+    total = valores.sum()
+    ax.text(0, 0, f'{int(total)}', ha='center', va='center', color=PALETA['titulo'], fontproperties=FONTES['total'])
+
+    # Adicionar os percentuais fora do donut e os valores inteiros acima dos percentuais
+    fonte_pct, fonte_qtd = fonte(fonte_percentual), fonte(fonte_valor)
+    for wedge, count in zip(wedges, valores):
+        angle = (wedge.theta2 - wedge.theta1) / 2. + wedge.theta1
+        x = raio_rotulos * np.cos(np.radians(angle))
+        y = raio_rotulos * np.sin(np.radians(angle))
+
+        # Percentual fora, entre parênteses e na cor cinza
+        ax.text(x, y, f'({count / total * 100:.2f}%)', ha='center', va='center', color=PALETA['percentual'], fontproperties=fonte_pct)
+
+        # Valor inteiro acima do percentual
+        ax.text(x, y + 0.15, f'{int(count)}', ha='center', va='center', color=PALETA['titulo'], fontproperties=fonte_qtd)
+
+    # Legenda
+    legend = ax.legend(wedges, valores.index, title=titulo_legenda, loc='center left', bbox_to_anchor=(1, 0, 0.5, 1),
+                       prop=FONTES['legenda'], title_fontproperties=FONTES['titulo_legenda'])
+    legend.get_title().set_color(PALETA['titulo'])
+
+    fig.tight_layout()
+    return fig
+
+
+def uso_do_solo(land_use, colunas=dados.COLUNAS_USO_DO_SOLO):
+    # Barras horizontais de Estrada, Vegetação Nativa, Plantio e Total (ha) por divisão
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+
+    y = np.arange(len(colunas))
+    height = 0.35
+    divisoes = [d for d in ('ASSETco', 'DEVco') if d in land_use.index]
+    deslocamentos = [-height / 2, height / 2] if len(divisoes) > 1 else [0]
+
+    for divisao, deslocamento in zip(divisoes, deslocamentos):
+        valores = land_use.loc[divisao, colunas].to_numpy(dtype=float)
+        ax.barh(y + deslocamento, valores, height, color=CORES['uso_do_solo'][divisao], label=divisao)
+        for i, v in enumerate(valores):
+            ax.text(v + 0.5, y[i] + deslocamento, f'{v:.2f}', va='center', ha='left', color=PALETA['titulo'], fontproperties=FONTES['legenda'])
+
+    # Personalizar o gráfico
+    ax.set_title('USO DO SOLO', pad=20, fontproperties=FONTES['titulo_secao'])
+    ax.set_xlabel('Área (ha)')
+    ax.set_yticks(y)
+    ax.set_yticklabels(colunas)
+    ax.tick_params(axis='both', colors=PALETA['titulo'], labelcolor=PALETA['titulo'])
+    ax.legend(prop=FONTES['legenda'])
+
+    estilizar(fig, spines=('left', 'bottom'))
+    fig.tight_layout()
+    return fig
+
+
+def sunburst(arvore, medida, titulo):
+    # Anéis concêntricos da árvore (divisões no centro, projetos no meio, PRFs por fora), com o ângulo de
+    # cada nó igual ao seu subtotal; os nós de uma divisão usam a cor dela, mais clara a cada nível
+    from matplotlib.colors import to_rgb
+
+    fig = Figure(figsize=(10, 10))
+    ax = fig.subplots()
+    valores = np.clip(arvore.valor(medida), 0, None)
+    ax.set_title(titulo, fontproperties=FONTES['titulo_secao'])
+    if valores[0] <= 0:
+        ax.text(0, 0, 'Sem valores', ha='center', va='center', fontproperties=FONTES['rotulo'])
+        ax.axis('off')
+        return fig
+
+    nomes_divisoes = [arvore.nomes[no] for no in arvore.nos_do_nivel(1)]
+    base = np.array([to_rgb(CORES['uso_do_solo'].get(nome, CORES['divisao'][i % len(CORES['divisao'])]))
+                     for i, nome in enumerate(nomes_divisoes)])
+
+    largura = 0.28
+    for nivel, clareamento in ((1, 0.0), (2, 0.35), (3, 0.6)):
+        nos = arvore.nos_do_nivel(nivel)
+        cores = base[arvore.divisao[nos]] * (1 - clareamento) + clareamento
+        wedges, _ = ax.pie(valores[nos], radius=0.3 + largura * nivel, colors=cores, startangle=90, counterclock=False,
+                           wedgeprops=dict(width=largura, edgecolor='w', linewidth=0.8 if nivel < 3 else 0.3))
+
+        # Nomes de divisões e projetos nas fatias com espaço suficiente
+        if nivel < 3:
+            raio = 0.3 + largura * (nivel - 0.5)
+            for wedge, no in zip(wedges, nos):
+                if wedge.theta2 - wedge.theta1 < 12:
+                    continue
+                angulo = np.radians((wedge.theta1 + wedge.theta2) / 2)
+                ax.text(raio * np.cos(angulo), raio * np.sin(angulo), arvore.nomes[no], ha='center', va='center',
+                        color='white' if nivel == 1 else PALETA['titulo'], fontproperties=FONTES['legenda'])
+
+    ax.text(0, 0, f'{valores[0]:.2f}'.replace('.', ','), ha='center', va='center',
+            color=PALETA['titulo'], fontproperties=FONTES['rotulo'])
+    ax.set(aspect='equal')
+    fig.tight_layout()
+    return fig
+
+
+def projecao_carbono(por_projeto, titulo):
+    # Áreas empilhadas do CO₂ acumulado (t) por projeto em cada ano da projeção, com o total no último ano
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+
+    anos = por_projeto.columns.to_numpy()
+    cores = [CORES['carbono'][i % len(CORES['carbono'])] for i in range(len(por_projeto))]
+    ax.stackplot(anos, por_projeto.to_numpy(dtype=float), labels=list(por_projeto.index), colors=cores, alpha=0.9)
+
+    total = float(por_projeto.iloc[:, -1].sum())
+    ax.text(anos[-1], total, f'{total:,.0f} t'.replace(',', '.'), ha='right', va='bottom', color=PALETA['titulo'],
+            fontproperties=FONTES['destaque'])
+
+    ax.set_title(titulo, pad=20, fontproperties=FONTES['titulo_secao'])
+    ax.set_xlabel('Anos após o plantio', fontproperties=FONTES['rotulo'])
+    ax.set_ylabel('CO₂ capturado (t)', fontproperties=FONTES['rotulo'])
+    ax.set_xlim(anos[0], anos[-1])
+    ax.set_ylim(0, total * 1.1 if total > 0 else 1)
+    ax.legend(loc='upper left', prop=FONTES['legenda'])
+
+    estilizar(fig, spines=('left', 'bottom'))
+    fig.tight_layout()
+    return fig
+
+
+def gerar_cache_fontes():
+    # Gera o cache de fontes do matplotlib (em MPLCONFIGDIR) durante o build da imagem,
+    # para que o primeiro gráfico em produção não precise varrer as fontes do sistema
+    import matplotlib
+    inicio = time.perf_counter()
+    data = dados.read_plantio()
+    barras_aproveitamento(data, 'Cache de fontes', data['DESCRIÇÃO DO PRF']).savefig(os.devnull, format='png')
+    return matplotlib.get_cachedir(), time.perf_counter() - inicio
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Utilitários de inicialização dos gráficos')
+    parser.add_argument('--cache-fontes', action='store_true', help='Gera o cache de fontes do matplotlib')
+    args = parser.parse_args()
+
+    if args.cache_fontes:
+        cachedir, duracao = gerar_cache_fontes()
+        print(f'Cache de fontes em {cachedir} ({duracao:.2f}s). MPLCONFIGDIR={os.environ.get("MPLCONFIGDIR", "")}')
+    else:
+        parser.print_help()
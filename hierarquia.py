@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+
+# Níveis da árvore, abaixo do nó raiz com o total geral
+NIVEIS = ['DIVISÃO', 'PROJETO', 'DESCRIÇÃO DO PRF']
+MEDIDAS = ['Total (ha)', 'Plantio (ha)', 'QDE de Mudas (UND)', 'Mortalidade (Qtd.)']
+
+RAIZ = 0
+NOME_RAIZ = 'Total'
+
+
+class Arvore:
+    # Árvore Total → DIVISÃO → PROJETO → PRF em vetores, um elemento por nó. Os nós de cada nível são
+    # contíguos e os filhos de um nó ocupam o intervalo [primeiro_filho, primeiro_filho + filhos);
+    # os subtotais de todos os nós já vêm somados em "valores" (nós x medidas).
+
+    def __init__(self, nomes, nivel, pai, divisao, primeiro_filho, filhos, valores, medidas):
+        self.nomes = nomes
+        self.nivel = nivel
+        self.pai = pai
+        self.divisao = divisao
+        self.primeiro_filho = primeiro_filho
+        self.filhos = filhos
+        self.valores = valores
+        self.medidas = medidas
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def filhos_de(self, no):
+        return np.arange(self.primeiro_filho[no], self.primeiro_filho[no] + self.filhos[no])
+
+    def nos_do_nivel(self, nivel):
+        return np.flatnonzero(self.nivel == nivel)
+
+    def internos(self):
+        # Nós com filhos (os que podem ser expandidos)
+        return np.flatnonzero(self.filhos > 0).tolist()
+
+    def valor(self, medida):
+        return self.valores[:, self.medidas.index(medida)]
+
+    def visiveis(self, abertos):
+        # Nós exibidos, em pré-ordem, quando apenas os nós em "abertos" estão expandidos (a raiz sempre está)
+        visiveis, pilha = [], [RAIZ]
+        while pilha:
+            no = pilha.pop()
+            visiveis.append(no)
+            if no == RAIZ or no in abertos:
+                pilha.extend(self.filhos_de(no)[::-1].tolist())
+        return visiveis
+
+    def tabela(self, nos):
+        # Subtotais dos nós pedidos, lidos dos vetores sem reagrupar os dados
+        nos = np.asarray(nos, dtype=np.int64)
+        tabela = pd.DataFrame(self.valores[nos], columns=self.medidas)
+        tabela.insert(0, 'Nível', [NIVEIS[n - 1] if n > 0 else NOME_RAIZ for n in self.nivel[nos]])
+        tabela.insert(1, 'Nome', [self.nomes[no] for no in nos])
+        return tabela
+
+
+def _inicios(*chaves):
+    # Início de cada sequência de chaves iguais (as chaves já estão ordenadas)
+    muda = np.zeros(len(chaves[0]), dtype=bool)
+    muda[:1] = True
+    for chave in chaves:
+        muda[1:] |= chave[1:] != chave[:-1]
+    return np.flatnonzero(muda)
+
+
+def construir(data, medidas=MEDIDAS):
+    # Soma por PRF, ordenada por divisão, projeto e PRF; os subtotais de projeto e de divisão saem de
+    # np.add.reduceat sobre as faixas contíguas do nível de baixo, uma única vez por versão dos dados
+    folhas = data.groupby(NIVEIS, sort=True)[medidas].sum()
+    divisoes_folha, projetos_folha, prfs = (folhas.index.get_level_values(n).to_numpy() for n in range(3))
+    valores_folhas = folhas.to_numpy(dtype=float)
+
+    inicio_projetos = _inicios(divisoes_folha, projetos_folha)
+    inicio_divisoes_folha = _inicios(divisoes_folha)
+    # Início de cada divisão na lista de projetos
+    inicio_divisoes = np.searchsorted(inicio_projetos, inicio_divisoes_folha)
+
+    valores_projetos = np.add.reduceat(valores_folhas, inicio_projetos) if len(folhas) else np.empty((0, len(medidas)))
+    valores_divisoes = np.add.reduceat(valores_projetos, inicio_divisoes) if len(folhas) else np.empty((0, len(medidas)))
+    n_div, n_proj, n_prf = len(inicio_divisoes), len(inicio_projetos), len(prfs)
+    filhos_divisoes = np.diff(np.append(inicio_divisoes, n_proj))
+    filhos_projetos = np.diff(np.append(inicio_projetos, n_prf))
+
+    # Posição do primeiro nó de cada nível: raiz, divisões, projetos e PRFs
+    p_div, p_proj, p_prf = 1, 1 + n_div, 1 + n_div + n_proj
+    divisao_projetos = np.repeat(np.arange(n_div), filhos_divisoes)
+    divisao_prfs = np.repeat(divisao_projetos, filhos_projetos)
+
+    return Arvore(
+        nomes=[NOME_RAIZ, *divisoes_folha[inicio_divisoes_folha], *projetos_folha[inicio_projetos], *prfs],
+        nivel=np.repeat([0, 1, 2, 3], [1, n_div, n_proj, n_prf]),
+        pai=np.concatenate([[-1], np.zeros(n_div, dtype=np.int64), p_div + divisao_projetos,
+                            p_proj + np.repeat(np.arange(n_proj), filhos_projetos)]).astype(np.int64),
+        divisao=np.concatenate([[-1], np.arange(n_div), divisao_projetos, divisao_prfs]).astype(np.int64),
+        primeiro_filho=np.concatenate([[p_div], p_proj + inicio_divisoes, p_prf + inicio_projetos,
+                                       np.full(n_prf, p_prf + n_prf)]).astype(np.int64),
+        filhos=np.concatenate([[n_div], filhos_divisoes, filhos_projetos, np.zeros(n_prf, dtype=np.int64)]).astype(np.int64),
+        valores=np.vstack([valores_folhas.sum(axis=0, keepdims=True), valores_divisoes, valores_projetos, valores_folhas]),
+        medidas=list(medidas),
+    )
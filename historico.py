@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import dados
+
+
+# Diretório do histórico de versões do controle de plantio
+DIRETORIO_HISTORICO = 'historico'
+
+# Identificação de um PRF entre versões
+CHAVE_PRF = ['DIVISÃO', 'PROJETO', 'DESCRIÇÃO DO PRF']
+
+# Colunas comparadas nas diferenças entre versões
+COLUNAS_COMPARADAS = ['Total (ha)', 'Estrada(ha)', 'Vegetação Nativa(ha)', 'Plantio (ha)', 'QDE de Mudas (UND)', 'CIDADE', 'ANO']
+
+
+def diretorio_historico():
+    return os.environ.get('PLANTIO_HISTORICO', DIRETORIO_HISTORICO)
+
+
+def _hash(frame):
+    # Hash de 64 bits de cada linha, pelo conteúdo (sem o índice)
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy(dtype=np.uint64)
+
+
+class Historico:
+    # Histórico endereçado por conteúdo: cada versão guarda só um manifesto (chave do PRF e hash de cada linha,
+    # na ordem do arquivo), e as linhas ficam em lojas Parquet que recebem apenas as linhas nunca vistas antes.
+    # Um mês em que poucos PRFs mudaram custa o manifesto e as linhas alteradas.
+
+    def __init__(self, diretorio=None):
+        self.diretorio = diretorio or diretorio_historico()
+        self._indice = os.path.join(self.diretorio, 'versoes.json')
+
+    def versoes(self):
+        # Versões registradas, da mais antiga para a mais recente
+        if not os.path.exists(self._indice):
+            return []
+        with open(self._indice, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _gravar_indice(self, versoes):
+        temporario = f'{self._indice}.tmp-{os.getpid()}'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(versoes, f, ensure_ascii=False, indent=1)
+        os.replace(temporario, self._indice)
+
+    def _caminho(self, tipo, versao):
+        return os.path.join(self.diretorio, tipo, f'{versao}.parquet')
+
+    def manifesto(self, versao):
+        return pd.read_parquet(self._caminho('manifestos', versao))
+
+    def registrar(self, file_path=None, rotulo=None):
+        # Registra o CSV como nova versão; um arquivo já registrado não é gravado de novo
+        file_path = file_path or dados.caminho_csv()
+        versao = dados.versao_dados(file_path)
+        versoes = self.versoes()
+        if any(v['versao'] == versao for v in versoes):
+            return next(v for v in versoes if v['versao'] == versao)
+
+        data = dados.read_plantio(file_path)
+        linhas = data[[coluna for coluna in data.columns if coluna not in dados.DERIVADAS]].reset_index(drop=True)
+        hashes = _hash(linhas)
+
+        # Linhas que nenhuma versão anterior guardou (hash join com os manifestos existentes)
+        conhecidos = pd.concat([self.manifesto(v['versao'])[['hash', 'loja']] for v in versoes]) if versoes else None
+        lojas = pd.Series(versao, index=range(len(linhas)), dtype=object)
+        novas = np.ones(len(linhas), dtype=bool)
+        if conhecidos is not None:
+            conhecidos = conhecidos.drop_duplicates('hash').set_index('hash')['loja']
+            existentes = pd.Series(hashes).map(conhecidos)
+            novas = existentes.isna().to_numpy()
+            lojas[~novas] = existentes[~novas]
+
+        os.makedirs(os.path.join(self.diretorio, 'lojas'), exist_ok=True)
+        os.makedirs(os.path.join(self.diretorio, 'manifestos'), exist_ok=True)
+        if novas.any():
+            loja = linhas[novas].assign(hash=hashes[novas]).drop_duplicates('hash')
+            loja.to_parquet(self._caminho('lojas', versao), index=False)
+        pd.DataFrame({
+            'chave': _hash(linhas[CHAVE_PRF]),
+            'hash': hashes,
+            'loja': lojas.to_numpy(),
+        }).to_parquet(self._caminho('manifestos', versao), index=False)
+
+        registro = {
+            'versao': versao,
+            'rotulo': rotulo or os.path.basename(file_path),
+            'registrado_em': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'linhas': int(len(linhas)),
+            'linhas_novas': int(novas.sum()),
+        }
+        self._gravar_indice(versoes + [registro])
+        return registro
+
+    def _linhas(self, manifesto):
+        # Linhas do manifesto, lidas só das lojas que as contêm, na ordem do manifesto
+        partes = []
+        for loja, hashes in manifesto.groupby('loja', sort=False)['hash']:
+            partes.append(pd.read_parquet(self._caminho('lojas', loja), filters=[('hash', 'in', list(pd.unique(hashes)))]))
+        lojas = pd.concat(partes, ignore_index=True).drop_duplicates('hash').set_index('hash')
+        return lojas.loc[manifesto['hash'].to_numpy()].reset_index(drop=True)
+
+    def reconstruir(self, versao):
+        # Frame da versão, igual ao read_plantio do CSV original
+        return dados.derivar(self._linhas(self.manifesto(versao)))
+
+    def diferencas(self, anterior, atual):
+        # PRFs novos, removidos e alterados entre duas versões. A classificação é um join pelos hashes dos
+        # manifestos; só as linhas alteradas são lidas das lojas para mostrar o que mudou.
+        antes = self.manifesto(anterior).drop_duplicates('chave')
+        depois = self.manifesto(atual).drop_duplicates('chave')
+        novos = depois[~depois['chave'].isin(antes['chave'])]
+        removidos = antes[~antes['chave'].isin(depois['chave'])]
+        comuns = depois.merge(antes, on='chave', suffixes=('', '_anterior'))
+        alterados = comuns[comuns['hash'] != comuns['hash_anterior']]
+
+        linhas_novas = self._linhas(novos) if len(novos) else None
+        linhas_removidas = self._linhas(removidos) if len(removidos) else None
+
+        mudancas = pd.DataFrame()
+        if len(alterados):
+            depois_linhas = self._linhas(alterados[['hash', 'loja']])
+            antes_linhas = self._linhas(alterados[['hash_anterior', 'loja_anterior']].set_axis(['hash', 'loja'], axis=1))
+            mudancas = depois_linhas[CHAVE_PRF].copy()
+            campos = np.full(len(mudancas), '', dtype=object)
+            for coluna in COLUNAS_COMPARADAS:
+                if coluna not in depois_linhas.columns:
+                    continue
+                antes_coluna, depois_coluna = antes_linhas[coluna], depois_linhas[coluna]
+                mudou = (antes_coluna.ne(depois_coluna) & ~(antes_coluna.isna() & depois_coluna.isna())).to_numpy()
+                campos[mudou] = np.where(campos[mudou] == '', coluna, campos[mudou] + ', ' + coluna)
+                mudancas[f'{coluna} (anterior)'] = antes_linhas[coluna].to_numpy()
+                mudancas[coluna] = depois_linhas[coluna].to_numpy()
+                if pd.api.types.is_numeric_dtype(depois_linhas[coluna]):
+                    mudancas[f'{coluna} (variação)'] = depois_linhas[coluna].to_numpy() - antes_linhas[coluna].to_numpy()
+            mudancas.insert(len(CHAVE_PRF), 'Campos Alterados', campos)
+
+        vazio = pd.DataFrame(columns=CHAVE_PRF)
+        return {
+            'novos': linhas_novas if linhas_novas is not None else vazio,
+            'removidos': linhas_removidas if linhas_removidas is not None else vazio,
+            'alterados': mudancas if len(mudancas) else vazio,
+        }
+
+    def tamanho(self):
+        # Bytes ocupados pelo histórico
+        return sum(os.path.getsize(os.path.join(raiz, nome)) for raiz, _, nomes in os.walk(self.diretorio) for nome in nomes)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Histórico de versões do controle de plantio')
+    comandos = parser.add_subparsers(dest='comando', required=True)
+    registrar = comandos.add_parser('registrar', help='Registra um CSV como nova versão')
+    registrar.add_argument('csv', nargs='*', help='Arquivos CSV, do mais antigo para o mais recente (padrão: PLANTIO_CSV)')
+    comandos.add_parser('listar', help='Lista as versões registradas')
+    diferencas = comandos.add_parser('diff', help='Diferenças entre duas versões (padrão: as duas mais recentes)')
+    diferencas.add_argument('versoes', nargs='*')
+    args = parser.parse_args()
+
+    historico = Historico()
+    if args.comando == 'registrar':
+        for caminho in args.csv or [None]:
+            registro = historico.registrar(caminho)
+            print(f"{registro['versao']} {registro['rotulo']}: {registro['linhas']} linhas, {registro['linhas_novas']} novas")
+        print(f'Histórico com {len(historico.versoes())} versões, {historico.tamanho() / 1024:.0f} KB')
+    elif args.comando == 'listar':
+        for registro in historico.versoes():
+            print(f"{registro['versao']} {registro['registrado_em']} {registro['rotulo']} ({registro['linhas']} linhas, {registro['linhas_novas']} novas)")
+    else:
+        anterior, atual = args.versoes or [v['versao'] for v in historico.versoes()[-2:]]
+        inicio = time.perf_counter()
+        resultado = historico.diferencas(anterior, atual)
+        for nome, tabela in resultado.items():
+            print(f'{nome}: {len(tabela)}')
+            if len(tabela):
+                print(tabela.to_string())
+        print(f'{time.perf_counter() - inicio:.3f}s')
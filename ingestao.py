@@ -0,0 +1,165 @@
+import argparse
+import os
+import resource
+import time
+
+import pandas as pd
+
+import dados
+import vistorias
+
+
+# Linhas lidas do CSV por bloco; a memória de pico depende deste valor e não do tamanho do arquivo
+LINHAS_POR_BLOCO = 100_000
+
+# A partir deste tamanho (MB) o app lê o CSV em blocos em vez de carregá-lo de uma vez
+LIMITE_LEITURA_DIRETA_MB = 256
+
+# Colunas numéricas gravadas sempre como float64, para que todos os blocos tenham o mesmo schema
+# (um bloco sem valores faltantes seria lido como inteiro e outro, com NaN, como float)
+COLUNAS_FLOAT = ['ANO']
+
+# Agregados acumulados na leitura em blocos que o app usa no lugar dos calculados sobre o frame (painel.agregado);
+# os dois últimos são Series, guardadas como tabelas de uma coluna
+AGREGADOS = ('divisoes', 'uso_do_solo', 'projetos', 'aproveitamento', 'contagem_divisoes')
+AGREGADOS_SERIES = ('aproveitamento', 'contagem_divisoes')
+
+
+def limite_leitura_direta():
+    return int(os.environ.get('PLANTIO_INGESTAO_MB', LIMITE_LEITURA_DIRETA_MB)) * 1024 * 1024
+
+
+def usar_blocos(file_path=None):
+    # Arquivos grandes são lidos em blocos
+    return os.path.getsize(file_path or dados.caminho_csv()) > limite_leitura_direta()
+
+
+def taxas_observadas(file_path=None, linhas_por_bloco=LINHAS_POR_BLOCO):
+    # Primeira passada: as taxas de mortalidade das vistorias por PRF e por projeto sobre o arquivo inteiro.
+    # Um PRF sem vistoria usa a taxa do projeto, que depende dos PRFs vistoriados de todos os blocos. Só as
+    # colunas de PRF das linhas vistoriadas ficam em memória.
+    registros = vistorias.ler_vistorias()
+    if registros is None:
+        return None
+    vistoriados = set(registros['DESCRIÇÃO DO PRF'])
+    partes = []
+    colunas = lambda coluna: coluna.strip() in vistorias.COLUNAS_PRF  # noqa: E731
+    for bloco in pd.read_csv(file_path or dados.caminho_csv(), chunksize=linhas_por_bloco, usecols=colunas):
+        bloco.columns = bloco.columns.str.strip()
+        bloco = bloco[bloco['DIVISÃO'] != 'TOTAL']
+        prf = bloco['DESCRIÇÃO DO PRF'].str.strip()
+        partes.append(bloco.assign(**{'DESCRIÇÃO DO PRF': prf})[prf.isin(vistoriados)])
+    return vistorias.taxas_observadas(pd.concat(partes, ignore_index=True), registros) if partes else None
+
+
+def ler_em_blocos(file_path=None, linhas_por_bloco=LINHAS_POR_BLOCO):
+    # Blocos já limpos, com as mesmas colunas derivadas do read_plantio. Em vez de remover a última
+    # linha do arquivo (que só é conhecida no fim), descarta as linhas de totais (DIVISÃO == 'TOTAL').
+    observadas = taxas_observadas(file_path, linhas_por_bloco)
+    for bloco in pd.read_csv(file_path or dados.caminho_csv(), chunksize=linhas_por_bloco):
+        bloco = bloco[bloco['DIVISÃO'] != 'TOTAL']
+        if bloco.empty:
+            continue
+        bloco = dados.limpar(bloco, observadas)
+        for coluna in COLUNAS_FLOAT:
+            if coluna in bloco.columns:
+                bloco[coluna] = bloco[coluna].astype('float64')
+        yield bloco
+
+
+class Agregados:
+    # Agregados acumulados bloco a bloco: cada bloco é resumido e somado aos totais parciais,
+    # então a memória usada depende do número de grupos e não do número de linhas
+
+    def __init__(self):
+        self.linhas = 0
+        self._divisoes = None
+        self._projetos = None
+        self._aproveitamento = None
+        self._contagem = None
+
+    def adicionar(self, bloco):
+        self.linhas += len(bloco)
+        colunas = ['Total (ha)', 'QDE de Mudas (UND)', 'Mortalidade (Qtd.)'] + [c for c in dados.COLUNAS_USO_DO_SOLO if c != 'Total (ha)']
+        self._divisoes = _somar(self._divisoes, bloco.groupby('DIVISÃO')[colunas].sum(), sort=True)
+        self._projetos = _somar(self._projetos, dados.project_summary(bloco), sort=False)
+        self._aproveitamento = _somar(self._aproveitamento, bloco['Classe de Aproveitamento'].value_counts(), sort=False)
+        self._contagem = _somar(self._contagem, bloco['DIVISÃO'].value_counts(), sort=False)
+
+    @property
+    def divisoes(self):
+        # Mesmo resultado de dados.division_summary
+        return self._divisoes[['Total (ha)', 'QDE de Mudas (UND)', 'Mortalidade (Qtd.)']]
+
+    @property
+    def uso_do_solo(self):
+        # Mesmo resultado de dados.land_use
+        return self._divisoes[dados.COLUNAS_USO_DO_SOLO]
+
+    @property
+    def projetos(self):
+        # Mesmo resultado de dados.project_summary
+        return self._projetos
+
+    @property
+    def aproveitamento(self):
+        # Mesmo resultado de dados.aproveitamento_counts
+        return self._aproveitamento.sort_values(ascending=False, kind='stable')
+
+    @property
+    def contagem_divisoes(self):
+        # Mesmo resultado de data['DIVISÃO'].value_counts()
+        return self._contagem.sort_values(ascending=False, kind='stable')
+
+    def tabelas(self):
+        # Agregados como tabelas, para serem guardados ao lado do Parquet
+        return {nome: getattr(self, nome).to_frame() if nome in AGREGADOS_SERIES else getattr(self, nome) for nome in AGREGADOS}
+
+
+def _somar(acumulado, parcial, sort):
+    if acumulado is None:
+        return parcial
+    niveis = list(range(parcial.index.nlevels))
+    return pd.concat([acumulado, parcial]).groupby(level=niveis, sort=sort).sum()
+
+
+def ingerir(file_path=None, destino=None, linhas_por_bloco=LINHAS_POR_BLOCO):
+    # Lê o CSV em blocos, acumula os agregados e, se houver destino, grava as linhas limpas em Parquet
+    # (um row group por bloco). Nenhum bloco é mantido em memória depois de processado.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    agregados = Agregados()
+    writer = None
+    try:
+        for bloco in ler_em_blocos(file_path, linhas_por_bloco):
+            agregados.adicionar(bloco)
+            if destino is None:
+                continue
+            if writer is None:
+                schema = pa.Schema.from_pandas(bloco, preserve_index=False)
+                writer = pq.ParquetWriter(destino, schema)
+            writer.write_table(pa.Table.from_pandas(bloco, schema=schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+    return agregados
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Ingestão em blocos do CSV de plantio, com memória limitada')
+    parser.add_argument('--csv', help='Arquivo CSV (padrão: PLANTIO_CSV ou o arquivo do repositório)')
+    parser.add_argument('--destino', help='Arquivo Parquet com as linhas limpas')
+    parser.add_argument('--linhas-por-bloco', type=int, default=LINHAS_POR_BLOCO)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    agregados = ingerir(args.csv, args.destino, args.linhas_por_bloco)
+    duracao = time.perf_counter() - inicio
+
+    print(agregados.divisoes.to_string())
+    print()
+    print(agregados.projetos.to_string())
+    print()
+    # ru_maxrss é informado em KB no Linux
+    print(f'{agregados.linhas} linhas em {duracao:.2f}s, pico de memória {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB')
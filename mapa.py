@@ -0,0 +1,143 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# Coordenadas (latitude, longitude) das sedes dos municípios presentes no controle de plantio
+COORDENADAS_CIDADES = {
+    'São Miguel do Gostoso/RN': (-5.1232, -35.6355),
+    'Riachuelo/RN': (-5.8216, -35.8222),
+}
+
+# Arquivo opcional com as coordenadas de cada PRF (colunas DESCRIÇÃO DO PRF, LATITUDE, LONGITUDE)
+CAMINHO_COORDENADAS_PRF = 'coordenadas_prf.csv'
+
+# Métricas disponíveis no mapa: coluna agregada e cor (RGB) da camada
+METRICAS_MAPA = {
+    'Plantio (ha)': [106, 177, 135],
+    'QDE de Mudas (UND)': [72, 138, 153],
+    'Mortalidade (Qtd.)': [234, 106, 71],
+}
+
+# Raio, em metros, do maior círculo de cidade e altura da coluna hexagonal mais alta
+RAIO_MAXIMO_M = 6000
+ALTURA_MAXIMA_M = 3000
+
+RAIO_TERRA_M = 6371008.8
+
+
+def _escala(valores, maximo):
+    # Escala proporcional à raiz quadrada (área do círculo proporcional ao valor)
+    valores = np.sqrt(np.clip(valores, 0, None))
+    topo = valores.max() if len(valores) else 0
+    return valores / topo * maximo if topo > 0 else np.zeros_like(valores)
+
+
+def _tooltip(frame):
+    # Texto da dica pré-formatado para não depender de formatação no navegador
+    return (
+        '<b>' + frame['NOME'] + '</b>'
+        + '<br/>PRFs: ' + frame['PRFs'].astype(str)
+        + '<br/>Plantio: ' + frame['Plantio (ha)'].map('{:.2f} ha'.format)
+        + '<br/>Mudas: ' + frame['QDE de Mudas (UND)'].map('{:,.0f}'.format)
+        + '<br/>Mortalidade: ' + frame['Mortalidade (Qtd.)'].map('{:,.0f}'.format)
+    )
+
+
+def _agregar(data, chave):
+    return data.groupby(chave, sort=False).agg(**{
+        'PRFs': ('DESCRIÇÃO DO PRF', 'count'),
+        'Plantio (ha)': ('Plantio (ha)', 'sum'),
+        'QDE de Mudas (UND)': ('QDE de Mudas (UND)', 'sum'),
+        'Mortalidade (Qtd.)': ('Mortalidade (Qtd.)', 'sum'),
+    })
+
+
+def _registros(frame, tamanho):
+    # Converte a camada em registros prontos para o pydeck, com o tamanho de cada métrica já calculado
+    frame = frame.copy()
+    frame['tooltip'] = _tooltip(frame)
+    for metrica in METRICAS_MAPA:
+        frame['escala_' + metrica] = _escala(frame[metrica].to_numpy(dtype=float), tamanho)
+    return frame.to_dict('records')
+
+
+def totais_cidades(data):
+    # Totais por CIDADE
+    return _agregar(data, 'CIDADE')
+
+
+def camada_cidades(data):
+    # Totais por CIDADE posicionados na sede do município
+    cidades = totais_cidades(data).reset_index()
+    coordenadas = cidades['CIDADE'].map(COORDENADAS_CIDADES)
+    cidades = cidades[coordenadas.notna()].copy()
+    cidades['lat'] = [c[0] for c in coordenadas.dropna()]
+    cidades['lon'] = [c[1] for c in coordenadas.dropna()]
+    cidades['NOME'] = cidades['CIDADE']
+    return _registros(cidades, RAIO_MAXIMO_M)
+
+
+def cidades_sem_coordenadas(data):
+    return sorted(set(data['CIDADE'].dropna()) - set(COORDENADAS_CIDADES))
+
+
+def read_coordenadas_prf(file_path=CAMINHO_COORDENADAS_PRF):
+    # Coordenadas por PRF são opcionais; sem o arquivo o mapa mostra apenas as cidades
+    if not os.path.exists(file_path):
+        return None
+    coordenadas = pd.read_csv(file_path)
+    coordenadas['DESCRIÇÃO DO PRF'] = coordenadas['DESCRIÇÃO DO PRF'].str.strip()
+    return coordenadas[['DESCRIÇÃO DO PRF', 'LATITUDE', 'LONGITUDE']].dropna()
+
+
+def hex_bins(lat, lon, raio_m):
+    # Agrupa pontos em hexágonos (orientação "pointy") de raio raio_m, em projeção equirretangular local
+    lat0 = np.radians(np.mean(lat))
+    x = np.radians(lon) * np.cos(lat0) * RAIO_TERRA_M
+    y = np.radians(lat) * RAIO_TERRA_M
+
+    # Coordenadas axiais fracionárias
+    q = (np.sqrt(3) / 3 * x - y / 3) / raio_m
+    r = (2 / 3 * y) / raio_m
+
+    # Arredondamento cúbico para o hexágono mais próximo
+    s = -q - r
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    ajusta_q = (dq > dr) & (dq > ds)
+    ajusta_r = ~ajusta_q & (dr > ds)
+    rq = np.where(ajusta_q, -rr - rs, rq)
+    rr = np.where(ajusta_r, -rq - rs, rr)
+
+    # Centro de cada hexágono de volta em latitude/longitude
+    cx = raio_m * np.sqrt(3) * (rq + rr / 2)
+    cy = raio_m * 1.5 * rr
+    centro_lat = np.degrees(cy / RAIO_TERRA_M)
+    centro_lon = np.degrees(cx / (RAIO_TERRA_M * np.cos(lat0)))
+    return rq.astype(np.int64), rr.astype(np.int64), centro_lat, centro_lon
+
+
+def camada_hexagonos(data, coordenadas, raio_m=500):
+    # Totais por hexágono a partir das coordenadas de cada PRF
+    pontos = data.merge(coordenadas, on='DESCRIÇÃO DO PRF', how='inner')
+    if pontos.empty:
+        return []
+
+    q, r, centro_lat, centro_lon = hex_bins(pontos['LATITUDE'].to_numpy(float), pontos['LONGITUDE'].to_numpy(float), raio_m)
+    pontos['hex_q'], pontos['hex_r'] = q, r
+    pontos['lat'], pontos['lon'] = centro_lat, centro_lon
+
+    hexagonos = _agregar(pontos, ['hex_q', 'hex_r'])
+    centros = pontos.groupby(['hex_q', 'hex_r'], sort=False)[['lat', 'lon']].first()
+    nomes = pontos.groupby(['hex_q', 'hex_r'], sort=False)['DESCRIÇÃO DO PRF'].agg(lambda prfs: ', '.join(prfs[:3]) + (' ...' if len(prfs) > 3 else ''))
+    hexagonos = hexagonos.join(centros).reset_index()
+    hexagonos['NOME'] = nomes.to_numpy()
+    return _registros(hexagonos, ALTURA_MAXIMA_M)
+
+
+def centro_mapa(registros):
+    if not registros:
+        return -5.4, -35.7
+    return float(np.mean([r['lat'] for r in registros])), float(np.mean([r['lon'] for r in registros]))
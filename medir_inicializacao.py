@@ -0,0 +1,55 @@
+import argparse
+import json
+import subprocess
+import sys
+
+
+# Orçamento de inicialização, em segundos, para cada etapa medida em um processo novo
+ORCAMENTO = {
+    'imports': 1.5,
+    'dados': 0.5,
+    'matplotlib': 1.0,
+    'primeiro_grafico': 1.0,
+}
+
+# Executado em um processo separado para que nenhum módulo já esteja importado
+MEDICAO = r'''
+import json, sys, time
+t0 = time.perf_counter()
+import streamlit, pandas, numpy
+import dados
+t1 = time.perf_counter()
+data = dados.read_plantio()
+t2 = time.perf_counter()
+assert 'matplotlib' not in sys.modules, 'matplotlib importado antes do primeiro gráfico'
+import graficos
+t3 = time.perf_counter()
+import io
+fig = graficos.barras_aproveitamento(data, 'Percentual de Aproveitamento', data['DESCRIÇÃO DO PRF'])
+fig.savefig(io.BytesIO(), format='png')
+t4 = time.perf_counter()
+print(json.dumps({'imports': t1 - t0, 'dados': t2 - t1, 'matplotlib': t3 - t2, 'primeiro_grafico': t4 - t3}))
+'''
+
+
+def medir():
+    saida = subprocess.run([sys.executable, '-c', MEDICAO], capture_output=True, text=True, check=True)
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Mede o tempo de inicialização do dashboard e compara com o orçamento')
+    parser.add_argument('--repeticoes', type=int, default=3, help='Número de processos medidos (usa a mediana)')
+    args = parser.parse_args()
+
+    medicoes = [medir() for _ in range(args.repeticoes)]
+    estourou = False
+    print(f"{'Etapa':<18}{'Mediana (s)':>12}{'Orçamento (s)':>15}")
+    for etapa, limite in ORCAMENTO.items():
+        valores = sorted(m[etapa] for m in medicoes)
+        mediana = valores[len(valores) // 2]
+        marca = '' if mediana <= limite else '  <-- acima do orçamento'
+        estourou |= mediana > limite
+        print(f'{etapa:<18}{mediana:>12.3f}{limite:>15.2f}{marca}')
+
+    sys.exit(1 if estourou else 0)
@@ -0,0 +1,50 @@
+import streamlit as st
+
+import dados
+from painel import agregado, dados_divisao, exportar, mostrar_figura, rotulos_prf, secao_carbono, secao_densidade, titulo_secao
+
+
+assetco_data = dados_divisao('ASSETco')
+
+st.title("Dashboard de Plantio - ASSETco")
+st.write("Visualização dos dados de plantio para a divisão ASSETco.")
+
+# Gráfico de Barras Empilhadas - Percentual de Aproveitamento das Áreas de Plantio
+titulo_secao("Percentual de Aproveitamento das Áreas de Plantio por PRF - ASSETco")
+
+plot_data_assetco = assetco_data[['DESCRIÇÃO DO PRF', 'Plantio (%)', 'Área Sem Plantio (%)']].copy()
+plot_data_assetco.set_index('DESCRIÇÃO DO PRF', inplace=True)
+plot_data_assetco.sort_values('Plantio (%)', inplace=True)
+
+# Criar a visualização
+mostrar_figura('assetco/aproveitamento_prf', lambda graficos: graficos.barras_aproveitamento(
+    plot_data_assetco, 'ASSETco - Percentual de Aproveitamento das Áreas de Plantio por PRF',
+    rotulos_prf(plot_data_assetco.index, 'assetco'), fonte_rotulos=8, taxa_mortalidade=dados.taxa_mortalidade_media(assetco_data),
+), ('ASSETco',))
+
+# ------------------------------------------------------------------------------------------------------------
+
+# Gráficos de Barras - Resumo das Áreas de Plantio
+titulo_secao("Resumo das Áreas de Plantio - ASSETco")
+
+# Copiar e configurar os dados
+summary_data_assetco = assetco_data[['DESCRIÇÃO DO PRF', 'Plantio (ha)', 'QDE de Mudas (UND)', 'Mortalidade (Qtd.)']].copy()
+summary_data_assetco.set_index('DESCRIÇÃO DO PRF', inplace=True)
+
+mostrar_figura('assetco/resumo_prf', lambda graficos: graficos.resumo_prf(
+    summary_data_assetco, 'ASSETco - RESUMO DAS ÁREAS DE PLANTIO POR PRF',
+    rotulos_prf(summary_data_assetco.index, 'assetco'), fonte_rotulos=7,
+), ('ASSETco',))
+
+analise_densidade_assetco = secao_densidade("ASSETco")
+
+projecao_carbono_assetco = secao_carbono("ASSETco")
+
+exportar("assetco", {
+    'Linhas': lambda: assetco_data,
+    'Totais por projeto': lambda: agregado('projetos', lambda: dados.project_summary(assetco_data), ('ASSETco',)),
+    'Uso do solo': lambda: agregado('uso_do_solo', lambda: dados.land_use(assetco_data), ('ASSETco',)),
+    'Densidade': lambda: analise_densidade_assetco,
+    'Carbono por projeto': lambda: projecao_carbono_assetco['projetos'],
+    'Carbono por PRF': lambda: projecao_carbono_assetco['prfs'],
+})
@@ -0,0 +1,48 @@
+import streamlit as st
+
+import dados
+from painel import agregado, dados_divisao, exportar, mostrar_figura, rotulos_prf, secao_carbono, secao_densidade, titulo_secao
+
+
+devco_data = dados_divisao('DEVco')
+
+st.title("Dashboard de Plantio - DEVco")
+st.write("Visualização dos dados de plantio para a divisão DEVco.")
+
+# Gráfico de Barras Empilhadas - Percentual de Aproveitamento das Áreas de Plantio
+titulo_secao("Percentual de Aproveitamento das Áreas de Plantio por PRF - DEVco")
+
+plot_data_devco = devco_data[['DESCRIÇÃO DO PRF', 'Plantio (%)', 'Área Sem Plantio (%)']].copy()
+plot_data_devco.set_index('DESCRIÇÃO DO PRF', inplace=True)
+plot_data_devco.sort_values('Plantio (%)', inplace=True)
+
+# Criar a visualização
+mostrar_figura('devco/aproveitamento_prf', lambda graficos: graficos.barras_aproveitamento(
+    plot_data_devco, 'DEVco - Percentual de Aproveitamento das Áreas de Plantio por PRF',
+    rotulos_prf(plot_data_devco.index, 'quebra_em_15'), legenda_y=-0.15, taxa_mortalidade=dados.taxa_mortalidade_media(devco_data),
+), ('DEVco',))
+
+# ----------------------------------------------------------------------------------------
+
+# Gráficos de Barras - Resumo das Áreas de Plantio
+titulo_secao("Resumo das Áreas de Plantio - DEVco")
+
+summary_data_devco = devco_data[['DESCRIÇÃO DO PRF', 'Plantio (ha)', 'QDE de Mudas (UND)', 'Mortalidade (Qtd.)']].copy()
+summary_data_devco.set_index('DESCRIÇÃO DO PRF', inplace=True)
+
+mostrar_figura('devco/resumo_prf', lambda graficos: graficos.resumo_prf(
+    summary_data_devco, 'DEVco - RESUMO DAS ÁREAS DE PLANTIO POR PRF', summary_data_devco.index,
+), ('DEVco',))
+
+analise_densidade_devco = secao_densidade("DEVco")
+
+projecao_carbono_devco = secao_carbono("DEVco")
+
+exportar("devco", {
+    'Linhas': lambda: devco_data,
+    'Totais por projeto': lambda: agregado('projetos', lambda: dados.project_summary(devco_data), ('DEVco',)),
+    'Uso do solo': lambda: agregado('uso_do_solo', lambda: dados.land_use(devco_data), ('DEVco',)),
+    'Densidade': lambda: analise_densidade_devco,
+    'Carbono por projeto': lambda: projecao_carbono_devco['projetos'],
+    'Carbono por PRF': lambda: projecao_carbono_devco['prfs'],
+})
@@ -0,0 +1,43 @@
+import streamlit as st
+
+import explorador
+from painel import contexto, exportar
+
+
+versao, escopo, data = contexto().versao, contexto().escopo, contexto().data
+
+st.title("Dashboard de Plantio - Explorador")
+st.write("Tabela dinâmica de uma medida pelas dimensões escolhidas nas linhas e nas colunas.")
+
+# Dimensões convertidas em categorias uma vez por versão dos dados e escopo
+@st.cache_data
+def dados_categoricos(versao, escopo, _data):
+    return explorador.categorizar(_data)
+
+# Cada combinação de dimensões, medida e filtros é calculada uma única vez
+@st.cache_data
+def tabela_dinamica(versao, escopo, linhas, colunas, medida, filtros):
+    return explorador.pivotar(dados_categoricos(versao, escopo, data), linhas, colunas, medida, dict(filtros))
+
+col1, col2, col3 = st.columns(3)
+linhas = col1.multiselect("Linhas", explorador.DIMENSOES, default=['PROJETO'])
+colunas = col2.multiselect("Colunas", [d for d in explorador.DIMENSOES if d not in linhas], default=[])
+medida = col3.selectbox("Medida", explorador.medidas(), index=explorador.medidas().index('Plantio (ha)'))
+
+with st.expander("Filtros"):
+    categorias = dados_categoricos(versao, escopo, data)
+    filtros = tuple(
+        (dimensao, tuple(st.multiselect(dimensao, list(categorias[dimensao].cat.categories), key=f"explorador_filtro_{dimensao}")))
+        for dimensao in explorador.DIMENSOES
+    )
+
+if not linhas:
+    st.info("Escolha ao menos uma dimensão para as linhas.")
+else:
+    tabela = tabela_dinamica(versao, escopo, tuple(linhas), tuple(colunas), medida, filtros)
+    formato = '{:,.0f}' if medida in ('PRFs', 'QDE de Mudas (UND)', 'Mortalidade (Qtd.)') else '{:,.2f}'
+    st.dataframe(tabela.style.format(formato, na_rep='-'), use_container_width=True)
+
+    exportar("explorador", {
+        'Tabela dinâmica': lambda: explorador.achatar(tabela),
+    })
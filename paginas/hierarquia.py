@@ -0,0 +1,54 @@
+import streamlit as st
+
+import hierarquia
+from painel import contexto, exportar, mostrar_figura, titulo_secao
+
+
+versao, escopo, data = contexto().versao, contexto().escopo, contexto().data
+
+st.title("Dashboard de Plantio - Hierarquia")
+st.write("Divisões, projetos e PRFs em árvore, com os subtotais de cada nível.")
+
+# Árvore com os subtotais de todos os nós, montada uma vez por versão dos dados e escopo
+@st.cache_resource
+def arvore_plantio(versao, escopo, _data):
+    return hierarquia.construir(_data)
+
+arvore = arvore_plantio(versao, escopo, data)
+medida = st.radio("Medida", hierarquia.MEDIDAS, index=hierarquia.MEDIDAS.index('Plantio (ha)'), horizontal=True)
+mostrar_figura(f'hierarquia/{medida}', lambda graficos: graficos.sunburst(
+    arvore, medida, f'{medida} por divisão, projeto e PRF',
+))
+
+titulo_secao("Subtotais")
+
+# Nós expandidos desta sessão; expandir ou recolher só lê os subtotais já calculados
+abertos = st.session_state.setdefault('hierarquia_abertos', set())
+
+def alternar(no):
+    abertos.symmetric_difference_update({no})
+
+col1, col2, _ = st.columns([1, 1, 4])
+if col1.button("Expandir tudo"):
+    abertos.update(arvore.internos())
+if col2.button("Recolher tudo"):
+    abertos.clear()
+
+visiveis = arvore.visiveis(abertos)
+tabela = arvore.tabela(visiveis)
+larguras = [1, 6, 2, 2, 2, 2]
+for coluna, titulo in zip(st.columns(larguras)[1:], ['Nome', *hierarquia.MEDIDAS]):
+    coluna.markdown(f"**{titulo}**")
+for no, (_, linha) in zip(visiveis, tabela.iterrows()):
+    colunas = st.columns(larguras)
+    if no != hierarquia.RAIZ and arvore.filhos[no] > 0:
+        colunas[0].button("▾" if no in abertos else "▸", key=f"hierarquia_{no}", on_click=alternar, args=(no,))
+    recuo = "&nbsp;" * 4 * int(arvore.nivel[no])
+    colunas[1].markdown(f"{recuo}{'**' + linha['Nome'] + '**' if arvore.nivel[no] < 3 else linha['Nome']}")
+    for coluna, medida_linha in zip(colunas[2:], hierarquia.MEDIDAS):
+        coluna.write(f"{linha[medida_linha]:,.2f}")
+
+exportar("hierarquia", {
+    'Nós exibidos': lambda: tabela,
+    'Árvore completa': lambda: arvore.tabela(range(len(arvore))),
+})
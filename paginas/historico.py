@@ -0,0 +1,38 @@
+import streamlit as st
+
+import historico
+from painel import contexto, exportar, titulo_secao
+
+
+escopo = contexto().escopo
+
+st.title("Dashboard de Plantio - Histórico")
+st.write("PRFs novos, removidos e alterados entre duas versões do controle de plantio.")
+
+# Versões já registradas não mudam: cada par é comparado uma única vez
+@st.cache_data
+def diferencas_versoes(anterior, atual):
+    return historico.Historico().diferencas(anterior, atual)
+
+versoes = historico.Historico().versoes()
+if len(versoes) < 2:
+    st.info("Registre ao menos duas versões do CSV com `python historico.py registrar <arquivo.csv>` para comparar.")
+else:
+    rotulos_versoes = {v['versao']: f"{v['rotulo']} ({v['registrado_em'][:10]})" for v in versoes}
+    col1, col2 = st.columns(2)
+    anterior = col1.selectbox("Versão anterior", list(rotulos_versoes), index=len(versoes) - 2, format_func=rotulos_versoes.get)
+    atual = col2.selectbox("Versão atual", list(rotulos_versoes), index=len(versoes) - 1, format_func=rotulos_versoes.get)
+
+    # Apenas os PRFs das divisões do usuário
+    diferencas = {nome: tabela[tabela['DIVISÃO'].isin(escopo)] for nome, tabela in diferencas_versoes(anterior, atual).items()}
+    for coluna, (nome, tabela) in zip(st.columns(3), diferencas.items()):
+        coluna.metric(f"PRFs {nome}", len(tabela))
+
+    for nome, tabela in diferencas.items():
+        if len(tabela):
+            titulo_secao(f"PRFs {nome}")
+            st.dataframe(tabela, hide_index=True, use_container_width=True)
+
+    exportar("historico", {
+        f'PRFs {nome}': (lambda tabela=tabela: tabela) for nome, tabela in diferencas.items()
+    })
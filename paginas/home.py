@@ -0,0 +1,133 @@
+import streamlit as st
+import pandas as pd
+
+import dados
+from painel import agregado, contexto, exportar, mostrar_figura, rotulos_prf, titulo_secao
+
+
+data = contexto().data
+
+st.title("Dashboard de Plantio - Home")
+st.write("Visualização geral dos dados de plantio.")
+
+# Gráfico 1: Percentual de Aproveitamento das Áreas de Plantio por PRF
+titulo_secao("Percentual de Aproveitamento das Áreas de Plantio por PRF")
+
+def grafico_aproveitamento_prf(graficos):
+    # Preparar os dados para plotagem
+    plot_data = data[['DESCRIÇÃO DO PRF', 'Plantio (%)', 'Área Sem Plantio (%)']].copy()
+    plot_data.set_index('DESCRIÇÃO DO PRF', inplace=True)
+    plot_data.sort_values('Plantio (%)', inplace=True)
+
+    return graficos.barras_aproveitamento(
+        plot_data, 'Percentual de Aproveitamento das Áreas de Plantio por PRF',
+        rotulos_prf(plot_data.index, 'home'),
+        figsize=(20, 12), bar_width=0.975, rotacao=90, fonte_rotulos=8, fonte_valores=8, legenda_y=-0.15, ajustar_layout=False,
+        taxa_mortalidade=dados.taxa_mortalidade_media(data),
+    )
+
+mostrar_figura('home/aproveitamento_prf', grafico_aproveitamento_prf)
+
+# ------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Gráfico 2: Resumo das Áreas de Plantio
+titulo_secao("Resumo das Áreas de Plantio")
+
+# Dados para o resumo
+summary_data = pd.DataFrame({
+    'DESCRIÇÃO DO PRF': ['CE - RVE', 'ASV COMPLEMENTAR - RDV', 'BAY DE CONEXÃO - RDV', 'CO SE - RVE', 'CO SJ23 - RDV',
+                         'LT - RDV', 'LT - RVE', 'RMT SJ23 - RDV', 'PARQUE EÓLICO SJ23 - RDV', 'VA84103', 'VA84113',
+                         'VA84131', 'VA84132', 'VA84134', 'VA84135', 'VA84138', 'VA84141', 'VA84142', 'VA84143',
+                         'VA84157', 'VA84164', 'VA84165', 'VA8457', 'VA8481', 'WLS71069-09', 'CE - RDV',
+                         'UMARI - LT - BLOCO NORTE/SUL', 'UMARI - CE - BLOCO SUL', 'UMARI - CE - BLOCO NORTE',
+                         'UMARI - ASV COMPLEMENTAR - BLOCO NORTE', 'UMARI - CO CIVIL - BLOCO NORTE', 'REASSENTAMENTO - RVE',
+                         'SE - RVE', 'SONDAGEM DA LT - RDV', 'CANTEIRO DE OBRAS CIVIL - RVE',
+                         'SONDAGEM LT PARTE 1 - RVE', 'SONDAGEM LT PARTE 2 - RVE'],
+    'Plantio (ha)': [35.180000, 13.507200, 0.039342, 0.109200, 0.030180, 3.231384, 0.495200, 3.511925, 4.785835,
+                     0.088400, 0.287337, 0.202010, 0.034488, 0.097194, 0.508002, 0.013319, 0.113500, 0.382392,
+                     0.437960, 0.035570, 0.132475, 0.039096, 0.032900, 0.083000, 0.008400, 43.101100,
+                     1.010300, 1.554900, 3.770900, 0.656900, 0.067900, 0.161100, 0.571800, 0.258200,
+                     0.302900, 0.518700, 3.188000],
+    'QDE de Mudas (UND)': [87950.0000, 33768.0000, 98.3550, 273.0000, 75.4500, 8078.4600, 1238.0000, 8779.8125,
+                           11964.5875, 221.0000, 718.3425, 505.0250, 86.2200, 242.9850, 1270.0050, 33.2975,
+                           283.7500, 955.9800, 1094.9000, 88.9250, 331.1875, 97.7400, 82.2500, 207.5000,
+                           21.0000, 107752.7500, 2525.7500, 3887.2500, 9427.2500, 1642.2500, 169.7500,
+                           402.7500, 1429.5000, 645.5000, 757.2500, 1296.7500, 7970.0000]
+})
+
+# Apenas os PRFs das divisões do usuário
+summary_data = summary_data[summary_data['DESCRIÇÃO DO PRF'].isin(data['DESCRIÇÃO DO PRF'])]
+
+# Mortalidade com a taxa de cada PRF (observada nas vistorias ou, sem vistoria, a assumida)
+taxas_prf = data.drop_duplicates('DESCRIÇÃO DO PRF').set_index('DESCRIÇÃO DO PRF')['Taxa de Mortalidade']
+summary_data = summary_data.assign(**{'Mortalidade (Qtd.)': summary_data['QDE de Mudas (UND)'] * summary_data['DESCRIÇÃO DO PRF'].map(taxas_prf)})
+
+if summary_data.empty:
+    st.info("Nenhum PRF do resumo pertence às divisões do seu perfil.")
+else:
+    mostrar_figura('home/resumo_prf', lambda graficos: graficos.resumo_prf(
+        summary_data, 'RESUMO DAS ÁREAS DE PLANTIO POR PRF',
+        rotulos_prf(summary_data['DESCRIÇÃO DO PRF'], 'home'),
+        figsize=(18, 14), largura=1.0, fonte_titulo=16, rotulo_mudas='Qtd. Mudas (UND)',
+        formatos=('.2f', '.1f', '.1f'), fonte_valores=8, fonte_rotulos=8, rotacao=90,
+    ))
+
+# ------------------ Gráficos Adicionados ------------------
+
+# Gráfico de Pizza: Aproveitamento por Projeto
+titulo_secao("Aproveitamento por Projeto")
+
+# Contagem de PRFs em cada classe
+mostrar_figura('home/aproveitamento_classes', lambda graficos: graficos.donut(
+    agregado('aproveitamento', lambda: dados.aproveitamento_counts(data)), 'aproveitamento', 'APROVEITAMENTO POR PROJETO', 'CLASSES DE APROVEITAMENTO:', pad=30,
+))
+
+# ------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Gráfico de Donut: Gestão por Quantidade de Projetos
+titulo_secao("Gestão por Quantidade de Projetos")
+
+# Contagem de divisões para ASSETco e DEVco
+mostrar_figura('home/divisoes', lambda graficos: graficos.donut(
+    agregado('contagem_divisoes', lambda: data['DIVISÃO'].value_counts()), 'divisao', 'GESTÃO POR QUANTIDADE DE PROJETOS', 'Divisão',
+))
+
+# ------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Substituindo st.header() por st.markdown() com HTML para customização
+titulo_secao("Gestão por Métricas")
+
+# Função para plotar os gráficos de donut
+def plot_donut_chart(column, title, colors):
+    def gerar(graficos):
+        # Agrupando os dados por 'DIVISÃO' e somando os valores de 'Total (ha)', 'QDE de Mudas (UND)', 'Mortalidade (Qtd.)'
+        division_summary = agregado('divisoes', lambda: dados.division_summary(data))
+        return graficos.donut(division_summary[column], colors, title, 'Divisão', pad=35, raio_rotulos=1.2,
+                              fonte_percentual=10, fonte_valor=10)
+
+    mostrar_figura(f'home/divisao_{column}', gerar)
+
+# Gráfico de Donut: Gestão por Total de Hectares
+plot_donut_chart('Total (ha)', 'Gestão por Total de Hectares', 'divisao')
+
+# Gráfico de Donut: Gestão por Número de Mudas
+plot_donut_chart('QDE de Mudas (UND)', 'Gestão por Número de Mudas', 'divisao')
+
+# Gráfico de Donut: Gestão por Número de Mudas Mortas
+plot_donut_chart('Mortalidade (Qtd.)', 'Gestão por Número de Mudas Mortas', 'mortas')
+
+# ------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Gráfico de Barras Horizontais: Uso do Solo
+titulo_secao("Uso do Solo")
+
+# Agrupando os dados por 'DIVISÃO' e somando os valores de uso do solo
+mostrar_figura('home/uso_do_solo', lambda graficos: graficos.uso_do_solo(agregado('uso_do_solo', lambda: dados.land_use(data))))
+
+exportar("home", {
+    'Linhas': lambda: data,
+    'Totais por divisão': lambda: agregado('divisoes', lambda: dados.division_summary(data)),
+    'Uso do solo': lambda: agregado('uso_do_solo', lambda: dados.land_use(data)),
+    'Classes de aproveitamento': lambda: agregado('aproveitamento', lambda: dados.aproveitamento_counts(data)).rename('PRFs').to_frame(),
+    'Totais por projeto': lambda: agregado('projetos', lambda: dados.project_summary(data)),
+})
@@ -0,0 +1,110 @@
+import os
+
+import streamlit as st
+import pydeck as pdk
+
+import dados
+import mapa
+import poligonos
+from painel import contexto, divisoes_disponiveis, exportar, titulo_secao
+
+
+versao, escopo, data = contexto().versao, contexto().escopo, contexto().data
+
+st.title("Dashboard de Plantio - Mapa")
+st.write("Plantio, mudas e mortalidade por cidade e, quando houver coordenadas, por PRF.")
+
+# Camadas agregadas uma única vez por versão dos dados e escopo; navegar no mapa não executa código no servidor
+@st.cache_data
+def camadas_mapa(versao, escopo, coordenadas_versao, raio_m, _data):
+    camadas = {'cidades': mapa.camada_cidades(_data), 'hexagonos': []}
+    coordenadas = mapa.read_coordenadas_prf()
+    if coordenadas is not None:
+        camadas['hexagonos'] = mapa.camada_hexagonos(_data, coordenadas, raio_m)
+    return camadas
+
+caminho_coordenadas = mapa.CAMINHO_COORDENADAS_PRF
+coordenadas_versao = dados.versao_dados(caminho_coordenadas) if os.path.exists(caminho_coordenadas) else None
+
+metrica = st.radio("Métrica", list(mapa.METRICAS_MAPA), horizontal=True)
+raio_m = st.select_slider("Raio dos hexágonos (m)", options=[250, 500, 1000, 2000, 5000], value=500, disabled=coordenadas_versao is None)
+camadas = camadas_mapa(versao, escopo, coordenadas_versao, raio_m, data)
+
+cor = mapa.METRICAS_MAPA[metrica]
+layers = [
+    pdk.Layer(
+        'ScatterplotLayer',
+        data=camadas['cidades'],
+        get_position='[lon, lat]',
+        get_radius=f"['escala_{metrica}']",
+        get_fill_color=cor + [140],
+        get_line_color=[28, 78, 128],
+        line_width_min_pixels=1,
+        stroked=True,
+        pickable=True,
+    )
+]
+if camadas['hexagonos']:
+    layers.append(pdk.Layer(
+        'ColumnLayer',
+        data=camadas['hexagonos'],
+        get_position='[lon, lat]',
+        get_elevation=f"['escala_{metrica}']",
+        radius=raio_m,
+        disk_resolution=6,
+        get_fill_color=cor + [220],
+        extruded=True,
+        pickable=True,
+    ))
+
+latitude, longitude = mapa.centro_mapa(camadas['cidades'] + camadas['hexagonos'])
+st.pydeck_chart(pdk.Deck(
+    layers=layers,
+    initial_view_state=pdk.ViewState(latitude=latitude, longitude=longitude, zoom=8, pitch=40 if camadas['hexagonos'] else 0),
+    map_style='light',
+    tooltip={'html': '{tooltip}'},
+), use_container_width=True)
+
+exportar("mapa", {
+    'Totais por cidade': lambda: mapa.totais_cidades(data),
+    'Linhas': lambda: data,
+})
+
+# Polígonos dos PRFs lidos uma vez por versão do GeoJSON, em vetores planos, e compartilhados entre as sessões
+@st.cache_resource
+def areas_poligonos(poligonos_versao):
+    geometrias = poligonos.ler_poligonos()
+    return poligonos.areas_prf(geometrias) if geometrias is not None else None
+
+caminho_poligonos = poligonos.CAMINHO_POLIGONOS_PRF
+poligonos_versao = dados.versao_dados(caminho_poligonos) if os.path.exists(caminho_poligonos) else None
+if poligonos_versao is not None:
+    titulo_secao("Verificação das Áreas")
+    areas = areas_poligonos(poligonos_versao)
+    verificacao = poligonos.verificar(data, areas)
+    divergentes = verificacao[verificacao['Divergente']]
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("PRFs com polígono", f"{verificacao['Área do Polígono (ha)'].notna().sum()} de {len(verificacao)}")
+    col2.metric("Áreas divergentes", len(divergentes))
+    col3.metric("Área dos polígonos (ha)", f"{verificacao['Área do Polígono (ha)'].sum():,.2f}")
+    st.caption(f"Total (ha) informado comparado com a área do polígono; divergente quando a diferença passa de {poligonos.TOLERANCIA_AREA:.0%}.")
+    if not divergentes.empty:
+        st.dataframe(divergentes.drop(columns='Divergente').style.format({
+            'Total (ha)': '{:.4f}', 'Área do Polígono (ha)': '{:.4f}', 'Diferença (ha)': '{:+.4f}', 'Diferença (%)': '{:+.1f}',
+        }), hide_index=True, use_container_width=True)
+
+    # Polígonos de PRFs fora do escopo do usuário não são listados
+    sem_cadastro = poligonos.sem_cadastro(data, areas) if escopo == divisoes_disponiveis(versao) else []
+    if sem_cadastro:
+        st.warning("Polígonos sem PRF correspondente no controle de plantio: " + ", ".join(sem_cadastro))
+
+    exportar("poligonos", {
+        'Verificação das áreas': lambda: verificacao,
+    })
+
+sem_coordenadas = mapa.cidades_sem_coordenadas(data)
+if sem_coordenadas:
+    st.warning("Cidades sem coordenadas cadastradas: " + ", ".join(sem_coordenadas))
+if coordenadas_versao is None:
+    st.info(f"Para ver os PRFs em hexágonos, adicione o arquivo {caminho_coordenadas} com as colunas DESCRIÇÃO DO PRF, LATITUDE e LONGITUDE.")
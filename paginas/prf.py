@@ -0,0 +1,50 @@
+import streamlit as st
+import pandas as pd
+
+import busca
+from painel import contexto, exportar
+
+
+versao, escopo, data = contexto().versao, contexto().escopo, contexto().data
+
+st.title("Dashboard de Plantio - PRF")
+st.write("Busca de um PRF pelo nome ou código, com uso do solo, mudas e mortalidade.")
+
+# Índice de prefixos montado uma vez por versão dos dados e escopo, compartilhado entre as sessões
+@st.cache_resource
+def indice_prf(versao, escopo, _data):
+    return busca.IndicePRF(_data['DESCRIÇÃO DO PRF'])
+
+indice = indice_prf(versao, escopo, data)
+texto = st.text_input("Buscar PRF", placeholder="Ex.: VA84142, 84142 ou BLOCO SUL")
+sugestoes = indice.sugestoes(texto)
+
+if not texto.strip():
+    st.info(f"Digite o início do nome ou do código de um dos {len(indice)} PRFs.")
+elif not sugestoes:
+    st.warning(f"Nenhum PRF encontrado para \"{texto}\".")
+else:
+    nome = st.selectbox("PRF", sugestoes)
+    prf = data.iloc[indice.posicoes[nome]]
+
+    st.subheader(nome)
+    st.caption(f"{prf['DIVISÃO']} · {prf['PROJETO']} · {prf['CIDADE']} · {prf['ANO']:.0f}")
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Área Total (ha)", f"{prf['Total (ha)']:.2f}")
+    col2.metric("Plantio (ha)", f"{prf['Plantio (ha)']:.2f}", f"{prf['Plantio (%)']:.1f}%", delta_color="off")
+    col3.metric("QDE de Mudas (UND)", f"{prf['QDE de Mudas (UND)']:,.0f}")
+    col4.metric("Mortalidade (Qtd.)", f"{prf['Mortalidade (Qtd.)']:,.0f}")
+    st.write(f"Classe de aproveitamento: **{prf['Classe de Aproveitamento']}**")
+
+    # Uso do solo do PRF
+    uso_do_solo = pd.DataFrame({
+        'Área (ha)': [prf['Estrada(ha)'], prf['Vegetação Nativa(ha)'], prf['Plantio (ha)']],
+        'Área (%)': [prf['Estrada(%)'], prf['Vegetação Nativa (%)'], prf['Plantio (%)']],
+    }, index=['Estrada', 'Vegetação Nativa', 'Plantio'])
+    st.dataframe(uso_do_solo.style.format('{:.2f}'), use_container_width=True)
+
+    exportar("prf", {
+        'PRF': lambda: prf.to_frame().T,
+        'Resultados da busca': lambda: data.iloc[indice.buscar(texto)],
+    })
@@ -0,0 +1,96 @@
+import streamlit as st
+import pandas as pd
+
+import dados
+from painel import agregado, contexto, dados_divisao, exportar, mostrar_figura, rotulos_prf, titulo_secao
+
+
+escopo, data = contexto().escopo, contexto().data
+assetco_data = dados_divisao('ASSETco')
+devco_data = dados_divisao('DEVco')
+
+st.title("Dashboard de Plantio - Projetos")
+st.write("Visualização dos dados de plantio para diferentes projetos.")
+
+# Assetco: Separar em dataframes para os projetos dentro da divisão ASSETco
+rio_vento_expansao_assetco = assetco_data[assetco_data['PROJETO'] == 'Rio do Vento Expansão']
+rio_vento_assetco = assetco_data[assetco_data['PROJETO'] == 'Rio do Vento']
+umari_assetco = assetco_data[assetco_data['PROJETO'] == 'UMARI']
+
+# Devco: Separar em dataframes para os projetos dentro da divisão DEVco
+torre_anemometrica_devco = devco_data[devco_data['PROJETO'] == 'Torre Anemométrica']
+
+def secao_projeto(titulo, projeto_data, titulo_aproveitamento, secao_resumo, titulo_resumo, quebra_rotulos=True):
+    # Projetos de divisões fora do escopo do usuário não aparecem
+    if projeto_data.empty:
+        return
+    titulo_secao(titulo)
+    divisoes = tuple(pd.unique(projeto_data['DIVISÃO']))
+
+    # Selecionar e organizar os dados
+    plot_projeto = projeto_data[['DESCRIÇÃO DO PRF', 'Plantio (%)', 'Área Sem Plantio (%)']].copy()
+    plot_projeto.set_index('DESCRIÇÃO DO PRF', inplace=True)
+    plot_projeto.sort_values('Plantio (%)', inplace=True)
+
+    mostrar_figura(f'projetos/{secao_resumo}/aproveitamento_prf', lambda graficos: graficos.barras_aproveitamento(
+        plot_projeto, titulo_aproveitamento, rotulos_prf(plot_projeto.index, 'quebra_em_15'),
+        taxa_mortalidade=dados.taxa_mortalidade_media(projeto_data),
+    ), divisoes)
+
+    # Novo gráfico de resumo das áreas de plantio
+    titulo_secao(secao_resumo)
+
+    projeto_data.set_index('DESCRIÇÃO DO PRF', inplace=True)
+    rotulos_resumo = rotulos_prf(projeto_data.index, 'quebra_em_15') if quebra_rotulos else projeto_data.index
+    mostrar_figura(f'projetos/{secao_resumo}/resumo_prf', lambda graficos: graficos.resumo_prf(
+        projeto_data, titulo_resumo, rotulos_resumo, normalizar=False,
+    ), divisoes)
+
+# --------------------------------------------------------------------------------------------
+# 1. Rio do Vento Expansão Assetco
+secao_projeto(
+    "Rio do Vento Expansão - Assetco",
+    rio_vento_expansao_assetco,
+    'Rio Vento Expansão ASSETco - Percentual de Aproveitamento das Áreas de Plantio - Rio do Vento Expansão',
+    "Resumo das Áreas de Plantio por PRF - Rio do Vento Expansão",
+    'Resumo das Áreas de Plantio - Rio do Vento Expansão',
+)
+
+# --------------------------------------------------------------------------------------------
+# 2. Rio do Vento Assetco
+secao_projeto(
+    "Rio do Vento - Assetco",
+    rio_vento_assetco,
+    'Percentual de Aproveitamento das Áreas de Plantio - Rio do Vento ASSETco',
+    "Resumo das Áreas de Plantio - Rio do Vento",
+    'Resumo das Áreas de Plantio - Rio do Vento',
+)
+
+# --------------------------------------------------------------------------------------------
+
+# 3. Umari Assetco
+secao_projeto(
+    "Umari Assetco",
+    umari_assetco,
+    'Percentual de Aproveitamento das Áreas de Plantio - Umari',
+    "Resumo das Áreas de Plantio por PRF - Umari",
+    'Resumo das Áreas de Plantio - Umari',
+)
+
+# -----------------------------------------------------------------------------------------------
+
+# 4. Torre Anemométrica DEVco
+secao_projeto(
+    "Torre Anemométrica DEVco",
+    torre_anemometrica_devco,
+    'Percentual de Aproveitamento das Áreas de Plantio - Torre Anemométrica',
+    "Resumo das Áreas de Plantio por PRF - Torre Anemométrica",
+    'Resumo das Áreas de Plantio - Torre Anemométrica',
+    quebra_rotulos=False,
+)
+
+exportar("projetos", {
+    'Totais por projeto': lambda: agregado('projetos', lambda: dados.project_summary(data)),
+    **{f'PRFs - {projeto}': (lambda projeto=projeto: agregado(f'prf/{projeto}', lambda: dados.tabela_prf(data, projeto)))
+       for projeto in dados.projetos(data)},
+})
@@ -0,0 +1,74 @@
+import pandas as pd
+import streamlit as st
+
+import replantio
+from painel import contexto, exportar, titulo_secao
+
+
+versao, escopo, data = contexto().versao, contexto().escopo, contexto().data
+
+st.title("Dashboard de Plantio - Replantio")
+st.write("Distribuição de um estoque de mudas entre os PRFs, priorizando o maior ganho líquido por muda replantada.")
+
+# Prioridade calculada uma vez por versão dos dados, escopo e parâmetros: mover o estoque só busca nos acumulados
+@st.cache_data
+def prioridade_replantio(versao, escopo, parametros, _data):
+    valor = _data['PROJETO'].map(parametros['Valor por Muda Viva (R$)']).to_numpy(dtype=float)
+    custo = _data['PROJETO'].map(parametros['Custo por Muda (R$)']).to_numpy(dtype=float)
+    return replantio.priorizar(_data, valor, custo)
+
+titulo_secao("Valor e Custo por Projeto")
+padrao = pd.DataFrame({
+    'Valor por Muda Viva (R$)': replantio.VALOR_MUDA_VIVA,
+    'Custo por Muda (R$)': replantio.CUSTO_MUDA,
+}, index=pd.Index(data['PROJETO'].drop_duplicates(), name='PROJETO'))
+parametros = st.data_editor(padrao, use_container_width=True, key="replantio_parametros", column_config={
+    'Valor por Muda Viva (R$)': st.column_config.NumberColumn(min_value=0.0, format="R$ %.2f", required=True),
+    'Custo por Muda (R$)': st.column_config.NumberColumn(min_value=0.0, format="R$ %.2f", required=True),
+})
+st.caption("Cada muda replantada rende o valor da muda viva vezes a sobrevivência do PRF, menos o custo da muda. "
+           "PRFs em que a muda não se paga ficam fora do plano.")
+
+prioridade = prioridade_replantio(versao, escopo, parametros, data)
+demanda_total = int(prioridade['mudas_acumuladas'][-1]) if len(prioridade['linhas']) else 0
+
+if not demanda_total:
+    st.info("Nenhum PRF tem mudas a repor com ganho líquido positivo nos valores informados.")
+else:
+    estoque = st.slider("Estoque de mudas", 0, demanda_total, demanda_total // 2, key="replantio_estoque")
+    tabela = replantio.plano(data, prioridade, replantio.alocar(prioridade, estoque))
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("PRFs atendidos", f"{len(tabela)} de {len(prioridade['linhas'])}")
+    col2.metric("Mudas vivas recuperadas", f"{tabela['Mudas Vivas Recuperadas'].sum():,.0f}")
+    col3.metric("Cobertura das mortas", f"{tabela['Mudas Vivas Recuperadas'].sum() / prioridade['mortas']:.1%}")
+    col4.metric("Ganho líquido", f"R$ {tabela['Ganho Líquido (R$)'].sum():,.2f}")
+
+    titulo_secao("Cobertura por Estoque")
+    st.line_chart(replantio.fronteira(prioridade)['Cobertura (%)'], y_label='Cobertura das mortas (%)')
+
+    titulo_secao("Plano por Projeto")
+    resumo_projetos = replantio.por_projeto(data, tabela)
+    st.dataframe(resumo_projetos.style.format({
+        'Mortalidade (Qtd.)': '{:,.0f}', 'Mudas Alocadas': '{:,.0f}', 'Mudas Vivas Recuperadas': '{:,.0f}',
+        'Ganho Líquido (R$)': 'R$ {:,.2f}', 'Cobertura': '{:.1%}',
+    }), use_container_width=True)
+
+    # O plano pode ter milhares de PRFs: o formato fica no navegador (column_config) em vez de um Styler,
+    # que formataria cada célula no servidor a cada movimento do estoque
+    titulo_secao("Plano por PRF")
+    st.dataframe(tabela.assign(**{
+        'Taxa de Mortalidade': tabela['Taxa de Mortalidade'] * 100, 'Cobertura': tabela['Cobertura'] * 100,
+    }), use_container_width=True, hide_index=True, column_config={
+        **{coluna: st.column_config.NumberColumn(format="%.0f") for coluna in (
+            'QDE de Mudas (UND)', 'Mortalidade (Qtd.)', 'Mudas a Replantar', 'Mudas Alocadas', 'Mudas Vivas Recuperadas')},
+        'Taxa de Mortalidade': st.column_config.NumberColumn(format="%.2f%%"),
+        'Cobertura': st.column_config.NumberColumn(format="%.1f%%"),
+        'Ganho Líquido (R$)': st.column_config.NumberColumn(format="R$ %.2f"),
+    })
+
+    exportar("replantio", {
+        'Plano por PRF': lambda: tabela,
+        'Plano por projeto': lambda: resumo_projetos.reset_index(),
+        'Cobertura por estoque': lambda: replantio.fronteira(prioridade).reset_index(),
+    })
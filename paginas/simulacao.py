@@ -0,0 +1,44 @@
+import math
+
+import streamlit as st
+
+import dados
+import simulacao
+from painel import contexto, exportar, titulo_secao
+
+
+versao, escopo, data = contexto().versao, contexto().escopo, contexto().data
+
+st.title("Dashboard de Plantio - Simulação")
+st.write("Projeção de mudas mortas e de mudas a replantar, com a taxa de mortalidade de cada PRF sorteada em milhares de simulações.")
+
+# Resultado memorizado por versão dos dados, escopo e parâmetros: repetir uma combinação não simula de novo
+@st.cache_data
+def projecao_mortalidade(versao, escopo, distribuicao, media, desvio, simulacoes, nivel, _data):
+    return simulacao.projecao(_data, distribuicao, media, desvio, simulacoes, nivel)
+
+col1, col2, col3 = st.columns(3)
+distribuicao = col1.selectbox("Distribuição da taxa por PRF", simulacao.DISTRIBUICOES)
+# A taxa média parte da mortalidade observada nas vistorias dos PRFs do escopo; o limite da escala
+# acompanha a observada para que ela não seja cortada
+media_observada = round(dados.taxa_mortalidade_media(data) * 100, 2)
+media = col2.slider("Taxa média de mortalidade (%)", 0.0, max(30.0, float(math.ceil(media_observada))), media_observada, 0.01)
+desvio = col3.slider("Desvio padrão entre PRFs (p.p.)", 0.0, 10.0, simulacao.DESVIO_PADRAO * 100, 0.5)
+col1, col2 = st.columns(2)
+simulacoes = col1.select_slider("Simulações", options=[1000, 2000, 5000, 10000], value=simulacao.SIMULACOES)
+nivel = col2.select_slider("Faixa de confiança", options=[0.80, 0.90, 0.95, 0.99], value=0.90, format_func=lambda n: f"{n:.0%}")
+
+projecao = projecao_mortalidade(versao, escopo, distribuicao, media / 100, desvio / 100, simulacoes, nivel, data)
+st.caption(f"Faixa: percentis {(1 - nivel) / 2:.1%} a {(1 + nivel) / 2:.1%} das simulações. "
+           f"Replantio considera que as mudas replantadas morrem à mesma taxa sorteada.")
+
+titulo_secao("Por divisão")
+st.dataframe(projecao['divisoes'].style.format('{:,.0f}'), use_container_width=True)
+
+titulo_secao("Por projeto")
+st.dataframe(projecao['projetos'].style.format('{:,.0f}'), use_container_width=True)
+
+exportar("simulacao", {
+    'Faixas por divisão': lambda: projecao['divisoes'].rename_axis('DIVISÃO'),
+    'Faixas por projeto': lambda: projecao['projetos'].rename_axis('PROJETO'),
+})
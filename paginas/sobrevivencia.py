@@ -0,0 +1,51 @@
+import streamlit as st
+
+import dados
+import vistorias
+from painel import contexto, exportar, titulo_secao
+
+
+versao, escopo, data = contexto().versao, contexto().escopo, contexto().data
+
+st.title("Dashboard de Plantio - Sobrevivência")
+st.write("Sobrevivência das mudas e mortalidade observada nas vistorias de campo, por projeto e por PRF.")
+
+# Acompanhamento das vistorias calculado uma vez por versão dos dados (CSV e vistorias) e escopo
+@st.cache_data
+def sobrevivencia(versao, escopo, _data):
+    acompanhamento = vistorias.acompanhar(_data, vistorias.ler_vistorias())
+    prfs = vistorias.mortalidade_prf(acompanhamento)
+    return {
+        'curvas': vistorias.curvas(acompanhamento),
+        'projetos': vistorias.mortalidade_projeto(prfs),
+        'prfs': prfs,
+    }
+
+if vistorias.ler_vistorias() is None:
+    st.info(f"Sem vistorias de campo: a mortalidade usa a taxa assumida de {dados.TAXA_MORTALIDADE:.2%}. Importe as contagens "
+            f"com `python vistorias.py importar <arquivo.csv>` (colunas {', '.join(vistorias.COLUNAS_VISTORIAS)}).")
+else:
+    resultado = sobrevivencia(versao, escopo, data)
+    prfs = resultado['prfs']
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("PRFs vistoriados", f"{len(prfs)} de {data['DESCRIÇÃO DO PRF'].nunique()}")
+    col2.metric("Vistorias", f"{int(prfs['Vistorias'].sum()):,}")
+    col3.metric("Mortalidade observada", f"{dados.taxa_mortalidade_media(data):.2%}")
+    st.caption(f"PRFs sem vistoria usam a mortalidade observada no projeto e, em projetos sem vistoria, "
+               f"a taxa assumida de {dados.TAXA_MORTALIDADE:.2%}.")
+
+    titulo_secao("Curvas de Sobrevivência por Projeto")
+    curvas = resultado['curvas'].pivot_table(index='Mês', columns='PROJETO', values='Sobrevivência (%)', observed=True)
+    st.line_chart(curvas.ffill(), y_label='Sobrevivência (%)')
+
+    titulo_secao("Mortalidade Observada por Projeto")
+    st.dataframe(resultado['projetos'].style.format({
+        'QDE de Mudas (UND)': '{:,.0f}', 'Mortalidade (Qtd.)': '{:,.0f}', 'Taxa de Mortalidade': '{:.2%}',
+    }), use_container_width=True)
+
+    exportar("sobrevivencia", {
+        'Mortalidade por projeto': lambda: resultado['projetos'],
+        'Mortalidade por PRF': lambda: prfs.reset_index(),
+        'Curvas de sobrevivência': lambda: resultado['curvas'],
+    })
@@ -0,0 +1,281 @@
+import functools
+import io
+import os
+
+import streamlit as st
+import pandas as pd
+
+import cache_disco
+import dados
+import ingestao
+import papeis
+import renderizacao
+import rotulos
+import snapshot
+
+
+# Código comum às páginas do app: dados, agregados, papéis e exibição dos gráficos. As páginas (paginas/*.py)
+# são executadas pelo st.navigation do app.py, que importa e executa apenas a página ativa.
+
+DIRETORIO_APP = os.path.dirname(os.path.abspath(__file__))
+
+
+# Cache em disco compartilhado entre as réplicas do app no mesmo host (PLANTIO_CACHE_DIR)
+@st.cache_resource
+def cache_artefatos():
+    return cache_disco.CacheArtefatos()
+
+
+# Assinatura do código que gera os dados e os gráficos: faz parte da chave dos artefatos
+@st.cache_resource
+def assinatura_codigo():
+    return cache_disco.assinatura_codigo(*(os.path.join(DIRETORIO_APP, nome) for nome in ('carbono.py', 'dados.py', 'graficos.py', 'ingestao.py', 'rotulos.py', 'tema.py', 'vistorias.py')))
+
+
+# Snapshot pré-calculado no build (python snapshot.py), mapeado em memória; None se não corresponder ao CSV atual
+@st.cache_resource
+def carregar_snapshot(versao):
+    return snapshot.carregar(versao)
+
+
+# Carregar os dados
+@st.cache_data
+def load_data(versao):
+    # O caminho do arquivo CSV pode ser alterado pela variável de ambiente PLANTIO_CSV
+    # A versão (hash do CSV) faz parte da chave do cache: o app recarrega quando o arquivo muda
+    snap = carregar_snapshot(versao)
+    if snap is not None:
+        return snap.tabela('dados')
+    return ler_dados(versao)
+
+
+def ler_dados(versao):
+    spec = {'codigo': assinatura_codigo()}
+    if ingestao.usar_blocos():
+        # CSV grande: lido em blocos com memória limitada e gravado em Parquet no cache em disco, com os agregados
+        # acumulados na leitura guardados ao lado (agregado_blocos). As páginas ainda usam as linhas, então o
+        # Parquet é carregado inteiro: a memória do app cresce com o arquivo, só a ingestão é limitada.
+        def escrever(destino):
+            agregados = ingestao.ingerir(dados.caminho_csv(), destino)
+            for nome, tabela in agregados.tabelas().items():
+                cache_artefatos().gravar(_chave_agregado_blocos(versao, nome), tabela.to_parquet())
+
+        caminho = cache_artefatos().obter_arquivo(versao, 'dados_blocos', spec, escrever)
+        return pd.read_parquet(caminho)
+    return cache_artefatos().obter_frame(versao, 'dados', spec, dados.read_plantio)
+
+
+def _chave_agregado_blocos(versao, nome):
+    return cache_artefatos().chave(versao, 'agregado_blocos', {'codigo': assinatura_codigo(), 'nome': nome})
+
+
+def agregado_blocos(versao, nome):
+    # Agregado de todas as divisões acumulado na ingestão em blocos; None quando o CSV não é lido em blocos
+    # ou o agregado não está no cache em disco
+    if nome not in ingestao.AGREGADOS or not ingestao.usar_blocos():
+        return None
+    conteudo = cache_artefatos().ler(_chave_agregado_blocos(versao, nome))
+    if conteudo is None:
+        return None
+    tabela = pd.read_parquet(io.BytesIO(conteudo))
+    return tabela.iloc[:, 0] if nome in ingestao.AGREGADOS_SERIES else tabela
+
+
+# Divisões presentes nos dados (com snapshot, sem carregar o frame)
+@st.cache_data
+def divisoes_disponiveis(versao):
+    snap = carregar_snapshot(versao)
+    contagem = snap.tabela('contagem_divisoes') if snap is not None else load_data(versao)['DIVISÃO'].value_counts()
+    return tuple(sorted(contagem.index))
+
+
+# Pool de processos que renderiza os gráficos, compartilhado entre as sessões (PLANTIO_PROCESSOS_GRAFICOS)
+@st.cache_resource
+def pool_graficos():
+    return renderizacao.criar_pool()
+
+
+# Papéis e divisões permitidas (papeis.json ou PLANTIO_PAPEIS); sem o arquivo, todos veem tudo
+@st.cache_resource
+def configuracao_papeis():
+    return papeis.ler_papeis()
+
+
+class Contexto:
+    # Estado de uma execução do app: versão dos dados, papel e divisões do usuário e os gráficos pendentes.
+    # As linhas do escopo só são lidas quando a página as usa.
+
+    def __init__(self, versao, papel, escopo, agendador):
+        self.versao = versao
+        self.papel = papel
+        self.escopo = escopo
+        self.agendador = agendador
+
+    @functools.cached_property
+    def data(self):
+        return dados_divisoes(self.escopo)
+
+
+def iniciar():
+    # Resolve a versão dos dados e o escopo do usuário no início de cada execução, antes da página ativa
+    versao = dados.versao_plantio()
+
+    # Papel do usuário, resolvido uma vez no início da sessão
+    if 'papel' not in st.session_state:
+        st.session_state['papel'] = papeis.papel_do_usuario(configuracao_papeis(), getattr(st.experimental_user, 'email', None))
+
+    # Divisões que o usuário pode ver; todas as páginas usam apenas os dados delas
+    escopo = papeis.divisoes_do_papel(configuracao_papeis(), st.session_state['papel'], divisoes_disponiveis(versao))
+    if not escopo:
+        st.error("Seu usuário não tem acesso a nenhuma divisão do controle de plantio.")
+        st.stop()
+
+    # Gráficos desta execução, renderizados em paralelo e exibidos na ordem da página
+    agendador = renderizacao.Agendador(cache_artefatos(), pool_graficos(), pool_graficos.clear)
+    st.session_state['contexto'] = Contexto(versao, st.session_state['papel'], escopo, agendador)
+    return st.session_state['contexto']
+
+
+def contexto():
+    return st.session_state['contexto']
+
+
+def agregado(nome, calcular, divisoes=None):
+    # Tabela das divisões pedidas (por padrão, as do papel do usuário), compartilhada por todos os usuários
+    # com o mesmo escopo; vem do snapshot quando ele é válido para a versão atual
+    ctx = contexto()
+    return _agregado(ctx.versao, nome, tuple(ctx.escopo if divisoes is None else divisoes), calcular)
+
+
+@st.cache_data
+def _agregado(versao, nome, divisoes, _calcular):
+    # No snapshot, "nome" tem as tabelas de todas as divisões e "nome/DIVISÃO" as de uma divisão
+    chave = nome if divisoes == divisoes_disponiveis(versao) else f'{nome}/{divisoes[0]}' if len(divisoes) == 1 else None
+    snap = carregar_snapshot(versao)
+    if chave is not None and snap is not None and chave in snap:
+        return snap.tabela(chave)
+    # CSV lido em blocos: os agregados de todas as divisões já foram acumulados na leitura
+    tabela = agregado_blocos(versao, nome) if chave == nome else None
+    return _calcular() if tabela is None else tabela
+
+
+def dados_divisoes(divisoes):
+    # Linhas das divisões pedidas; o frame completo só é lido quando não há snapshot
+    versao = contexto().versao
+    if divisoes == divisoes_disponiveis(versao):
+        return load_data(versao)
+
+    def filtrar():
+        todos = load_data(versao)
+        return todos[todos['DIVISÃO'].isin(divisoes)]
+
+    return agregado('dados', filtrar, divisoes)
+
+
+def dados_divisao(divisao):
+    # Linhas de uma divisão, vazias quando ela está fora do escopo do usuário
+    ctx = contexto()
+    return dados_divisoes((divisao,)) if divisao in ctx.escopo else ctx.data.iloc[:0]
+
+
+def rotulos_prf(nomes, layout):
+    # Rótulos dos PRFs nos gráficos, com as quebras de linha do layout pedido
+    tabela = agregado('rotulos', lambda: rotulos.tabela(contexto().data))[layout]
+    quebra = rotulos.LAYOUTS[layout]
+    return [tabela[nome] if nome in tabela.index else quebra(nome) for nome in nomes]
+
+
+def titulo_secao(texto):
+    st.markdown(f"<h2 style='text-align: center; color: #1C4E80; font-family: DejaVu Sans;'>{texto}</h2>", unsafe_allow_html=True)
+
+
+def exportar(nome, tabelas):
+    # Download das linhas filtradas e dos agregados da página; cada tabela é gerada só quando solicitada
+    import exportacao
+
+    with st.expander("Exportar dados"):
+        col1, col2 = st.columns(2)
+        tabela = col1.selectbox("Conteúdo", list(tabelas), key=f"exportar_tabela_{nome}")
+        formato = col2.radio("Formato", list(exportacao.FORMATOS), horizontal=True, key=f"exportar_formato_{nome}")
+        extensao, mime = exportacao.FORMATOS[formato]
+
+        if st.button("Gerar arquivo", key=f"exportar_gerar_{nome}"):
+            frame = exportacao.tabela_exportacao(tabelas[tabela]())
+            # O st.download_button (Streamlit 1.38) só aceita o conteúdo completo, que ele guarda em memória para
+            # servir o download: os blocos são juntados direto em bytes, sem passar por um arquivo temporário.
+            # A exportação em blocos até o cliente só existe na API (/api/exportar).
+            conteudo = b''.join(exportacao.iter_exportacao(frame, formato))
+            nome_arquivo = f"plantio_{nome}_{tabela}_{contexto().versao}.{extensao}".lower().replace(' ', '_')
+            st.download_button(f"Baixar {formato}", conteudo, file_name=nome_arquivo, mime=mime, key=f"exportar_baixar_{nome}")
+
+
+def mostrar_figura(nome, gerar, divisoes=None):
+    # Gráfico renderizado em PNG uma única vez por versão dos dados e divisões exibidas, entre todas as réplicas
+    # e todos os usuários com o mesmo escopo; com o PNG em cache, o matplotlib nem chega a ser importado.
+    # Os gráficos que faltam são renderizados em paralelo no pool e exibidos no fim da página, no lugar reservado aqui.
+    ctx = contexto()
+    local = st.empty()
+    spec = {'grafico': nome, 'codigo': assinatura_codigo(), 'divisoes': list(ctx.escopo if divisoes is None else divisoes)}
+    ctx.agendador.agendar(ctx.versao, spec, gerar, lambda png: local.image(png, use_column_width=True))
+
+
+def secao_densidade(divisao):
+    import densidade
+
+    titulo_secao(f"Densidade de Plantio - {divisao}")
+
+    # Densidade de plantio e marcações de consistência por PRF, uma vez por versão dos dados
+    analise = agregado('densidade', lambda: densidade.analisar(dados_divisoes((divisao,))), (divisao,))
+    for coluna, (nome, valor) in zip(st.columns(3), densidade.resumo(analise).items()):
+        coluna.metric(nome, f"{valor:,.0f}")
+    st.caption(f"Referência: {densidade.DENSIDADE_REFERENCIA:,} mudas/ha. A densidade é atípica quando o z robusto "
+               f"(mediana e MAD do projeto) passa de {densidade.LIMITE_Z} em módulo.")
+
+    inconsistentes = densidade.marcados(analise)
+    if inconsistentes.empty:
+        st.success("Nenhuma inconsistência de densidade ou de quantidade de mudas.")
+    else:
+        colunas = ['PROJETO', 'DESCRIÇÃO DO PRF', 'Plantio (ha)', 'QDE de Mudas (UND)', 'Densidade (mudas/ha)', 'Z Robusto', 'Motivo']
+        st.dataframe(inconsistentes[colunas].style.format({
+            'Plantio (ha)': '{:.4f}', 'QDE de Mudas (UND)': '{:,.4f}', 'Densidade (mudas/ha)': '{:,.1f}', 'Z Robusto': '{:.2f}',
+        }), hide_index=True, use_container_width=True)
+    return analise
+
+
+# Projeção por versão dos dados, divisão e parâmetros da curva: voltar a uma combinação não recalcula
+@st.cache_data
+def _projecao_carbono(versao, divisao, curva, horizonte, _data):
+    import carbono
+
+    projecao = carbono.projetar(_data, curva, horizonte)
+    return {
+        'co2_projetos': carbono.por_grupo(_data, projecao['co2'], projecao['anos'], 'PROJETO'),
+        'projetos': carbono.resumo(_data, projecao, 'PROJETO'),
+        'prfs': carbono.resumo(_data, projecao, 'DESCRIÇÃO DO PRF'),
+        'biomassa': float(projecao['biomassa'][:, -1].sum()),
+        'co2': float(projecao['co2'][:, -1].sum()),
+    }
+
+
+def secao_carbono(divisao):
+    import carbono
+
+    titulo_secao(f"Projeção de Carbono - {divisao}")
+
+    col1, col2 = st.columns(2)
+    curva = col1.selectbox("Curva de crescimento", list(carbono.CURVAS), key=f"carbono_curva_{divisao}")
+    # Pelo menos dois anos: o gráfico é uma curva ao longo dos anos
+    horizonte = col2.slider("Horizonte (anos)", 2, carbono.HORIZONTE, carbono.HORIZONTE, key=f"carbono_horizonte_{divisao}")
+    projecao = _projecao_carbono(contexto().versao, divisao, curva, horizonte, dados_divisoes((divisao,)))
+
+    col1, col2 = st.columns(2)
+    col1.metric(f"Biomassa em {horizonte} anos (t)", f"{projecao['biomassa']:,.0f}")
+    col2.metric(f"CO₂ capturado em {horizonte} anos (t)", f"{projecao['co2']:,.0f}")
+    st.caption(f"Mudas vivas (QDE de Mudas x sobrevivência observada) crescendo pela curva de Chapman-Richards da {curva}, "
+               f"limitada a {carbono.CURVAS[curva]['teto_ha']:.0f} t/ha de biomassa aérea; carbono = {carbono.FRACAO_CARBONO:.0%} "
+               f"da biomassa seca total (IPCC 2006).")
+
+    mostrar_figura(f'{divisao.lower()}/carbono/{curva}/{horizonte}', lambda graficos: graficos.projecao_carbono(
+        projecao['co2_projetos'], f'{divisao} - CO₂ CAPTURADO POR PROJETO ({curva.upper()})',
+    ), (divisao,))
+    return projecao
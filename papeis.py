@@ -0,0 +1,40 @@
+import json
+import os
+
+
+# Arquivo opcional com os papéis e as divisões que cada um pode ver
+CAMINHO_PAPEIS = 'papeis.json'
+
+# Sem arquivo de papéis todos os usuários veem todas as divisões
+TODAS = '*'
+CONFIGURACAO_PADRAO = {'papeis': {'todos': TODAS}, 'usuarios': {}, 'padrao': 'todos'}
+
+
+def caminho_papeis():
+    return os.environ.get('PLANTIO_PAPEIS', CAMINHO_PAPEIS)
+
+
+def ler_papeis(file_path=None):
+    # {"papeis": {"ASSETco": ["ASSETco"], "diretoria": "*"}, "usuarios": {"ana@empresa.com": "ASSETco"}, "padrao": "diretoria"}
+    file_path = file_path or caminho_papeis()
+    if not os.path.exists(file_path):
+        return CONFIGURACAO_PADRAO
+    with open(file_path, encoding='utf-8') as f:
+        configuracao = json.load(f)
+    configuracao.setdefault('usuarios', {})
+    configuracao.setdefault('padrao', None)
+    return configuracao
+
+
+def papel_do_usuario(configuracao, email):
+    # Papel pelo e-mail (sem diferenciar maiúsculas); usuários não cadastrados recebem o papel padrão
+    usuarios = {usuario.lower(): papel for usuario, papel in configuracao['usuarios'].items()}
+    return usuarios.get((email or '').lower(), configuracao['padrao'])
+
+
+def divisoes_do_papel(configuracao, papel, disponiveis):
+    # Divisões do papel, na ordem das divisões disponíveis nos dados; vazio para papel desconhecido
+    permitidas = configuracao['papeis'].get(papel, [])
+    if permitidas == TODAS:
+        return tuple(disponiveis)
+    return tuple(divisao for divisao in disponiveis if divisao in permitidas)
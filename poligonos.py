@@ -0,0 +1,112 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# Arquivo opcional com os limites de cada PRF (GeoJSON com a propriedade DESCRIÇÃO DO PRF em cada feição)
+CAMINHO_POLIGONOS_PRF = 'poligonos_prf.geojson'
+PROPRIEDADE_PRF = 'DESCRIÇÃO DO PRF'
+
+# Diferença relativa a partir da qual a área informada é considerada divergente do polígono
+TOLERANCIA_AREA = 0.05
+
+RAIO_TERRA_M = 6371008.8
+M2_POR_HA = 10_000
+
+
+class Geometrias:
+    # Polígonos de todos os PRFs em vetores planos: coordenadas de todos os anéis concatenadas, o início de
+    # cada anel, o sinal do anel (+1 exterior, -1 buraco) e o PRF de cada anel (código em "nomes")
+
+    def __init__(self, lon, lat, inicios, sinais, prfs, nomes):
+        self.lon = lon
+        self.lat = lat
+        self.inicios = inicios
+        self.sinais = sinais
+        self.prfs = prfs
+        self.nomes = nomes
+
+    def __len__(self):
+        return len(self.nomes)
+
+
+def _poligonos(geometria):
+    if geometria is None:
+        return []
+    if geometria['type'] == 'Polygon':
+        return [geometria['coordinates']]
+    if geometria['type'] == 'MultiPolygon':
+        return geometria['coordinates']
+    return []
+
+
+def ler_poligonos(file_path=CAMINHO_POLIGONOS_PRF):
+    # Polígonos por PRF são opcionais; feições sem nome de PRF ou sem polígono são ignoradas
+    if not os.path.exists(file_path):
+        return None
+    with open(file_path, encoding='utf-8') as f:
+        colecao = json.load(f)
+
+    aneis, sinais, prfs, nomes = [], [], [], {}
+    for feicao in colecao.get('features', []):
+        nome = str((feicao.get('properties') or {}).get(PROPRIEDADE_PRF, '')).strip()
+        if not nome:
+            continue
+        for poligono in _poligonos(feicao.get('geometry')):
+            for posicao, anel in enumerate(poligono):
+                if len(anel) < 3:
+                    continue
+                aneis.append(anel)
+                sinais.append(1.0 if posicao == 0 else -1.0)
+                prfs.append(nomes.setdefault(nome, len(nomes)))
+
+    tamanhos = np.array([len(anel) for anel in aneis], dtype=np.int64)
+    coordenadas = np.array([ponto[:2] for anel in aneis for ponto in anel], dtype=float).reshape(-1, 2)
+    inicios = np.concatenate([[0], np.cumsum(tamanhos)[:-1]]).astype(np.int64) if len(aneis) else np.empty(0, dtype=np.int64)
+    return Geometrias(coordenadas[:, 0], coordenadas[:, 1], inicios, np.array(sinais), np.array(prfs, dtype=np.int64), list(nomes))
+
+
+def areas_aneis(lon, lat, inicios):
+    # Área (m²) de cada anel pela fórmula do laço (shoelace), em todos os anéis de uma vez.
+    # Projeção cilíndrica de Lambert (equivalente): x = R·λ, y = R·sen(φ) preserva as áreas na esfera.
+    if not len(inicios):
+        return np.empty(0)
+    tamanhos = np.diff(np.append(inicios, len(lon)))
+    anel = np.repeat(np.arange(len(inicios)), tamanhos)
+
+    x = np.radians(lon) * RAIO_TERRA_M
+    y = np.sin(np.radians(lat)) * RAIO_TERRA_M
+    # Coordenadas relativas ao primeiro vértice do anel, para não perder precisão nos produtos
+    x = x - x[inicios][anel]
+    y = y - y[inicios][anel]
+
+    # Próximo vértice de cada vértice, voltando ao primeiro no fim do anel (anéis já fechados somam zero no fecho)
+    proximo = np.arange(1, len(lon) + 1)
+    proximo[inicios + tamanhos - 1] = inicios
+    termos = x * y[proximo] - x[proximo] * y
+    return np.abs(np.add.reduceat(termos, inicios)) / 2
+
+
+def areas_prf(geometrias):
+    # Área (ha) de cada PRF: soma dos anéis exteriores menos os buracos, de todas as feições do PRF
+    areas = areas_aneis(geometrias.lon, geometrias.lat, geometrias.inicios) * geometrias.sinais
+    por_prf = np.bincount(geometrias.prfs, weights=areas, minlength=len(geometrias.nomes))
+    return pd.Series(por_prf / M2_POR_HA, index=pd.Index(geometrias.nomes, name='DESCRIÇÃO DO PRF'), name='Área do Polígono (ha)')
+
+
+def verificar(data, areas, tolerancia=TOLERANCIA_AREA):
+    # Área informada (Total (ha)) x área do polígono de cada PRF; PRFs sem polígono ficam sem comparação
+    verificacao = data[['DIVISÃO', 'PROJETO', 'DESCRIÇÃO DO PRF', 'Total (ha)']].copy()
+    verificacao['Área do Polígono (ha)'] = verificacao['DESCRIÇÃO DO PRF'].map(areas).to_numpy(dtype=float)
+    verificacao['Diferença (ha)'] = verificacao['Área do Polígono (ha)'] - verificacao['Total (ha)']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        verificacao['Diferença (%)'] = verificacao['Diferença (ha)'] / verificacao['Total (ha)'] * 100
+    verificacao['Divergente'] = (verificacao['Diferença (ha)'].abs() > verificacao['Total (ha)'].abs() * tolerancia).to_numpy()
+    return verificacao
+
+
+def sem_cadastro(data, areas):
+    # Polígonos cujo PRF não está no controle de plantio (nome diferente ou PRF removido)
+    return sorted(set(areas.index) - set(data['DESCRIÇÃO DO PRF']))
@@ -0,0 +1,208 @@
+import contextlib
+import multiprocessing
+import os
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+# Processos que renderizam os gráficos de uma página em paralelo; 0 renderiza no próprio processo do app
+PROCESSOS_GRAFICOS = min(4, os.cpu_count() or 1)
+
+
+def processos_graficos():
+    return int(os.environ.get('PLANTIO_PROCESSOS_GRAFICOS', PROCESSOS_GRAFICOS))
+
+
+class Especificacao:
+    # Usado no lugar do módulo graficos ao montar um gráfico: graficos.donut(...) devolve
+    # ('donut', args, kwargs), que pode ser enviado a outro processo e renderizado lá
+
+    def __getattr__(self, funcao):
+        return lambda *args, **kwargs: (funcao, args, kwargs)
+
+
+def _iniciar():
+    # Cada processo importa os gráficos (backend Agg, sem pyplot) uma vez, antes do primeiro pedido
+    os.environ['MPLBACKEND'] = 'Agg'
+    import graficos  # noqa: F401
+
+
+def renderizar(especificacao):
+    # PNG do gráfico descrito por (função do módulo graficos, args, kwargs)
+    import graficos
+
+    funcao, args, kwargs = especificacao
+    return graficos.png(getattr(graficos, funcao)(*args, **kwargs))
+
+
+def criar_pool(processos=None):
+    # spawn: os processos não herdam as threads nem o estado do servidor do Streamlit
+    processos = processos_graficos() if processos is None else processos
+    if processos <= 0:
+        return None
+    pool = ProcessPoolExecutor(processos, mp_context=multiprocessing.get_context('spawn'), initializer=_iniciar)
+
+    # O Streamlit executa o app como __main__ e o spawn importaria o __main__ em cada processo, executando o app
+    # de novo. Os processos são todos iniciados aqui (um pedido vazio para cada), com um __main__ vazio no lugar.
+    principal = sys.modules['__main__']
+    sys.modules['__main__'] = types.ModuleType('__main__')
+    try:
+        for _ in range(processos):
+            pool.submit(int)
+    finally:
+        sys.modules['__main__'] = principal
+    return pool
+
+
+class Agendador:
+    # Gráficos de uma execução da página: os que estão no cache em disco são exibidos na hora, os demais
+    # são enviados ao pool assim que a página os pede e exibidos em concluir(), na ordem da página.
+    # Cada gráfico enviado fica com a trava da sua chave até ser gravado, como no CacheArtefatos.obter.
+    # ao_quebrar() é chamado se o pool quebrar, para descartar o pool compartilhado.
+
+    def __init__(self, cache, pool, ao_quebrar=None):
+        self._cache = cache
+        self._pool = pool
+        self._ao_quebrar = ao_quebrar
+        self._pendentes = []
+        self._travas = contextlib.ExitStack()
+
+    def agendar(self, versao, spec, gerar, mostrar):
+        # gerar(Especificacao()) descreve o gráfico; mostrar(png) o exibe no lugar reservado na página
+        chave = self._cache.chave(versao, 'figura', spec)
+        conteudo = self._cache.ler(chave)
+        if conteudo is None:
+            self._travas.enter_context(self._cache.travar(chave))
+            conteudo = self._cache.ler(chave)
+        if conteudo is not None:
+            mostrar(conteudo)
+            return
+
+        especificacao = gerar(Especificacao())
+        futuro = None
+        if self._pool is not None:
+            try:
+                futuro = self._pool.submit(renderizar, especificacao)
+            except BrokenProcessPool:
+                self._pool_quebrado()
+        self._pendentes.append((chave, especificacao, futuro, mostrar))
+
+    def _pool_quebrado(self):
+        # Um processo do pool morreu (falta de memória, falha em uma biblioteca nativa) e o pool não aceita mais
+        # pedidos: o restante desta execução é renderizado no próprio processo e o pool compartilhado é
+        # descartado, para ser recriado na próxima execução
+        if self._pool is None:
+            return
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        if self._ao_quebrar is not None:
+            self._ao_quebrar()
+
+    def _resultado(self, futuro, especificacao):
+        if futuro is not None:
+            try:
+                return futuro.result()
+            except BrokenProcessPool:
+                self._pool_quebrado()
+        return renderizar(especificacao)
+
+    def concluir(self):
+        try:
+            with self._travas:
+                for chave, especificacao, futuro, mostrar in self._pendentes:
+                    conteudo = self._resultado(futuro, especificacao)
+                    self._cache.gravar(chave, conteudo)
+                    mostrar(conteudo)
+        finally:
+            self._pendentes = []
+            self._travas = contextlib.ExitStack()
+
+    def descartar(self):
+        # Página interrompida: cancela os gráficos que ainda não começaram e libera as travas das chaves, senão a
+        # próxima execução que pedir o mesmo gráfico esperaria para sempre pela trava
+        for _, _, futuro, _ in self._pendentes:
+            if futuro is not None:
+                futuro.cancel()
+        self._pendentes = []
+        self._travas.close()
+        self._travas = contextlib.ExitStack()
+
+    @contextlib.contextmanager
+    def execucao(self):
+        # Execução da página: conclui os gráficos pendentes no fim ou, se a página parar no meio (erro, st.stop ou
+        # nova execução pedida por um widget), descarta-os
+        try:
+            yield self
+        except BaseException:
+            self.descartar()
+            raise
+        self.concluir()
+
+
+def verificar_travas(diretorio, espera=10):
+    # Verificação de regressão: uma página interrompida depois de pedir um gráfico não pode deixar a trava
+    # da chave presa; a execução seguinte precisa conseguir gerar o mesmo gráfico
+    import threading
+
+    import cache_disco
+
+    cache = cache_disco.CacheArtefatos(diretorio)
+    gerar = lambda graficos: ('png', (), {})  # noqa: E731
+    try:
+        with Agendador(cache, None).execucao() as agendador:
+            agendador.agendar('verificacao', {'grafico': 'travas'}, gerar, lambda png: None)
+            raise RuntimeError('página interrompida')
+    except RuntimeError:
+        pass
+
+    agendado = threading.Event()
+    threading.Thread(target=lambda: (Agendador(cache, None).agendar('verificacao', {'grafico': 'travas'}, gerar, lambda png: None),
+                                     agendado.set()), daemon=True).start()
+    return agendado.wait(espera)
+
+
+def verificar_pool(diretorio):
+    # Verificação de regressão: com o processo do pool morto, os gráficos da execução são renderizados no
+    # próprio processo e o pool é descartado (ao_quebrar), em vez de falhar em toda execução seguinte
+    import signal
+
+    import cache_disco
+    import pandas as pd
+
+    pool = criar_pool(1)
+    for processo in list(pool._processes.values()):
+        os.kill(processo.pid, signal.SIGKILL)
+    descartados = []
+    exibidos = []
+    por_projeto = pd.DataFrame([[1.0, 2.0, 3.0]], index=pd.Index(['A'], name='PROJETO'), columns=pd.Index([1, 2, 3], name='Ano'))
+    with Agendador(cache_disco.CacheArtefatos(diretorio), pool, lambda: descartados.append(True)).execucao() as agendador:
+        for titulo in ('primeiro', 'segundo'):
+            agendador.agendar('verificacao', {'grafico': titulo}, lambda graficos, titulo=titulo: graficos.projecao_carbono(por_projeto, titulo), exibidos.append)
+    return descartados == [True] and len(exibidos) == 2 and all(png.startswith(b'\x89PNG') for png in exibidos)
+
+
+if __name__ == '__main__':
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description='Renderização dos gráficos em paralelo')
+    parser.add_argument('--verificar-travas', action='store_true', help='Verifica que uma página interrompida libera as travas dos gráficos')
+    parser.add_argument('--verificar-pool', action='store_true', help='Verifica que um pool com um processo morto é descartado')
+    args = parser.parse_args()
+
+    if args.verificar_travas:
+        with tempfile.TemporaryDirectory() as diretorio:
+            if not verificar_travas(diretorio):
+                parser.exit(1, 'trava de gráfico não liberada após a interrupção da página\n')
+        print('travas liberadas após a interrupção da página')
+
+    if args.verificar_pool:
+        # Pelo módulo importado: o pool (spawn) precisa encontrar _iniciar em renderizacao, não em __main__
+        import renderizacao
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            if not renderizacao.verificar_pool(diretorio):
+                parser.exit(1, 'pool de gráficos quebrado não foi descartado\n')
+        print('pool quebrado descartado e gráficos renderizados no processo do app')
@@ -0,0 +1,118 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+import dados
+
+
+# Valores de referência por muda (R$): valor de uma muda replantada que sobrevive e custo de produzir e plantar
+# uma muda. A página Replantio permite ajustá-los por projeto.
+VALOR_MUDA_VIVA = 10.0
+CUSTO_MUDA = 3.0
+
+# Colunas do controle de plantio levadas para o plano
+COLUNAS_PLANO = ['DIVISÃO', 'PROJETO', 'DESCRIÇÃO DO PRF', 'QDE de Mudas (UND)', 'Taxa de Mortalidade', 'Mortalidade (Qtd.)']
+
+
+def demanda(data):
+    # Mudas para repor as mortas de cada PRF: as replantadas morrem à mesma taxa, então mortas / (1 - taxa).
+    # PRFs em que nenhuma muda sobrevive não têm demanda.
+    taxa = data['Taxa de Mortalidade'].to_numpy(dtype=float)
+    mortas = np.nan_to_num(data['Mortalidade (Qtd.)'].to_numpy(dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(taxa < 1, np.ceil(mortas / (1 - taxa)), 0.0)
+
+
+def priorizar(data, valor=VALOR_MUDA_VIVA, custo=CUSTO_MUDA):
+    # Ordem do replantio em todos os PRFs de uma vez. O estoque é contado em mudas e cada muda rende
+    # valor x sobrevivência - custo no PRF, então a mochila (fracionária) é resolvida exatamente pelo guloso:
+    # PRFs com ganho positivo em ordem decrescente de ganho por muda (empates na ordem do arquivo).
+    # valor e custo são um número para todos ou um vetor com um elemento por PRF. Os acumulados são a fronteira
+    # de todos os estoques possíveis; alocar um estoque é só uma busca nesses vetores.
+    valor = np.broadcast_to(np.asarray(valor, dtype=float), len(data))
+    custo = np.broadcast_to(np.asarray(custo, dtype=float), len(data))
+    sobrevivencia = 1 - data['Taxa de Mortalidade'].to_numpy(dtype=float)
+    ganho = valor * sobrevivencia - custo
+    mudas = demanda(data)
+    mortas = np.nan_to_num(data['Mortalidade (Qtd.)'].to_numpy(dtype=float))
+
+    candidatos = np.flatnonzero((ganho > 0) & (mudas > 0))
+    ordem = candidatos[np.argsort(-ganho[candidatos], kind='stable')]
+    return {
+        'linhas': ordem,
+        'mudas': mudas[ordem],
+        'ganho': ganho[ordem],
+        'sobrevivencia': sobrevivencia[ordem],
+        'mortas_prf': mortas[ordem],
+        'mudas_acumuladas': np.cumsum(mudas[ordem]),
+        'vivas_acumuladas': np.cumsum(recuperadas(mudas[ordem], sobrevivencia[ordem], mortas[ordem])),
+        'ganho_acumulado': np.cumsum(mudas[ordem] * ganho[ordem]),
+        'mortas': float(mortas.sum()),
+    }
+
+
+def recuperadas(alocadas, sobrevivencia, mortas):
+    # Mudas vivas que o replantio devolve ao PRF; o arredondamento da demanda para mudas inteiras
+    # não conta acima das mortas
+    return np.minimum(alocadas * sobrevivencia, mortas)
+
+
+def alocar(prioridade, estoque):
+    # Mudas de cada PRF priorizado: os primeiros recebem a demanda inteira e o PRF em que o estoque acaba
+    # recebe o que sobrou (busca binária no acumulado, sem reordenar nada). Com estoque e demandas inteiros,
+    # a solução fracionária já é inteira e, portanto, ótima também para a mochila inteira.
+    acumulado = prioridade['mudas_acumuladas']
+    completos = int(np.searchsorted(acumulado, estoque, side='right'))
+    alocadas = np.zeros(len(acumulado))
+    alocadas[:completos] = prioridade['mudas'][:completos]
+    if completos < len(acumulado):
+        alocadas[completos] = estoque - (acumulado[completos - 1] if completos else 0)
+    return alocadas
+
+
+def plano(data, prioridade, alocadas):
+    # PRFs que recebem mudas, na ordem de prioridade, com as mudas vivas recuperadas e a cobertura das mortas
+    atendidos = alocadas > 0
+    linhas = prioridade['linhas'][atendidos]
+    tabela = data.iloc[linhas][COLUNAS_PLANO].reset_index(drop=True)
+    tabela['Mudas a Replantar'] = prioridade['mudas'][atendidos]
+    tabela['Mudas Alocadas'] = alocadas[atendidos]
+    tabela['Mudas Vivas Recuperadas'] = recuperadas(alocadas[atendidos], prioridade['sobrevivencia'][atendidos], prioridade['mortas_prf'][atendidos])
+    tabela['Cobertura'] = tabela['Mudas Vivas Recuperadas'] / tabela['Mortalidade (Qtd.)']
+    tabela['Ganho Líquido (R$)'] = alocadas[atendidos] * prioridade['ganho'][atendidos]
+    return tabela
+
+
+def por_projeto(data, tabela):
+    # Mortas, mudas alocadas e cobertura por projeto, incluindo os projetos sem nenhuma muda no plano
+    mortas = data.groupby(['DIVISÃO', 'PROJETO'], sort=False)['Mortalidade (Qtd.)'].sum()
+    alocado = tabela.groupby(['DIVISÃO', 'PROJETO'], sort=False)[['Mudas Alocadas', 'Mudas Vivas Recuperadas', 'Ganho Líquido (R$)']].sum()
+    projetos = pd.concat([mortas, alocado], axis=1).fillna(0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        projetos['Cobertura'] = (projetos['Mudas Vivas Recuperadas'] / projetos['Mortalidade (Qtd.)']).fillna(0.0)
+    return projetos
+
+
+def fronteira(prioridade):
+    # Cobertura das mortas e ganho líquido para cada estoque: os acumulados nos pontos em que um PRF é completado
+    # (a curva é linear entre eles)
+    return pd.DataFrame({
+        'Cobertura (%)': np.concatenate([[0.0], prioridade['vivas_acumuladas']]) / (prioridade['mortas'] or 1) * 100,
+        'Ganho Líquido (R$)': np.concatenate([[0.0], prioridade['ganho_acumulado']]),
+    }, index=pd.Index(np.concatenate([[0.0], prioridade['mudas_acumuladas']]), name='Estoque de Mudas'))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Plano de replantio para um estoque de mudas')
+    parser.add_argument('estoque', type=int, help='Mudas disponíveis para o replantio')
+    parser.add_argument('--valor', type=float, default=VALOR_MUDA_VIVA, help='Valor de uma muda replantada que sobrevive (R$)')
+    parser.add_argument('--custo', type=float, default=CUSTO_MUDA, help='Custo de produzir e plantar uma muda (R$)')
+    args = parser.parse_args()
+
+    data = dados.read_plantio()
+    prioridade = priorizar(data, args.valor, args.custo)
+    tabela = plano(data, prioridade, alocar(prioridade, args.estoque))
+    print(tabela.to_string())
+    print(f"\n{tabela['Mudas Alocadas'].sum():,.0f} mudas em {len(tabela)} PRFs; "
+          f"cobertura das mortas: {tabela['Mudas Vivas Recuperadas'].sum() / prioridade['mortas']:.1%}")
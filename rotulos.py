@@ -0,0 +1,82 @@
+import pandas as pd
+
+
+# Quebras de linha manuais dos nomes longos de PRF nos gráficos da Home
+QUEBRAS_HOME = {
+    "CE - RVE": "CE\n- RVE",
+    "ASV COMPLEMENTAR - RDV": "ASV\nCOMPLEMENTAR\n- RDV",
+    "BAY DE CONEXÃO - RDV": "BAY\nDE CONEXÃO\n- RDV",
+    "CO SE - RVE": "CO SE\n- RVE",
+    "CO SJ23 - RDV": "CO\nSJ23\n- RDV",
+    "LT - RDV": "LT\n- RDV",
+    "LT - RVE": "LT\n- RVE",
+    "RMT SJ23 - RDV": "RMT\nSJ23\n- RDV",
+    "PARQUE EÓLICO SJ23 - RDV": "PARQUE\nEÓLICO\nSJ23\n- RDV",
+    "UMARI - LT - BLOCO NORTE/SUL": "UMARI\n- LT - BLOCO\nNORTE/SUL",
+    "UMARI - CE - BLOCO SUL": "UMARI\n- CE - BLOCO\nSUL",
+    "UMARI - CE - BLOCO NORTE": "UMARI\n- CE - BLOCO\nNORTE",
+    "UMARI - ASV COMPLEMENTAR - BLOCO NORTE": "UMARI\n- ASV COMPLEM.\nBLOCO NORTE",
+    "UMARI - CO CIVIL - BLOCO NORTE": "UMARI\n- CO CIVIL\nBLOCO NORTE",
+    "REASSENTAMENTO - RVE": "REASSENT.\n- RVE",
+    "SE - RVE": "SE\n- RVE",
+    "SONDAGEM DA LT - RDV": "SONDAGEM\nDA LT\n- RDV",
+    "CANTEIRO DE OBRAS CIVIL - RVE": "CANTEIRO\nDE OBRAS\nCIVIL - RVE",
+    "SONDAGEM LT PARTE 1 - RVE": "SONDAGEM\nLT PARTE 1\n- RVE",
+    "SONDAGEM LT PARTE 2 - RVE": "SONDAGEM\nLT PARTE 2\n- RVE",
+}
+
+# Quebras de linha dos gráficos da página ASSETco (nomes com '/' são quebrados na barra)
+QUEBRAS_ASSETCO = {
+    "CE - RVE": "CE\n- RVE",
+    "ASV COMPLEMENTAR - RDV": "ASV\nCOMPLEMENTAR\n- RDV",
+    "BAY DE CONEXÃO - RDV": "BAY\n DE\nCONEXÃO\n- RDV",
+    "CO SE - RVE": "CO SE\n- RVE",
+    "CO SJ23 - RDV": "CO\nSJ23\n- RDV",
+    "LT - RDV": "LT\n- RDV",
+    "LT - RVE": "LT\n- RVE",
+    "RMT SJ23 - RDV": "RMT\nSJ23\n- RDV",
+    "PARQUE EÓLICO SJ23 - RDV": "PARQUE\nEÓLICO\nSJ23\n- RDV",
+    "CE - RDV": "CE\n- RDV",
+    "UMARI - CE - BLOCO SUL": "UMARI\n- CE\n - BLOCO\nSUL",
+    "UMARI - CE - BLOCO NORTE": "UMARI\n- CE\n - BLOCO\nNORTE",
+    "UMARI - ASV COMPLEMENTAR - BLOCO NORTE": "UMARI\n- ASV \nCOMPLEM.\nBLOCO \nNORTE",
+    "UMARI - CO CIVIL - BLOCO NORTE": "UMARI\n- CO \nCIVIL\nBLOCO \nNORTE",
+    "REASSENTAMENTO - RVE": "REASSENT.\n- RVE",
+    "SE - RVE": "SE\n- RVE",
+    "SONDAGEM DA LT - RDV": "SONDAGEM\nDA LT\n- RDV",
+    "CANTEIRO DE OBRAS CIVIL - RVE": "CANTEIRO\nDE \nOBRAS\nCIVIL - \nRVE",
+    "SONDAGEM LT PARTE 1 - RVE": "SONDAGEM\nLT PARTE 1\n- RVE",
+    "SONDAGEM LT PARTE 2 - RVE": "SONDAGEM\nLT PARTE 2\n- RVE",
+}
+
+
+def home(nome):
+    # Remover espaços extras; códigos de PRF (VA84103, VA84113, etc.) não precisam de ajustes
+    nome = nome.strip()
+    return QUEBRAS_HOME.get(nome, nome)
+
+
+def assetco(nome):
+    # Verifica se o nome pode ser dividido por '/'
+    if '/' in nome:
+        return '\n'.join(nome.split('/'))
+    return QUEBRAS_ASSETCO.get(nome, nome)
+
+
+def quebra_em_15(label):
+    # Quebra de linha para descrições com mais de 15 caracteres
+    return f'{label[:15]}\n{label[15:]}' if len(label) > 15 else label
+
+
+# Layouts de rótulo usados pelos gráficos, pelo nome
+LAYOUTS = {
+    'home': home,
+    'assetco': assetco,
+    'quebra_em_15': quebra_em_15,
+}
+
+
+def tabela(data):
+    # Rótulo de cada PRF em cada layout, indexado pela DESCRIÇÃO DO PRF
+    nomes = pd.unique(data['DESCRIÇÃO DO PRF'])
+    return pd.DataFrame({layout: [quebra(nome) for nome in nomes] for layout, quebra in LAYOUTS.items()}, index=pd.Index(nomes, name='DESCRIÇÃO DO PRF'))
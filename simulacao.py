@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+import dados
+
+
+# Distribuições disponíveis para a taxa de mortalidade de cada PRF em cada simulação
+DISTRIBUICOES = ('Beta', 'Triangular', 'Uniforme')
+
+# Desvio padrão padrão da taxa de mortalidade entre PRFs (em fração, 3 pontos percentuais)
+DESVIO_PADRAO = 0.03
+
+# Número padrão de simulações e tamanho do bloco processado de cada vez (limita a memória a PRFs x bloco)
+SIMULACOES = 5000
+BLOCO_SIMULACOES = 1000
+
+
+def taxas_mortalidade(rng, prfs, simulacoes, distribuicao='Beta', media=dados.TAXA_MORTALIDADE, desvio=DESVIO_PADRAO):
+    # Matriz PRFs x simulações de taxas de mortalidade com a média e o desvio padrão pedidos
+    forma = (prfs, simulacoes)
+    if desvio <= 0:
+        return np.full(forma, media)
+
+    if distribuicao == 'Beta':
+        # Parâmetros da Beta a partir da média e da variância (limitada ao máximo possível para a média);
+        # com média 0 ou 1 a variância máxima é zero e a taxa é a própria média
+        variancia = min(desvio ** 2, media * (1 - media) * 0.99)
+        if variancia <= 0:
+            return np.full(forma, media)
+        concentracao = media * (1 - media) / variancia - 1
+        return rng.beta(media * concentracao, (1 - media) * concentracao, forma)
+    if distribuicao == 'Triangular':
+        # Triangular simétrica: desvio = meia largura / sqrt(6)
+        largura = desvio * np.sqrt(6)
+        return np.clip(rng.triangular(media - largura, media, media + largura, forma), 0, 1)
+    if distribuicao == 'Uniforme':
+        # Uniforme: desvio = meia largura / sqrt(3)
+        largura = desvio * np.sqrt(3)
+        return np.clip(rng.uniform(media - largura, media + largura, forma), 0, 1)
+    raise ValueError(f'Distribuição desconhecida: {distribuicao}')
+
+
+def simular(mudas, grupos, distribuicao='Beta', media=dados.TAXA_MORTALIDADE, desvio=DESVIO_PADRAO,
+            simulacoes=SIMULACOES, semente=0, bloco=BLOCO_SIMULACOES):
+    # Simula mudas mortas e mudas a replantar por PRF e soma por grupo em cada simulação.
+    # Devolve duas matrizes grupos x simulações (mortas, replantio) e os rótulos dos grupos.
+    rng = np.random.default_rng(semente)
+    mudas = np.round(np.nan_to_num(np.asarray(mudas, dtype=float))).astype(np.int64)
+    soma_grupos, rotulos = _matriz_grupos(grupos)
+
+    mortas = np.empty((len(rotulos), simulacoes))
+    replantio = np.empty((len(rotulos), simulacoes))
+    for inicio in range(0, simulacoes, bloco):
+        tamanho = min(bloco, simulacoes - inicio)
+        taxas = taxas_mortalidade(rng, len(mudas), tamanho, distribuicao, media, desvio)
+        mortas_prf = rng.binomial(mudas[:, None], taxas)
+
+        # As mudas replantadas também morrem à mesma taxa: para repor m mortas são necessárias m / (1 - taxa)
+        replantio_prf = np.ceil(mortas_prf / np.clip(1 - taxas, 1e-6, None))
+
+        mortas[:, inicio:inicio + tamanho] = soma_grupos @ mortas_prf
+        replantio[:, inicio:inicio + tamanho] = soma_grupos @ replantio_prf
+
+    return mortas, replantio, rotulos
+
+
+def _matriz_grupos(grupos):
+    # Matriz grupos x itens que soma os itens de cada grupo em uma multiplicação
+    codigos, rotulos = pd.factorize(pd.Series(grupos), sort=False)
+    soma = np.zeros((len(rotulos), len(codigos)))
+    soma[codigos, np.arange(len(codigos))] = 1
+    return soma, list(rotulos)
+
+
+def faixas(mortas, replantio, rotulos, nivel=0.90, mortalidade=None):
+    # Faixas de confiança (percentis centrais) e mediana de cada grupo
+    inferior, superior = (1 - nivel) / 2 * 100, (1 + nivel) / 2 * 100
+    percentis = [inferior, 50, superior]
+    m = np.percentile(mortas, percentis, axis=1)
+    r = np.percentile(replantio, percentis, axis=1)
+
+    resumo = pd.DataFrame({
+        'Mortalidade (Inferior)': m[0], 'Mortalidade (Mediana)': m[1], 'Mortalidade (Superior)': m[2],
+        'Replantio (Inferior)': r[0], 'Replantio (Mediana)': r[1], 'Replantio (Superior)': r[2],
+    }, index=pd.Index(rotulos))
+    if mortalidade is not None:
+        # Mortalidade do controle de plantio (taxas observadas nas vistorias), para comparação com a simulação
+        resumo.insert(0, 'Mortalidade (Atual)', mortalidade.reindex(resumo.index).to_numpy())
+    return resumo
+
+
+def projecao(data, distribuicao='Beta', media=dados.TAXA_MORTALIDADE, desvio=DESVIO_PADRAO,
+             simulacoes=SIMULACOES, nivel=0.90, semente=0):
+    # Faixas por divisão e por projeto; os totais por divisão vêm das mesmas simulações dos projetos
+    mudas = data['QDE de Mudas (UND)']
+    mortas, replantio, rotulos = simular(mudas, data['PROJETO'], distribuicao, media, desvio, simulacoes, semente)
+
+    divisao_projeto = data.drop_duplicates('PROJETO').set_index('PROJETO')['DIVISÃO'].reindex(rotulos)
+    soma_divisoes, divisoes = _matriz_grupos(divisao_projeto.to_numpy())
+    mortas_div, replantio_div = soma_divisoes @ mortas, soma_divisoes @ replantio
+
+    return {
+        'divisoes': faixas(mortas_div, replantio_div, divisoes, nivel, data.groupby('DIVISÃO')['Mortalidade (Qtd.)'].sum()),
+        'projetos': faixas(mortas, replantio, rotulos, nivel, data.groupby('PROJETO')['Mortalidade (Qtd.)'].sum()),
+    }
+
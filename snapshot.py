@@ -0,0 +1,174 @@
+import argparse
+import json
+import os
+import struct
+import time
+
+import pandas as pd
+
+import dados
+import densidade
+import rotulos
+
+
+# Arquivo de snapshot gerado no build e lido pelo app na inicialização
+CAMINHO_SNAPSHOT = 'plantio.snapshot'
+
+# Versão do formato do arquivo: snapshots de outro formato são ignorados
+FORMATO = 1
+
+# Cabeçalho: assinatura, versão do formato e tamanho do JSON com o índice das tabelas
+ASSINATURA = b'PLANTSNP'
+_CABECALHO = struct.Struct('<8sII')
+
+# Cada tabela começa em um deslocamento múltiplo de 64 bytes (alinhamento do Arrow)
+ALINHAMENTO = 64
+
+
+def caminho_snapshot():
+    return os.environ.get('PLANTIO_SNAPSHOT', CAMINHO_SNAPSHOT)
+
+
+def assinatura_codigo():
+    # Mudanças no código que gera os dados, os agregados ou os rótulos invalidam o snapshot
+    import cache_disco
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    return cache_disco.assinatura_codigo(*(os.path.join(diretorio, nome) for nome in ('dados.py', 'densidade.py', 'rotulos.py', 'snapshot.py', 'vistorias.py')))
+
+
+def _agregados(data):
+    # Dados e agregados exibidos nas páginas, pelo nome usado no app
+    return {
+        'dados': data,
+        'divisoes': dados.division_summary(data),
+        'contagem_divisoes': data['DIVISÃO'].value_counts(),
+        'uso_do_solo': dados.land_use(data),
+        'aproveitamento': dados.aproveitamento_counts(data),
+        'projetos': dados.project_summary(data),
+        'densidade': densidade.analisar(data),
+    }
+
+
+def tabelas(data):
+    # Agregados de todas as divisões e de cada divisão (nome/DIVISÃO), rótulos e tabelas de PRFs por projeto
+    resultado = _agregados(data)
+    for divisao in pd.unique(data['DIVISÃO']):
+        for nome, tabela in _agregados(data[data['DIVISÃO'] == divisao]).items():
+            resultado[f'{nome}/{divisao}'] = tabela
+    resultado['rotulos'] = rotulos.tabela(data)
+    for projeto in dados.projetos(data):
+        resultado[f'prf/{projeto}'] = dados.tabela_prf(data, projeto)
+    return resultado
+
+
+def _ipc(frame):
+    # Tabela serializada no formato de arquivo do Arrow (IPC), sem compressão, para ser lida direto do mapa de memória
+    import pyarrow as pa
+
+    tabela = pa.Table.from_pandas(frame, preserve_index=True)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, tabela.schema) as writer:
+        writer.write_table(tabela)
+    return sink.getvalue().to_pybytes()
+
+
+def gerar(file_path=None, destino=None):
+    # Build: lê o CSV uma vez e grava o snapshot com todas as tabelas, de forma atômica
+    file_path = file_path or dados.caminho_csv()
+    destino = destino or caminho_snapshot()
+    data = dados.read_plantio(file_path)
+
+    blocos, indice, deslocamento = [], {}, 0
+    for nome, tabela in tabelas(data).items():
+        serie = not hasattr(tabela, 'columns')
+        conteudo = _ipc(tabela.to_frame() if serie else tabela)
+        preenchimento = -len(conteudo) % ALINHAMENTO
+        indice[nome] = {'inicio': deslocamento, 'tamanho': len(conteudo), 'serie': serie}
+        blocos.append(conteudo + b'\0' * preenchimento)
+        deslocamento += len(conteudo) + preenchimento
+
+    cabecalho = json.dumps({
+        'versao': dados.versao_plantio(file_path),
+        'codigo': assinatura_codigo(),
+        'gerado_em': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'tabelas': indice,
+    }).encode('utf-8')
+    inicio_dados = _CABECALHO.size + len(cabecalho)
+    inicio_dados += -inicio_dados % ALINHAMENTO
+
+    temporario = f'{destino}.tmp-{os.getpid()}'
+    with open(temporario, 'wb') as f:
+        f.write(_CABECALHO.pack(ASSINATURA, FORMATO, len(cabecalho)))
+        f.write(cabecalho)
+        f.write(b'\0' * (inicio_dados - _CABECALHO.size - len(cabecalho)))
+        for bloco in blocos:
+            f.write(bloco)
+    os.replace(temporario, destino)
+    return destino, len(indice)
+
+
+class Snapshot:
+    # Snapshot mapeado em memória: as tabelas são lidas do mapa sem cópia e convertidas
+    # para pandas a cada acesso, então quem recebe uma tabela pode alterá-la à vontade
+
+    def __init__(self, mapa, cabecalho, inicio_dados):
+        self._mapa = mapa
+        self._indice = cabecalho['tabelas']
+        self._inicio = inicio_dados
+        self._tabelas = {}
+        self.versao = cabecalho['versao']
+        self.gerado_em = cabecalho['gerado_em']
+
+    def __contains__(self, nome):
+        return nome in self._indice
+
+    def arrow(self, nome):
+        import pyarrow as pa
+
+        if nome not in self._tabelas:
+            item = self._indice[nome]
+            buffer = self._mapa.slice(self._inicio + item['inicio'], item['tamanho'])
+            self._tabelas[nome] = pa.ipc.open_file(buffer).read_all()
+        return self._tabelas[nome]
+
+    def tabela(self, nome):
+        frame = self.arrow(nome).to_pandas()
+        return frame.iloc[:, 0] if self._indice[nome]['serie'] else frame
+
+
+def carregar(versao, caminho=None):
+    # Snapshot válido para a versão atual do CSV e para o código atual; None quando não existe ou está desatualizado
+    import pyarrow as pa
+
+    caminho = caminho or caminho_snapshot()
+    if not os.path.exists(caminho):
+        return None
+
+    mapa = pa.memory_map(caminho, 'r').read_buffer()
+    if mapa.size < _CABECALHO.size:
+        return None
+    assinatura, formato, tamanho = _CABECALHO.unpack(mapa.slice(0, _CABECALHO.size).to_pybytes())
+    if assinatura != ASSINATURA or formato != FORMATO:
+        return None
+
+    try:
+        cabecalho = json.loads(mapa.slice(_CABECALHO.size, tamanho).to_pybytes())
+    except ValueError:
+        return None
+    if cabecalho.get('versao') != versao or cabecalho.get('codigo') != assinatura_codigo():
+        return None
+
+    inicio_dados = _CABECALHO.size + tamanho
+    inicio_dados += -inicio_dados % ALINHAMENTO
+    return Snapshot(mapa, cabecalho, inicio_dados)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Gera o snapshot pré-calculado do dashboard a partir do CSV')
+    parser.add_argument('--csv', help='Arquivo CSV (padrão: PLANTIO_CSV ou o arquivo do repositório)')
+    parser.add_argument('--destino', help='Arquivo de snapshot (padrão: PLANTIO_SNAPSHOT ou plantio.snapshot)')
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    destino, quantidade = gerar(args.csv, args.destino)
+    print(f'Snapshot {destino} com {quantidade} tabelas ({os.path.getsize(destino) / 1024:.0f} KB, {time.perf_counter() - inicio:.2f}s)')
@@ -0,0 +1,80 @@
+import matplotlib
+matplotlib.use('Agg')
+
+from matplotlib.font_manager import FontProperties, findfont
+
+
+# Fonte usada em todos os gráficos do dashboard
+FONTE = 'DejaVu Sans'
+
+# ------------------ Paleta ------------------
+
+# Cores nomeadas usadas nos gráficos; as páginas referenciam as cores pelo nome
+PALETA = {
+    'titulo': '#1C4E80',
+    'eixo': '#4D4D4D',
+    'area_plantada': '#6AB187',
+    'area_sem_plantio': '#D8AE58',
+    'mortalidade': '#EA6A47',
+    'plantio_ha': '#1F3F49',
+    'mudas': '#6AB187',
+    'mortalidade_qtd': '#488A99',
+    'percentual': 'gray',
+}
+
+# Sequências de cores para gráficos com várias categorias
+CORES = {
+    'aproveitamento': ['#8FD3A9', '#B1D7B0', '#74B781', '#74B7E0', '#2F5263', '#5B94C4'],
+    'divisao': ['#8AB8A8', '#476B8A'],
+    'mortas': ['#EA6A47', '#DBAE58'],
+    # DEVco com #488A99 (azul), ASSETco com #6AB187 (verde)
+    'uso_do_solo': {'ASSETco': '#6AB187', 'DEVco': '#488A99'},
+    # Projetos empilhados na projeção de CO₂
+    'carbono': ['#1F3F49', '#488A99', '#6AB187', '#B1D7B0', '#DBAE58', '#EA6A47'],
+}
+
+# ------------------ Estilo ------------------
+
+# Folha de estilo aplicada uma única vez, quando o tema é importado
+ESTILO = {
+    'font.family': FONTE,
+    'axes.titlecolor': PALETA['titulo'],
+    'axes.labelcolor': PALETA['titulo'],
+    'xtick.labelcolor': PALETA['eixo'],
+    'ytick.color': PALETA['eixo'],
+    'legend.labelcolor': PALETA['titulo'],
+    'figure.max_open_warning': 0,
+}
+matplotlib.rcParams.update(ESTILO)
+
+# Propriedades de fonte compartilhadas: cada combinação é resolvida uma única vez
+FONTES = {
+    'titulo': FontProperties(family=FONTE, size=18),
+    'titulo_secao': FontProperties(family=FONTE, size=16),
+    'titulo_legenda': FontProperties(family=FONTE, size=12),
+    'rotulo': FontProperties(family=FONTE, size=12),
+    'legenda': FontProperties(family=FONTE, size=10),
+    'destaque': FontProperties(family=FONTE, size=12, weight='bold'),
+    'total': FontProperties(family=FONTE, size=27),
+}
+findfont(FONTES['rotulo'])
+
+
+def fonte(size, weight='normal'):
+    # Propriedades de fonte para tamanhos sem entrada nomeada, também compartilhadas
+    chave = (size, weight)
+    if chave not in _fontes_por_tamanho:
+        _fontes_por_tamanho[chave] = FontProperties(family=FONTE, size=size, weight=weight)
+    return _fontes_por_tamanho[chave]
+
+
+_fontes_por_tamanho = {}
+
+
+def estilizar(fig, spines=('left',)):
+    # Bordas dos eixos em cinza escuro, aplicadas uma vez para todos os eixos da figura
+    for ax in fig.axes:
+        for spine in spines:
+            ax.spines[spine].set_color(PALETA['eixo'])
+            ax.spines[spine].set_linewidth(1.5)
+    return fig
@@ -0,0 +1,173 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+import dados
+
+
+# Colunas do arquivo de vistorias (dados.CAMINHO_VISTORIAS): uma linha por contagem de mudas vivas de um PRF em uma data
+COLUNAS_VISTORIAS = ['DESCRIÇÃO DO PRF', 'DATA', 'MUDAS VIVAS']
+
+# Colunas do controle de plantio levadas para cada vistoria
+COLUNAS_PRF = ['DIVISÃO', 'PROJETO', 'DESCRIÇÃO DO PRF', 'QDE de Mudas (UND)']
+
+
+def limpar(vistorias):
+    # Tipos e nomes como no controle de plantio; contagens sem data ou sem número são descartadas
+    vistorias = vistorias[COLUNAS_VISTORIAS].copy()
+    vistorias['DESCRIÇÃO DO PRF'] = vistorias['DESCRIÇÃO DO PRF'].astype(str).str.strip()
+    # Datas ISO (arquivo consolidado) ou dd/mm/aaaa (planilhas das equipes)
+    datas = pd.to_datetime(vistorias['DATA'], format='ISO8601', errors='coerce')
+    faltantes = datas.isna()
+    if faltantes.any():
+        datas[faltantes] = pd.to_datetime(vistorias.loc[faltantes, 'DATA'], format='%d/%m/%Y', errors='coerce')
+    vistorias['DATA'] = datas
+    vistorias['MUDAS VIVAS'] = pd.to_numeric(vistorias['MUDAS VIVAS'], errors='coerce')
+    vistorias = vistorias.dropna(subset=['DATA', 'MUDAS VIVAS'])
+
+    # Uma contagem por PRF e data (a última informada), em ordem de PRF e data
+    vistorias = vistorias.drop_duplicates(['DESCRIÇÃO DO PRF', 'DATA'], keep='last')
+    return vistorias.sort_values(['DESCRIÇÃO DO PRF', 'DATA'], kind='stable').reset_index(drop=True)
+
+
+# Vistorias já lidas, pela versão do arquivo (só a mais recente fica em memória)
+_lidas = {}
+
+
+def ler_vistorias(file_path=None):
+    # None quando não há arquivo de vistorias
+    file_path = file_path or dados.caminho_vistorias()
+    if not os.path.exists(file_path):
+        return None
+    versao = dados.versao_dados(file_path)
+    if versao not in _lidas:
+        _lidas.clear()
+        _lidas[versao] = limpar(pd.read_csv(file_path))
+    return _lidas[versao]
+
+
+def acompanhar(data, vistorias):
+    # Uma linha por vistoria de PRF do controle de plantio, em ordem de PRF e data. As mudas em risco são as
+    # vivas na contagem anterior (na primeira, a QDE de Mudas plantada); as mortas, a queda desde então (um
+    # aumento, como um replantio, não conta como morte). A sobrevivência do PRF é o produto acumulado da
+    # sobrevivência de cada intervalo, calculado em todos os PRFs de uma vez.
+    plantio = data[COLUNAS_PRF].drop_duplicates('DESCRIÇÃO DO PRF')
+    acompanhamento = vistorias.merge(plantio, on='DESCRIÇÃO DO PRF', how='inner')
+
+    prf = acompanhamento['DESCRIÇÃO DO PRF'].to_numpy()
+    primeira = np.ones(len(prf), dtype=bool)
+    primeira[1:] = prf[1:] != prf[:-1]
+
+    vivas = acompanhamento['MUDAS VIVAS'].to_numpy(dtype=float)
+    em_risco = np.where(primeira, acompanhamento['QDE de Mudas (UND)'].to_numpy(dtype=float), np.roll(vivas, 1))
+    mortas = np.clip(em_risco - vivas, 0, None)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sobrevivencia = np.where(em_risco > 0, 1 - mortas / em_risco, 1.0)
+
+    acompanhamento['Mudas em Risco'] = em_risco
+    acompanhamento['Mudas Mortas'] = mortas
+    acompanhamento['Sobrevivência'] = pd.Series(sobrevivencia).groupby(prf).cumprod().to_numpy()
+    return acompanhamento
+
+
+def mortalidade_prf(acompanhamento):
+    # Situação de cada PRF na última vistoria: a mortalidade observada é 1 - sobrevivência acumulada
+    ultima = acompanhamento.drop_duplicates('DESCRIÇÃO DO PRF', keep='last').set_index('DESCRIÇÃO DO PRF')
+    return pd.DataFrame({
+        'DIVISÃO': ultima['DIVISÃO'],
+        'PROJETO': ultima['PROJETO'],
+        'Vistorias': acompanhamento.groupby('DESCRIÇÃO DO PRF', sort=False).size(),
+        'Última Vistoria': ultima['DATA'],
+        'QDE de Mudas (UND)': ultima['QDE de Mudas (UND)'],
+        'Mudas Vivas': ultima['MUDAS VIVAS'],
+        'Taxa de Mortalidade': 1 - ultima['Sobrevivência'],
+    })
+
+
+def mortalidade_projeto(prfs):
+    # Mortalidade observada por projeto, ponderada pelas mudas plantadas nos PRFs vistoriados
+    prfs = prfs.assign(mortas=prfs['QDE de Mudas (UND)'] * prfs['Taxa de Mortalidade'])
+    projetos = prfs.groupby(['DIVISÃO', 'PROJETO'], sort=False).agg(**{
+        'PRFs Vistoriados': ('Vistorias', 'size'),
+        'Vistorias': ('Vistorias', 'sum'),
+        'QDE de Mudas (UND)': ('QDE de Mudas (UND)', 'sum'),
+        'Mortalidade (Qtd.)': ('mortas', 'sum'),
+    })
+    with np.errstate(divide='ignore', invalid='ignore'):
+        projetos['Taxa de Mortalidade'] = (projetos['Mortalidade (Qtd.)'] / projetos['QDE de Mudas (UND)']).fillna(0.0)
+    return projetos
+
+
+def curvas(acompanhamento):
+    # Curva de sobrevivência de cada projeto por mês das vistorias: mortas e em risco de todos os PRFs do
+    # projeto somados no mês, e o produto acumulado da sobrevivência mensal ao longo dos meses do projeto
+    mes = acompanhamento['DATA'].dt.to_period('M').dt.to_timestamp().rename('Mês')
+    por_mes = acompanhamento.groupby(['DIVISÃO', 'PROJETO', mes]).agg(**{
+        'Vistorias': ('MUDAS VIVAS', 'size'),
+        'Mudas em Risco': ('Mudas em Risco', 'sum'),
+        'Mudas Mortas': ('Mudas Mortas', 'sum'),
+    })
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mensal = (1 - por_mes['Mudas Mortas'] / por_mes['Mudas em Risco']).fillna(1.0)
+    por_mes['Sobrevivência (%)'] = mensal.groupby(level=['DIVISÃO', 'PROJETO']).cumprod() * 100
+    return por_mes.reset_index()
+
+
+def taxas_observadas(data, vistorias):
+    # Taxas observadas por PRF e por projeto (a do projeto ponderada pelas mudas dos PRFs vistoriados);
+    # None quando nenhum PRF de data tem vistoria
+    if vistorias is None or vistorias.empty:
+        return None
+    prfs = mortalidade_prf(acompanhar(data, vistorias))
+    if prfs.empty:
+        return None
+    projetos = mortalidade_projeto(prfs).reset_index().drop_duplicates('PROJETO').set_index('PROJETO')['Taxa de Mortalidade']
+    return {'prfs': prfs['Taxa de Mortalidade'], 'projetos': projetos}
+
+
+def taxas(data, vistorias=None, observadas=None):
+    # Taxa de mortalidade de cada linha do controle de plantio: a observada no PRF; PRFs sem vistoria usam a
+    # do projeto e, projetos sem nenhuma vistoria, a taxa assumida (dados.TAXA_MORTALIDADE). Com observadas
+    # (taxas_observadas do arquivo inteiro), as taxas não dependem de quais PRFs estão em data, como em um bloco.
+    taxa = pd.Series(dados.TAXA_MORTALIDADE, index=data.index, dtype=float)
+    if observadas is None:
+        observadas = taxas_observadas(data, vistorias)
+    if observadas is None:
+        return taxa
+    observada = data['DESCRIÇÃO DO PRF'].map(observadas['prfs']).fillna(data['PROJETO'].map(observadas['projetos']))
+    return observada.fillna(taxa)
+
+
+def importar(arquivos, file_path=None):
+    # Junta arquivos de vistoria enviados pelas equipes ao arquivo consolidado; a contagem mais recente
+    # de um PRF em uma data substitui a anterior. A gravação é atômica.
+    file_path = file_path or dados.caminho_vistorias()
+    partes = [pd.read_csv(file_path)] if os.path.exists(file_path) else []
+    partes += [pd.read_csv(arquivo) for arquivo in arquivos]
+    vistorias = limpar(pd.concat(partes, ignore_index=True))
+
+    temporario = f'{file_path}.tmp-{os.getpid()}'
+    vistorias.assign(DATA=vistorias['DATA'].dt.strftime('%Y-%m-%d')).to_csv(temporario, index=False)
+    os.replace(temporario, file_path)
+    return vistorias
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Vistorias de campo: contagens de mudas vivas por PRF')
+    comandos = parser.add_subparsers(dest='comando', required=True)
+    importar_parser = comandos.add_parser('importar', help='Junta arquivos de vistoria ao arquivo consolidado (PLANTIO_VISTORIAS)')
+    importar_parser.add_argument('csv', nargs='+', help=f"Arquivos CSV com as colunas {', '.join(COLUNAS_VISTORIAS)}")
+    comandos.add_parser('resumo', help='Mortalidade observada por projeto')
+    args = parser.parse_args()
+
+    if args.comando == 'importar':
+        vistorias = importar(args.csv)
+        print(f"{dados.caminho_vistorias()}: {len(vistorias)} vistorias de {vistorias['DESCRIÇÃO DO PRF'].nunique()} PRFs")
+    else:
+        vistorias = ler_vistorias()
+        if vistorias is None:
+            parser.exit(1, f'{dados.caminho_vistorias()} não encontrado\n')
+        prfs = mortalidade_prf(acompanhar(dados.read_plantio(), vistorias))
+        print(mortalidade_projeto(prfs).to_string())